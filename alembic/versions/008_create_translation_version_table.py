@@ -0,0 +1,40 @@
+"""Create translation version table
+
+Revision ID: 008
+Revises: 007
+Create Date: 2025-07-28 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create translation version table for cross-worker cache invalidation."""
+    op.create_table(
+        'translation_versions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('language_code', sa.String(length=10), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='pk_translation_versions'),
+        sa.UniqueConstraint('language_code', 'category', name='uq_translation_version_scope')
+    )
+    
+    # Workers poll MAX(version) and scan versions newer than the last one seen
+    op.create_index('ix_translation_versions_id', 'translation_versions', ['id'], unique=False)
+    op.create_index('ix_translation_versions_version', 'translation_versions', ['version'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop translation version table."""
+    op.drop_index('ix_translation_versions_version', table_name='translation_versions')
+    op.drop_index('ix_translation_versions_id', table_name='translation_versions')
+    op.drop_table('translation_versions')
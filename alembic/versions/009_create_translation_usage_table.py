@@ -0,0 +1,41 @@
+"""Create translation usage table
+
+Revision ID: 009
+Revises: 008
+Create Date: 2025-08-04 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create translation usage table for sampled key hit counters."""
+    op.create_table(
+        'translation_usage',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('language_code', sa.String(length=10), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('hits', sa.BigInteger(), nullable=False),
+        sa.Column('last_hit_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='pk_translation_usage'),
+        sa.UniqueConstraint('key', 'language_code', name='uq_translation_usage_key_language')
+    )
+    
+    # Hot categories are ranked per language by summed hits
+    op.create_index('ix_translation_usage_id', 'translation_usage', ['id'], unique=False)
+    op.create_index('ix_translation_usage_category', 'translation_usage', ['category'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop translation usage table."""
+    op.drop_index('ix_translation_usage_category', table_name='translation_usage')
+    op.drop_index('ix_translation_usage_id', table_name='translation_usage')
+    op.drop_table('translation_usage')
@@ -0,0 +1,45 @@
+"""Create translation tombstone table
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-08-11 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create translation tombstone table for delta sync of deletions."""
+    op.create_table(
+        'translation_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('language_code', sa.String(length=10), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='pk_translation_tombstones'),
+        sa.UniqueConstraint('key', 'language_code', name='uq_translation_tombstone_key_language')
+    )
+    
+    # Clients ask for deletions newer than the version they last synced
+    op.create_index('ix_translation_tombstones_id', 'translation_tombstones', ['id'], unique=False)
+    op.create_index('ix_translation_tombstones_version', 'translation_tombstones', ['version'], unique=False)
+    
+    # Changed translations are found by their update time
+    op.create_index('ix_translations_updated_at', 'translations', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop translation tombstone table."""
+    op.drop_index('ix_translations_updated_at', table_name='translations')
+    op.drop_index('ix_translation_tombstones_version', table_name='translation_tombstones')
+    op.drop_index('ix_translation_tombstones_id', table_name='translation_tombstones')
+    op.drop_table('translation_tombstones')
@@ -0,0 +1,42 @@
+"""Create revoked token table
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-08-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create revoked token table for logout and token revocation."""
+    op.create_table(
+        'revoked_tokens',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('jti', sa.String(length=64), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='fk_revoked_tokens_user_id', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id', name='pk_revoked_tokens')
+    )
+    
+    # Tokens are looked up by jti and purged once expired
+    op.create_index('ix_revoked_tokens_id', 'revoked_tokens', ['id'], unique=False)
+    op.create_index('ix_revoked_tokens_jti', 'revoked_tokens', ['jti'], unique=True)
+    op.create_index('ix_revoked_tokens_expires_at', 'revoked_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop revoked token table."""
+    op.drop_index('ix_revoked_tokens_expires_at', table_name='revoked_tokens')
+    op.drop_index('ix_revoked_tokens_jti', table_name='revoked_tokens')
+    op.drop_index('ix_revoked_tokens_id', table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
@@ -0,0 +1,36 @@
+"""Create translation version counter table
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-09-01 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the single-row counter that hands out translation catalog versions."""
+    op.create_table(
+        'translation_version_counter',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id', name='pk_translation_version_counter')
+    )
+    
+    # Continue from the newest version already stamped
+    op.execute(
+        "INSERT INTO translation_version_counter (id, version) "
+        "SELECT 1, COALESCE(MAX(version), 0) FROM translation_versions"
+    )
+
+
+def downgrade() -> None:
+    """Drop translation version counter table."""
+    op.drop_table('translation_version_counter')
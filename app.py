@@ -1,7 +1,7 @@
 from flask import Flask
 from models import db
 from routes import init_routes
-from utils import init_database
+from utils import init_database, start_timestamp_flusher
 from config.config import AppConfig
 from config.i18n import init_babel
 import os
@@ -84,6 +84,11 @@ def create_app(environment=None, config_file=None):
         # Initialize database with default data
         init_database(app, db)
         
+        # Write buffered last_login timestamps in batches
+        config = app.config.get('APP_CONFIG')
+        flush_interval = config.get('timestamp_flush_interval', 5.0, float) if config else 5.0
+        start_timestamp_flusher(app, db, flush_interval)
+        
         logger.info("Application initialization completed successfully")
         
     except Exception as e:
@@ -1,15 +1,18 @@
 """
 Authentication API endpoints for user registration, login, and logout
 """
+import math
 from datetime import timedelta
-from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, Dict, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.database import get_async_session
-from app.core.middleware import get_current_active_user, security
+from app.core.middleware import get_current_active_user, get_current_admin_user, security
+from app.core.rate_limit import login_limiter
+from app.core.security import PasswordHashingOverloaded, password_hashing
 from app.models.user import User
 from app.schemas.auth import (
     UserRegistrationRequest,
@@ -18,24 +21,52 @@ from app.schemas.auth import (
     UserResponse,
     LogoutResponse,
     ErrorResponse,
-    PasswordChangeRequest
+    PasswordChangeRequest,
+    RefreshTokenRequest
 )
 from app.services.auth_service import AuthService
+from app.services.principal_cache import principal_cache
+from app.services.token_denylist import token_denylist
 
 router = APIRouter()
 settings = get_settings()
 
 
+async def token_response(auth_service: AuthService, user: User, refresh_token: Optional[str] = None) -> TokenResponse:
+    """Build a token response with a new access token and a refresh token."""
+    if refresh_token is None:
+        refresh_token = await auth_service.issue_refresh_token(user)
+        
+    return TokenResponse(
+        access_token=auth_service.create_access_token(user),
+        token_type="bearer",
+        expires_in=settings.access_token_expire_minutes * 60,
+        refresh_token=refresh_token,
+        refresh_expires_in=settings.refresh_token_expire_days * 24 * 60 * 60,
+        user=UserResponse.model_validate(user)
+    )
+
+
+def overloaded_error() -> HTTPException:
+    """Build the 503 returned when the password hashing queue is full."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many password operations in progress, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post(
     "/register",
     response_model=TokenResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Register a new user account",
-    description="Create a new user account with username and password. Returns access token upon successful registration.",
+    description="Create a new user account with username and password. Returns access and refresh tokens upon successful registration.",
     responses={
         201: {"description": "User registered successfully"},
         400: {"model": ErrorResponse, "description": "Invalid input data"},
         409: {"model": ErrorResponse, "description": "Username already exists"},
+        503: {"model": ErrorResponse, "description": "Password hashing is overloaded"},
     }
 )
 async def register(
@@ -70,21 +101,16 @@ async def register(
                 detail="Username already exists"
             )
         
-        # Create access token
-        access_token = auth_service.create_access_token(user)
-        
-        return TokenResponse(
-            access_token=access_token,
-            token_type="bearer",
-            expires_in=settings.access_token_expire_minutes * 60,
-            user=UserResponse.model_validate(user)
-        )
+        # Create access and refresh tokens
+        return await token_response(auth_service, user)
         
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordHashingOverloaded:
+        raise overloaded_error()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -96,22 +122,29 @@ async def register(
     "/login",
     response_model=TokenResponse,
     summary="Authenticate user and get access token",
-    description="Authenticate user with username and password. Returns access token upon successful login.",
+    description="Authenticate user with username and password. Returns access and refresh tokens upon successful login.",
     responses={
         200: {"description": "Login successful"},
         401: {"model": ErrorResponse, "description": "Invalid credentials"},
         400: {"model": ErrorResponse, "description": "Invalid input data"},
+        429: {"model": ErrorResponse, "description": "Too many login attempts"},
+        503: {"model": ErrorResponse, "description": "Password hashing is overloaded"},
     }
 )
 async def login(
     user_data: UserLoginRequest,
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_async_session)]
 ) -> TokenResponse:
     """
     Authenticate user and return access token.
     
+    Attempts are limited per client IP and per username before the
+    password is verified.
+    
     Args:
         user_data: User login credentials (username and password)
+        request: Incoming request, for the client IP
         db: Database session
         
     Returns:
@@ -120,6 +153,14 @@ async def login(
     Raises:
         HTTPException: If authentication fails
     """
+    retry_after = login_limiter.check(request.client.host if request.client else None, user_data.username)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please retry later",
+            headers={"Retry-After": str(math.ceil(min(retry_after, 3600)))},
+        )
+        
     auth_service = AuthService(db)
     
     try:
@@ -136,18 +177,13 @@ async def login(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Create access token
-        access_token = auth_service.create_access_token(user)
-        
-        return TokenResponse(
-            access_token=access_token,
-            token_type="bearer",
-            expires_in=settings.access_token_expire_minutes * 60,
-            user=UserResponse.model_validate(user)
-        )
+        # Create access and refresh tokens
+        return await token_response(auth_service, user)
         
     except HTTPException:
         raise
+    except PasswordHashingOverloaded:
+        raise overloaded_error()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -159,7 +195,7 @@ async def login(
     "/logout",
     response_model=LogoutResponse,
     summary="Logout user and invalidate token",
-    description="Logout the current user and invalidate their access token.",
+    description="Logout the current user and invalidate their access token and, if given, their refresh token.",
     responses={
         200: {"description": "Logout successful"},
         401: {"model": ErrorResponse, "description": "Invalid or missing token"},
@@ -167,7 +203,8 @@ async def login(
 )
 async def logout(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_async_session)]
+    db: Annotated[AsyncSession, Depends(get_async_session)],
+    refresh_data: Optional[RefreshTokenRequest] = None
 ) -> LogoutResponse:
     """
     Logout user and invalidate token.
@@ -175,6 +212,7 @@ async def logout(
     Args:
         credentials: HTTP Bearer credentials containing JWT token
         db: Database session
+        refresh_data: Optional refresh token of the session to end
         
     Returns:
         LogoutResponse: Logout confirmation message
@@ -194,8 +232,10 @@ async def logout(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Revoke the token (placeholder implementation)
+        # Revoke the token until it expires
         await auth_service.revoke_token(credentials.credentials)
+        if refresh_data is not None:
+            await auth_service.revoke_refresh_token(refresh_data.refresh_token)
         
         return LogoutResponse(message="Successfully logged out")
         
@@ -237,25 +277,27 @@ async def get_current_user_info(
     "/refresh",
     response_model=TokenResponse,
     summary="Refresh access token",
-    description="Refresh the current access token to extend session.",
+    description="Exchange a refresh token for a new access token and a new refresh token. Each refresh token can be used once.",
     responses={
         200: {"description": "Token refreshed successfully"},
-        401: {"model": ErrorResponse, "description": "Invalid or expired token"},
+        401: {"model": ErrorResponse, "description": "Invalid, expired or reused refresh token"},
     }
 )
 async def refresh_token(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    refresh_data: RefreshTokenRequest,
     db: Annotated[AsyncSession, Depends(get_async_session)]
 ) -> TokenResponse:
     """
     Refresh access token.
     
+    Works after the access token expired, and never hashes a password.
+    
     Args:
-        credentials: HTTP Bearer credentials containing current JWT token
+        refresh_data: Refresh token from login, registration or the last refresh
         db: Database session
         
     Returns:
-        TokenResponse: New access token and user information
+        TokenResponse: New access and refresh tokens and user information
         
     Raises:
         HTTPException: If token refresh fails
@@ -263,24 +305,17 @@ async def refresh_token(
     auth_service = AuthService(db)
     
     try:
-        # Verify current token and get user
-        user = await auth_service.verify_token(credentials.credentials)
-        if user is None:
+        # Rotate the refresh token
+        rotated = await auth_service.rotate_refresh_token(refresh_data.refresh_token)
+        if rotated is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token",
+                detail="Invalid or expired refresh token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        # Create new access token
-        new_token = auth_service.create_access_token(user)
-        
-        return TokenResponse(
-            access_token=new_token,
-            token_type="bearer",
-            expires_in=settings.access_token_expire_minutes * 60,
-            user=UserResponse.model_validate(user)
-        )
+        user, new_refresh_token = rotated
+        return await token_response(auth_service, user, new_refresh_token)
         
     except HTTPException:
         raise
@@ -300,6 +335,7 @@ async def refresh_token(
         200: {"description": "Password changed successfully"},
         400: {"model": ErrorResponse, "description": "Invalid password data"},
         401: {"model": ErrorResponse, "description": "Invalid current password or token"},
+        503: {"model": ErrorResponse, "description": "Password hashing is overloaded"},
     }
 )
 async def change_password(
@@ -345,8 +381,94 @@ async def change_password(
         )
     except HTTPException:
         raise
+    except PasswordHashingOverloaded:
+        raise overloaded_error()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Password change failed due to server error"
-        )
\ No newline at end of file
+        )
+
+
+@router.get(
+    "/hashing/stats",
+    response_model=Dict,
+    summary="Get password hashing statistics",
+    description="Get the queue depth, shed count and timings of the password hashing pool. Requires an admin user.",
+)
+async def get_hashing_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+) -> Dict:
+    """
+    Get password hashing pool statistics.
+    
+    Args:
+        current_user: Current admin user
+    
+    Returns:
+        Dict: Pool limits, queue depth, shed requests, queue wait and hash time
+    """
+    return password_hashing.get_stats()
+
+
+@router.get(
+    "/cache/stats",
+    response_model=Dict,
+    summary="Get principal cache statistics",
+    description="Get the size and hit rate of the cache of verified tokens. Requires an admin user.",
+)
+async def get_principal_cache_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+) -> Dict:
+    """
+    Get principal cache statistics.
+    
+    Args:
+        current_user: Current admin user
+    
+    Returns:
+        Dict: Cached tokens and users, hits, misses and invalidations
+    """
+    return principal_cache.get_stats()
+
+
+@router.get(
+    "/revocations/stats",
+    response_model=Dict,
+    summary="Get token revocation statistics",
+    description="Get the number of revoked tokens held in memory until they expire. Requires an admin user.",
+)
+async def get_revocation_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+) -> Dict:
+    """
+    Get token denylist statistics.
+    
+    Args:
+        current_user: Current admin user
+    
+    Returns:
+        Dict: Revoked tokens in memory, purged entries and the last synced row
+    """
+    return token_denylist.get_stats()
+
+
+@router.get(
+    "/login-limiter/stats",
+    response_model=Dict,
+    summary="Get login limiter statistics",
+    description="Get the tracked keys and allowed and rejected login attempts per IP and per username. Requires an admin user.",
+)
+async def get_login_limiter_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+) -> Dict:
+    """
+    Get login limiter statistics.
+    
+    Args:
+        current_user: Current admin user
+    
+    Returns:
+        Dict: Limits, tracked keys and attempt counts per IP and per username
+    """
+    return login_limiter.get_stats()
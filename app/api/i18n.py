@@ -4,16 +4,29 @@ Internationalization API endpoints for Park Tycoon Game.
 This module provides endpoints for language selection and translation management.
 """
 
+import io
 import logging
 from typing import Dict, List, Optional
-from fastapi import APIRouter, Request, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, File, Request, HTTPException, Query, UploadFile
+from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
+from app.core.middleware import get_current_admin_user
+from app.models.user import User
 from app.services.i18n_service import get_i18n_service
+from app.services.translation_import import (
+    DEFAULT_CHUNK_SIZE,
+    IMPORT_PARSERS,
+    TranslationImportError,
+    detect_format,
+    import_translations
+)
 from app.core.i18n_helpers import (
     get_translation_helper, 
     create_success_response, 
-    create_error_response
+    create_error_response,
+    create_bundle_response,
+    get_bundle_cache
 )
 
 logger = logging.getLogger(__name__)
@@ -41,6 +54,12 @@ class LanguageSelectionRequest(BaseModel):
     language_code: str
 
 
+class TranslationBatchRequest(BaseModel):
+    """Bulk translation lookup request model."""
+    keys: List[str] = Field(..., min_length=1, max_length=1000)
+    languages: Optional[List[str]] = Field(None, min_length=1, max_length=10)
+
+
 # Language information mapping
 LANGUAGE_INFO = {
     "en": LanguageInfo(code="en", name="English", native_name="English"),
@@ -94,6 +113,9 @@ async def get_translations(
     """
     Get translations for the current request language.
     
+    Category responses are served from pre-serialized bundles with a strong
+    ETag, and answered with 304 when the client's copy is still current.
+    
     Args:
         category: Optional category filter (ui, module, error, etc.)
         keys: Optional comma-separated list of specific keys
@@ -109,15 +131,12 @@ async def get_translations(
         if keys:
             # Get specific keys
             key_list = [key.strip() for key in keys.split(",")]
-            translations = {}
-            for key in key_list:
-                translations[key] = helper.translate(key)
-        elif category:
-            # Get translations by category
-            translations = i18n_service.get_translations_by_category(category, language)
+            translations = (await i18n_service.get_translations(key_list, [language]))[language]
         else:
-            # Get common UI translations by default
-            translations = i18n_service.get_translations_by_category("ui", language)
+            # Get translations by category, common UI translations by default
+            translations = await i18n_service.get_translations_by_category_async(category or "ui", language)
+            bundle = get_bundle_cache().get_bundle(language, category, translations)
+            return create_bundle_response(request, bundle)
         
         return create_success_response(
             request,
@@ -139,6 +158,164 @@ async def get_translations(
         )
 
 
+@router.post("/translations:batch", response_model=Dict)
+async def get_translations_batch(request: Request, batch_request: TranslationBatchRequest):
+    """
+    Get several translation keys in several languages at once.
+    
+    Useful for clients that switch languages and want every language's
+    strings in one round trip. Defaults to the request language.
+    
+    Args:
+        batch_request: Keys and optional languages to resolve
+        
+    Returns:
+        Translations grouped by language
+    """
+    try:
+        helper = get_translation_helper(request)
+        i18n_service = helper.i18n_service
+        languages = batch_request.languages or [helper.language]
+        
+        unsupported = [lang for lang in languages if not i18n_service.is_language_supported(lang)]
+        if unsupported:
+            return create_error_response(
+                request,
+                "unsupported_language",
+                status_code=400,
+                details={
+                    "requested_languages": unsupported,
+                    "supported_languages": i18n_service.get_available_languages()
+                }
+            )
+            
+        translations = await i18n_service.get_translations(batch_request.keys, languages)
+        
+        return create_success_response(
+            request,
+            data={
+                "translations": translations,
+                "languages": list(translations),
+                "total_count": sum(len(values) for values in translations.values())
+            }
+        )
+        
+    except Exception as e:
+        logger.error(f"Error getting batch translations: {e}")
+        return create_error_response(
+            request,
+            "internal_error",
+            status_code=500,
+            details={"message": "Failed to retrieve translations"}
+        )
+
+
+@router.post("/translations:import", response_model=Dict)
+async def import_translation_file(
+    request: Request,
+    file: UploadFile = File(..., description="JSON Lines, CSV or .po file"),
+    format: Optional[str] = Query(None, description="Import format (detected from the file name if not specified)"),
+    language: Optional[str] = Query(None, description="Language of rows that do not name one"),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=10000, description="Rows per upsert"),
+    admin: User = Depends(get_current_admin_user)
+):
+    """
+    Upsert translations from an uploaded file. Requires an admin user.
+    
+    The upload is spooled to disk and streamed through the importer in
+    chunks, so large catalogs are imported in bounded memory. Every worker
+    reloads the changed languages and categories once afterwards.
+    
+    Args:
+        file: Translation file to import
+        format: Optional import format (jsonl, csv or po)
+        language: Optional language for rows without one
+        chunk_size: Rows per upsert
+        admin: Current admin user
+        
+    Returns:
+        Import statistics
+    """
+    import_format = format or detect_format(file.filename)
+    if import_format not in IMPORT_PARSERS:
+        return create_error_response(
+            request,
+            "unsupported_format",
+            status_code=400,
+            details={"requested_format": import_format, "supported_formats": sorted(IMPORT_PARSERS)}
+        )
+        
+    try:
+        lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        stats = await run_in_threadpool(import_translations, IMPORT_PARSERS[import_format](lines, language), chunk_size)
+        
+        # Serve the imported translations from this worker right away
+        await get_i18n_service().sync_versions()
+        
+        return create_success_response(request, data={"import": stats})
+        
+    except (TranslationImportError, UnicodeDecodeError) as e:
+        return create_error_response(
+            request,
+            "invalid_import",
+            status_code=400,
+            details={"message": str(e)}
+        )
+    except Exception as e:
+        logger.error(f"Error importing translations: {e}")
+        return create_error_response(
+            request,
+            "internal_error",
+            status_code=500,
+            details={"message": "Failed to import translations"}
+        )
+
+
+@router.get("/translations/changes", response_model=Dict)
+async def get_translation_changes(
+    request: Request,
+    since: int = Query(..., ge=0, description="Catalog version of the client's copy (0 for a full sync)"),
+    language: Optional[str] = Query(None, description="Language to sync (syncs all if not specified)")
+):
+    """
+    Get translations added, changed or deleted since a catalog version.
+    
+    Clients store the returned version and pass it as ``since`` next time.
+    When ``reset`` is true the response holds every translation and the
+    local copy should be replaced instead of patched.
+    
+    Args:
+        since: Catalog version the client last synced
+        language: Optional specific language to sync
+        
+    Returns:
+        Changed and deleted keys grouped by language and category
+    """
+    try:
+        i18n_service = get_i18n_service()
+        
+        if language and not i18n_service.is_language_supported(language):
+            return create_error_response(
+                request,
+                "unsupported_language",
+                status_code=400,
+                details={"requested_language": language}
+            )
+            
+        changes = await i18n_service.get_changes(since, language)
+        
+        return create_success_response(request, data=changes)
+        
+    except Exception as e:
+        logger.error(f"Error getting translation changes: {e}")
+        return create_error_response(
+            request,
+            "internal_error",
+            status_code=500,
+            details={"message": "Failed to retrieve translation changes"}
+        )
+
+
 @router.get("/translations/{key}", response_model=Dict)
 async def get_translation(request: Request, key: str):
     """
@@ -152,7 +329,7 @@ async def get_translation(request: Request, key: str):
     """
     try:
         helper = get_translation_helper(request)
-        translation = helper.translate(key)
+        translation = await helper.i18n_service.get_translation_async(key, helper.language)
         
         return create_success_response(
             request,
@@ -205,7 +382,7 @@ async def select_language(request: Request, language_request: LanguageSelectionR
             )
         
         # Get sample translations in the selected language
-        sample_translations = i18n_service.get_translations_by_category("ui", requested_language)
+        sample_translations = await i18n_service.get_translations_by_category_async("ui", requested_language)
         
         return create_success_response(
             request,
@@ -302,16 +479,65 @@ async def get_cache_stats(request: Request):
         )
 
 
+@router.get("/usage", response_model=Dict)
+async def get_translation_usage(
+    request: Request,
+    language: Optional[str] = Query(None, description="Language to report on (reports every language if not specified)"),
+    limit: int = Query(20, ge=1, le=1000, description="Maximum number of keys per list"),
+    admin: User = Depends(get_current_admin_user)
+):
+    """
+    Get the hottest and never used translation keys. Requires an admin user.
+    
+    Args:
+        language: Optional specific language to report on
+        limit: Maximum number of keys per list
+        admin: Current admin user
+        
+    Returns:
+        Usage report per language
+    """
+    try:
+        i18n_service = get_i18n_service()
+        
+        if language and not i18n_service.is_language_supported(language):
+            return create_error_response(
+                request,
+                "unsupported_language",
+                status_code=400,
+                details={"requested_language": language}
+            )
+            
+        languages = [language] if language else sorted(i18n_service.get_chain_languages())
+        return create_success_response(
+            request,
+            data={
+                "usage": {lang: await i18n_service.get_usage_report(lang, limit) for lang in languages}
+            }
+        )
+        
+    except Exception as e:
+        logger.error(f"Error getting translation usage: {e}")
+        return create_error_response(
+            request,
+            "internal_error",
+            status_code=500,
+            details={"message": "Failed to retrieve translation usage"}
+        )
+
+
 @router.post("/cache/clear", response_model=Dict)
 async def clear_translation_cache(
     request: Request,
-    language: Optional[str] = Query(None, description="Specific language to clear (clears all if not specified)")
+    language: Optional[str] = Query(None, description="Specific language to clear (clears all if not specified)"),
+    admin: User = Depends(get_current_admin_user)
 ):
     """
-    Clear translation cache.
+    Clear translation cache in this worker and announce it to all others. Requires an admin user.
     
     Args:
         language: Optional specific language to clear
+        admin: Current admin user
         
     Returns:
         Confirmation of cache clearing
@@ -331,8 +557,12 @@ async def clear_translation_cache(
             message = f"Cache cleared for language: {language}"
         else:
             i18n_service.clear_cache()
+            get_bundle_cache().clear()
             message = "All translation cache cleared"
         
+        # Other workers reload the affected languages on their next version check
+        await i18n_service.invalidate(language)
+        
         return create_success_response(
             request,
             data={
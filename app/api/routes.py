@@ -2,10 +2,14 @@
 Main API router for Park Tycoon Game
 """
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 # Import route modules
 from app.api.auth import router as auth_router
 from app.api.i18n import router as i18n_router
+from app.core.database import async_pool_monitor, sync_pool_monitor
+from app.core.sqlite import write_queue
+from app.services.i18n_service import get_i18n_service
 # from app.api.player import router as player_router
 # from app.api.livestock import router as livestock_router
 # from app.api.modules import router as modules_router
@@ -18,6 +22,25 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "message": "Park Tycoon Game API is running"}
 
+# Readiness endpoint, unavailable until startup warmup has finished
+@api_router.get("/ready")
+async def readiness_check():
+    """Readiness check endpoint."""
+    warmup = get_i18n_service().get_warmup_status()
+    if not warmup["ready"]:
+        return JSONResponse(status_code=503, content={"status": "warming_up", "translations": warmup})
+    return {"status": "ready", "translations": warmup}
+
+# Connection pool statistics, for sizing DATABASE_POOL_SIZE and DATABASE_MAX_OVERFLOW
+@api_router.get("/database/pool/stats")
+async def database_pool_stats():
+    """Database connection pool statistics endpoint."""
+    return {
+        "async": async_pool_monitor.get_stats(),
+        "sync": sync_pool_monitor.get_stats(),
+        "write_queue": write_queue.get_stats(),
+    }
+
 # Include route modules
 api_router.include_router(auth_router, prefix="/auth", tags=["authentication"])
 api_router.include_router(i18n_router)  # i18n router already has /i18n prefix
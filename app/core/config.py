@@ -3,11 +3,65 @@ Application configuration management using Pydantic Settings
 """
 import os
 from functools import lru_cache
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings
 
 
+# Engine options per DATABASE_PROFILE, None keeps the driver default.
+# dev keeps the defaults with a liveness ping on every checkout. A local
+# SQLite file cannot drop idle connections, so prod-sqlite skips the ping
+# and keeps a fixed pool without overflow; it also switches to WAL and
+# queues writers (see app/core/sqlite.py). prod-postgres recycles
+# connections before typical server and proxy idle timeouts instead of
+# pinging, and caches prepared statements per connection (set
+# DATABASE_STATEMENT_CACHE_SIZE=0 behind PgBouncer in transaction mode).
+DATABASE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "dev": {
+        "pool_size": None,
+        "max_overflow": None,
+        "pool_recycle": None,
+        "pool_timeout": None,
+        "pool_pre_ping": True,
+        "statement_cache_size": None,
+        "sqlite_journal_mode": None,
+        "sqlite_synchronous": None,
+        "sqlite_busy_timeout": None,
+        "sqlite_mmap_size": None,
+        "sqlite_cache_size": None,
+        "sqlite_serialize_writes": False,
+    },
+    "prod-sqlite": {
+        "pool_size": 8,
+        "max_overflow": 0,
+        "pool_recycle": -1,
+        "pool_timeout": 10.0,
+        "pool_pre_ping": False,
+        "statement_cache_size": None,
+        "sqlite_journal_mode": "WAL",
+        "sqlite_synchronous": "NORMAL",
+        "sqlite_busy_timeout": 5000,
+        "sqlite_mmap_size": 268435456,
+        "sqlite_cache_size": -65536,
+        "sqlite_serialize_writes": True,
+    },
+    "prod-postgres": {
+        "pool_size": 10,
+        "max_overflow": 10,
+        "pool_recycle": 1800,
+        "pool_timeout": 10.0,
+        "pool_pre_ping": False,
+        "statement_cache_size": 500,
+        "sqlite_journal_mode": None,
+        "sqlite_synchronous": None,
+        "sqlite_busy_timeout": None,
+        "sqlite_mmap_size": None,
+        "sqlite_cache_size": None,
+        "sqlite_serialize_writes": False,
+    },
+}
+
+
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
     
@@ -23,6 +77,20 @@ class Settings(BaseSettings):
     secret_key: str = Field(default="park-tycoon-secret-key-change-in-production", env="SECRET_KEY")
     access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     algorithm: str = Field(default="HS256", env="ALGORITHM")
+    refresh_token_expire_days: int = Field(default=30, env="REFRESH_TOKEN_EXPIRE_DAYS")
+    bcrypt_rounds: int = Field(default=12, env="BCRYPT_ROUNDS")
+    password_hash_budget_ms: float = Field(default=250.0, env="PASSWORD_HASH_BUDGET_MS")
+    password_hash_workers: int = Field(default=2, env="PASSWORD_HASH_WORKERS")
+    password_hash_queue_limit: int = Field(default=32, env="PASSWORD_HASH_QUEUE_LIMIT")
+    login_ip_burst: int = Field(default=20, env="LOGIN_IP_BURST")
+    login_ip_per_minute: float = Field(default=20.0, env="LOGIN_IP_PER_MINUTE")
+    login_username_burst: int = Field(default=5, env="LOGIN_USERNAME_BURST")
+    login_username_per_minute: float = Field(default=5.0, env="LOGIN_USERNAME_PER_MINUTE")
+    login_limiter_max_keys: int = Field(default=100000, env="LOGIN_LIMITER_MAX_KEYS")
+    principal_cache_ttl: float = Field(default=60.0, env="PRINCIPAL_CACHE_TTL")
+    principal_cache_max_entries: int = Field(default=10000, env="PRINCIPAL_CACHE_MAX_ENTRIES")
+    timestamp_flush_interval: float = Field(default=5.0, env="TIMESTAMP_FLUSH_INTERVAL")
+    token_revocation_poll_interval: float = Field(default=5.0, env="TOKEN_REVOCATION_POLL_INTERVAL")
     
     # Database settings
     database_url: str = Field(
@@ -30,6 +98,19 @@ class Settings(BaseSettings):
         env="DATABASE_URL"
     )
     database_echo: bool = Field(default=False, env="DATABASE_ECHO")
+    database_profile: str = Field(default="dev", env="DATABASE_PROFILE")
+    database_pool_size: Optional[int] = Field(default=None, env="DATABASE_POOL_SIZE")
+    database_max_overflow: Optional[int] = Field(default=None, env="DATABASE_MAX_OVERFLOW")
+    database_pool_recycle: Optional[int] = Field(default=None, env="DATABASE_POOL_RECYCLE")
+    database_pool_timeout: Optional[float] = Field(default=None, env="DATABASE_POOL_TIMEOUT")
+    database_pool_pre_ping: Optional[bool] = Field(default=None, env="DATABASE_POOL_PRE_PING")
+    database_statement_cache_size: Optional[int] = Field(default=None, env="DATABASE_STATEMENT_CACHE_SIZE")
+    database_sqlite_journal_mode: Optional[str] = Field(default=None, env="DATABASE_SQLITE_JOURNAL_MODE")
+    database_sqlite_synchronous: Optional[str] = Field(default=None, env="DATABASE_SQLITE_SYNCHRONOUS")
+    database_sqlite_busy_timeout: Optional[int] = Field(default=None, env="DATABASE_SQLITE_BUSY_TIMEOUT")
+    database_sqlite_mmap_size: Optional[int] = Field(default=None, env="DATABASE_SQLITE_MMAP_SIZE")
+    database_sqlite_cache_size: Optional[int] = Field(default=None, env="DATABASE_SQLITE_CACHE_SIZE")
+    database_sqlite_serialize_writes: Optional[bool] = Field(default=None, env="DATABASE_SQLITE_SERIALIZE_WRITES")
     
     # CORS settings
     allowed_hosts: List[str] = Field(
@@ -47,6 +128,13 @@ class Settings(BaseSettings):
         default=["zh", "en", "es", "fr"],
         env="SUPPORTED_LANGUAGES"
     )
+    translation_bundle_max_age: int = Field(default=300, env="TRANSLATION_BUNDLE_MAX_AGE")
+    translation_catalog_path: Optional[str] = Field(default=None, env="TRANSLATION_CATALOG_PATH")
+    translation_version_poll_interval: float = Field(default=2.0, env="TRANSLATION_VERSION_POLL_INTERVAL")
+    translation_store: str = Field(default="dict", env="TRANSLATION_STORE")
+    translation_usage_flush_interval: float = Field(default=60.0, env="TRANSLATION_USAGE_FLUSH_INTERVAL")
+    translation_preload_hot_categories: int = Field(default=0, env="TRANSLATION_PRELOAD_HOT_CATEGORIES")
+    translation_warmup_retry_interval: float = Field(default=5.0, env="TRANSLATION_WARMUP_RETRY_INTERVAL")
     
     @validator("environment")
     def validate_environment(cls, v):
@@ -56,6 +144,49 @@ class Settings(BaseSettings):
             raise ValueError(f"Environment must be one of: {valid_environments}")
         return v
     
+    @validator("database_profile")
+    def validate_database_profile(cls, v):
+        """Validate database profile setting."""
+        if v not in DATABASE_PROFILES:
+            raise ValueError(f"Database profile must be one of: {list(DATABASE_PROFILES)}")
+        return v
+    
+    @validator("database_sqlite_journal_mode", "database_sqlite_synchronous")
+    def validate_sqlite_pragma(cls, v):
+        """Validate SQLite pragma keywords, which are put into the PRAGMA statement."""
+        if v is not None and not v.isalpha():
+            raise ValueError("SQLite journal mode and synchronous must be pragma keywords, e.g. WAL or NORMAL")
+        return v
+    
+    @validator("translation_store")
+    def validate_translation_store(cls, v):
+        """Validate translation store setting."""
+        valid_stores = ["dict", "compact"]
+        if v not in valid_stores:
+            raise ValueError(f"Translation store must be one of: {valid_stores}")
+        return v
+    
+    @validator("bcrypt_rounds")
+    def validate_bcrypt_rounds(cls, v):
+        """Validate bcrypt cost factor."""
+        if not 4 <= v <= 31:
+            raise ValueError("Bcrypt rounds must be between 4 and 31")
+        return v
+    
+    @validator("password_hash_workers")
+    def validate_password_hash_workers(cls, v):
+        """Validate password hashing pool size."""
+        if v < 1:
+            raise ValueError("Password hash workers must be at least 1")
+        return v
+    
+    @validator("password_hash_queue_limit")
+    def validate_password_hash_queue_limit(cls, v):
+        """Validate password hashing queue limit."""
+        if v < 0:
+            raise ValueError("Password hash queue limit must not be negative")
+        return v
+    
     @validator("log_level")
     def validate_log_level(cls, v):
         """Validate log level setting."""
@@ -78,6 +209,15 @@ class Settings(BaseSettings):
             return [lang.strip() for lang in v.split(",") if lang.strip()]
         return v
     
+    def get_database_options(self) -> Dict[str, Any]:
+        """Get the engine options of the database profile, with DATABASE_* overrides applied."""
+        options = dict(DATABASE_PROFILES[self.database_profile])
+        for name in options:
+            override = getattr(self, f"database_{name}")
+            if override is not None:
+                options[name] = override
+        return options
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
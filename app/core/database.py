@@ -2,12 +2,16 @@
 Database configuration and initialization for Park Tycoon Game
 """
 import logging
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 from sqlalchemy import create_engine, MetaData
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from app.core.config import get_settings
+from app.core.pool_monitor import PoolMonitor, monitored_pool_class
+from app.core.sqlite import get_sqlite_pragmas, set_sqlite_pragmas, write_queue
 
 logger = logging.getLogger(__name__)
 
@@ -38,22 +42,70 @@ def get_database_urls():
     
     return sync_url, async_url
 
+
+def get_engine_options(url: str, monitor: PoolMonitor, is_async: bool = False) -> Dict[str, Any]:
+    """
+    Get engine options for the configured database profile.
+    
+    Args:
+        url: Database URL of the engine
+        monitor: Monitor to record the pool's checkouts in
+        is_async: Whether the options are for an async engine
+        
+    Returns:
+        Dict: Keyword arguments for create_engine or create_async_engine
+    """
+    pool_options = settings.get_database_options()
+    url = make_url(url)
+    pool_class = url.get_dialect().get_pool_class(url)
+    if pool_class is NullPool and pool_options["pool_size"] is not None:
+        # aiosqlite opens a connection per checkout by default, keep them once a size is set
+        pool_class = AsyncAdaptedQueuePool if is_async else QueuePool
+        
+    options = {
+        "echo": settings.database_echo,
+        "poolclass": monitored_pool_class(pool_class, monitor),
+        "pool_pre_ping": pool_options["pool_pre_ping"],
+    }
+    if pool_options["pool_recycle"] is not None:
+        options["pool_recycle"] = pool_options["pool_recycle"]
+    if issubclass(pool_class, QueuePool):
+        # In-memory SQLite uses a single shared connection, which cannot be sized
+        for name in ("pool_size", "max_overflow", "pool_timeout"):
+            if pool_options[name] is not None:
+                options[name] = pool_options[name]
+    if url.get_driver_name() == "asyncpg" and pool_options["statement_cache_size"] is not None:
+        options["connect_args"] = {
+            "prepared_statement_cache_size": pool_options["statement_cache_size"],
+            "statement_cache_size": pool_options["statement_cache_size"],
+        }
+    return options
+
 sync_db_url, async_db_url = get_database_urls()
 
+# Checkout wait and overflow statistics of each engine's pool
+sync_pool_monitor = PoolMonitor("sync")
+async_pool_monitor = PoolMonitor("async")
+
 # Create sync engine for migrations and initial setup
 sync_engine = create_engine(
     sync_db_url,
-    echo=settings.database_echo,
-    pool_pre_ping=True,
+    **get_engine_options(sync_db_url, sync_pool_monitor),
 )
 
 # Create async engine for application use
 async_engine = create_async_engine(
     async_db_url,
-    echo=settings.database_echo,
-    pool_pre_ping=True,
+    **get_engine_options(async_db_url, async_pool_monitor, is_async=True),
 )
 
+# SQLite profile: pragmas on every connection and one writer at a time
+if sync_engine.dialect.name == "sqlite" and sync_engine.url.database not in (None, "", ":memory:"):
+    sqlite_pragmas = get_sqlite_pragmas(settings.get_database_options())
+    set_sqlite_pragmas(sync_engine, sqlite_pragmas)
+    set_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas)
+    write_queue.attach(async_engine.sync_engine)
+
 # Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 AsyncSessionLocal = async_sessionmaker(
@@ -123,6 +175,10 @@ async def init_database():
         async with async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
         
+            # Translation writes take their versions from this counter row
+            from app.services.i18n_service import seed_translation_version_counter
+            await conn.run_sync(seed_translation_version_counter)
+            
         logger.info("Database tables created successfully")
         
         # Initialize default data
@@ -5,16 +5,170 @@ These helpers provide convenient functions for translating content
 in API responses and handling localized data.
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional, Any, Union
-from fastapi import Request
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Mapping, NamedTuple, Optional, Any, Tuple, Union
+from fastapi import Request, Response
 
+from app.core.config import get_settings
 from app.services.i18n_service import get_i18n_service
 from app.core.i18n_middleware import get_request_language, get_request_i18n_service
 
 logger = logging.getLogger(__name__)
 
 
+class TranslationBundle(NamedTuple):
+    """Pre-serialized translation response body with its strong ETag."""
+    body: bytes
+    etag: str
+
+
+class TranslationBundleCache:
+    """
+    Bounded cache of serialized translation bundles per (language, category).
+    
+    Bundles are keyed on the identity of the frozen category mapping held by
+    I18nService. The service replaces that mapping whenever the category
+    changes, so a bundle is only rebuilt after its translations changed.
+    """
+    
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize the bundle cache.
+        
+        Args:
+            max_size: Maximum number of (language, category) bundles to keep
+        """
+        self.max_size = max_size
+        self._bundles: "OrderedDict[Tuple[str, Optional[str]], Tuple[Mapping[str, str], TranslationBundle]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_bundle(
+        self,
+        language: str,
+        category: Optional[str],
+        translations: Mapping[str, str]
+    ) -> TranslationBundle:
+        """
+        Get the serialized bundle for a category, building it if stale.
+        
+        Args:
+            language: Language of the translations
+            category: Requested category (None for the default bundle)
+            translations: Current frozen translations for the category
+            
+        Returns:
+            TranslationBundle with body bytes and ETag
+        """
+        bundle_key = (language, category)
+        cached = self._bundles.get(bundle_key)
+        if cached is not None and cached[0] is translations:
+            return cached[1]
+            
+        bundle = self._build_bundle(language, category, translations)
+        with self._lock:
+            self._bundles[bundle_key] = (translations, bundle)
+            self._bundles.move_to_end(bundle_key)
+            while len(self._bundles) > self.max_size:
+                self._bundles.popitem(last=False)
+        return bundle
+    
+    def clear(self) -> None:
+        """Drop all cached bundles."""
+        with self._lock:
+            self._bundles.clear()
+    
+    @staticmethod
+    def _build_bundle(
+        language: str,
+        category: Optional[str],
+        translations: Mapping[str, str]
+    ) -> TranslationBundle:
+        """Serialize a bundle in the same shape as create_success_response."""
+        payload = {
+            "success": True,
+            "data": {
+                "translations": dict(translations),
+                "category": category,
+                "language": language,
+                "total_count": len(translations)
+            },
+            "language": language
+        }
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return TranslationBundle(body=body, etag=etag)
+
+
+# Global bundle cache instance
+_bundle_cache = TranslationBundleCache()
+
+
+def get_bundle_cache() -> TranslationBundleCache:
+    """
+    Get the global translation bundle cache.
+    
+    Returns:
+        TranslationBundleCache instance
+    """
+    return _bundle_cache
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+    
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current strong ETag (quoted)
+        
+    Returns:
+        True if the client already has the current representation
+    """
+    if not if_none_match:
+        return False
+        
+    if if_none_match.strip() == "*":
+        return True
+    
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def create_bundle_response(request: Request, bundle: TranslationBundle) -> Response:
+    """
+    Create a cacheable response for a translation bundle.
+    
+    Answers with 304 Not Modified when the client's If-None-Match matches.
+    
+    Args:
+        request: HTTP request
+        bundle: Pre-serialized translation bundle
+        
+    Returns:
+        Response with ETag and Cache-Control headers
+    """
+    headers = {
+        "ETag": bundle.etag,
+        "Cache-Control": f"public, max-age={get_settings().translation_bundle_max_age}",
+        "Vary": "Accept-Language, X-Language",
+    }
+    
+    if etag_matches(request.headers.get("If-None-Match"), bundle.etag):
+        return Response(status_code=304, headers=headers)
+        
+    return Response(content=bundle.body, media_type="application/json", headers=headers)
+
+
 class TranslationHelper:
     """Helper class for handling translations in API responses."""
     
@@ -33,6 +187,9 @@ class TranslationHelper:
         """
         Translate a key using the request's language.
         
+        Reads the in-memory translation snapshot only; cache misses are
+        loaded in the background and never block the request.
+        
         Args:
             key: Translation key
             fallback: Fallback text if translation not found
@@ -40,7 +197,7 @@ class TranslationHelper:
         Returns:
             Translated string
         """
-        translation = self.i18n_service.get_translation(key, self.language)
+        translation = self.i18n_service.lookup(key, self.language)
         
         # If translation equals the key (not found) and fallback provided
         if translation == key and fallback is not None:
@@ -48,6 +205,19 @@ class TranslationHelper:
         
         return translation
     
+    def format(self, key: str, **params: Any) -> str:
+        """
+        Translate a key and fill in its arguments and plural forms.
+        
+        Args:
+            key: Translation key
+            **params: Argument values (e.g., count=3)
+            
+        Returns:
+            Formatted string
+        """
+        return self.i18n_service.format(key, self.language, **params)
+    
     def translate_dict(self, data: Dict[str, Any], key_mappings: Dict[str, str]) -> Dict[str, Any]:
         """
         Translate specific keys in a dictionary.
@@ -120,7 +290,7 @@ class TranslationHelper:
         Returns:
             Dictionary of UI translations
         """
-        return self.i18n_service.get_translations_by_category("ui", self.language)
+        return self.i18n_service.get_cached_category("ui", self.language)
     
     def get_module_translations(self) -> Dict[str, str]:
         """
@@ -129,7 +299,7 @@ class TranslationHelper:
         Returns:
             Dictionary of module translations
         """
-        return self.i18n_service.get_translations_by_category("module", self.language)
+        return self.i18n_service.get_cached_category("module", self.language)
     
     def get_error_message(self, error_key: str, default_message: str = None) -> str:
         """
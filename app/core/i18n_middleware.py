@@ -6,61 +6,79 @@ translation context for API responses.
 """
 
 import logging
-from typing import Callable, Optional
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from functools import lru_cache
+from fastapi import Request
+from starlette.datastructures import MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.services.i18n_service import get_i18n_service
 
 logger = logging.getLogger(__name__)
 
 
-class I18nMiddleware(BaseHTTPMiddleware):
-    """Middleware for handling internationalization in requests."""
+class I18nMiddleware:
+    """
+    Pure ASGI middleware for handling internationalization in requests.
+    
+    Unlike ``BaseHTTPMiddleware`` this does not wrap the response stream or
+    spawn a task per request; it only annotates the scope state and adds a
+    ``Content-Language`` header to the response start message. Parsed
+    ``Accept-Language`` values are memoized in a bounded LRU cache.
+    """
     
-    def __init__(self, app, default_language: str = "zh"):
+    def __init__(self, app: ASGIApp, default_language: str = "zh", accept_language_cache_size: int = 512):
         """
         Initialize the I18n middleware.
         
         Args:
-            app: FastAPI application instance
+            app: ASGI application to wrap
             default_language: Default language code to use
+            accept_language_cache_size: Maximum number of parsed Accept-Language values to keep
         """
-        super().__init__(app)
+        self.app = app
         self.default_language = default_language
         self.i18n_service = get_i18n_service()
+        self._negotiate_accept_language = lru_cache(maxsize=accept_language_cache_size)(
+            self.i18n_service.detect_language_from_header
+        )
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and detect language preference.
         
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-            
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+            
         # Detect language from various sources
-        detected_language = self._detect_request_language(request)
+        detected_language = self._detect_scope_language(scope)
         
         # Store language in request state for use in handlers
-        request.state.language = detected_language
-        request.state.i18n_service = self.i18n_service
+        state = scope.setdefault("state", {})
+        state["language"] = detected_language
+        state["i18n_service"] = self.i18n_service
         
-        logger.debug(f"Request language detected: {detected_language}")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Process request
-        response = await call_next(request)
+        async def send_with_language(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add language header to response
+                headers = MutableHeaders(scope=message)
+                headers["Content-Language"] = detected_language
+            await send(message)
         
-        # Add language header to response
-        response.headers["Content-Language"] = detected_language
+        await self.app(scope, receive, send_with_language)
         
-        return response
-    
-    def _detect_request_language(self, request: Request) -> str:
+    def _detect_scope_language(self, scope: Scope) -> str:
         """
-        Detect language preference from request.
+        Detect language preference from the ASGI scope.
         
         Priority order:
         1. Query parameter 'lang'
@@ -69,30 +87,47 @@ class I18nMiddleware(BaseHTTPMiddleware):
         4. Default language
         
         Args:
-            request: HTTP request
+            scope: ASGI connection scope
             
         Returns:
             Detected language code
         """
         # 1. Check query parameter
-        lang_param = request.query_params.get("lang")
-        if lang_param and self.i18n_service.is_language_supported(lang_param):
-            return lang_param
+        query_string = scope.get("query_string", b"")
+        if b"lang=" in query_string:
+            lang_param = QueryParams(query_string).get("lang")
+            if lang_param and self.i18n_service.is_language_supported(lang_param):
+                return lang_param
+                
+        lang_header = None
+        accept_language = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-language":
+                lang_header = value.decode("latin-1")
+            elif name == b"accept-language":
+                accept_language = value.decode("latin-1")
         
         # 2. Check custom header
-        lang_header = request.headers.get("X-Language")
         if lang_header and self.i18n_service.is_language_supported(lang_header):
             return lang_header
         
         # 3. Check Accept-Language header
-        accept_language = request.headers.get("Accept-Language")
         if accept_language:
-            detected = self.i18n_service.detect_language_from_header(accept_language)
+            detected = self._negotiate_accept_language(accept_language)
             if detected != self.default_language:  # Only use if actually detected
                 return detected
         
         # 4. Fall back to default
         return self.default_language
+    
+    def get_accept_language_cache_info(self):
+        """
+        Get statistics for the Accept-Language negotiation cache.
+        
+        Returns:
+            functools cache info with hits, misses, maxsize and currsize
+        """
+        return self._negotiate_accept_language.cache_info()
 
 
 def get_request_language(request: Request) -> str:
@@ -0,0 +1,136 @@
+"""
+Connection pool instrumentation for Park Tycoon Game.
+
+SQLAlchemy pools report their current size but not how long requests wait
+for a connection or how often the overflow is used, which is what pool
+sizes should be chosen from. Engines are built with a subclass of their
+pool class that times every checkout, including waits that end in a pool
+timeout, and records how far into the overflow the pool has gone.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class PoolMonitor:
+    """Checkout statistics of one engine's connection pool."""
+    
+    def __init__(self, name: str):
+        """
+        Initialize the monitor.
+        
+        Args:
+            name: Engine name shown in the statistics, e.g. "async"
+        """
+        self.name = name
+        self.pool_class: Optional[str] = None
+        self.pool: Optional[Pool] = None
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._overflow_checkouts = 0
+        self._overflow_peak = 0
+    
+    def record_checkout(self, pool: Pool, wait: float) -> None:
+        """
+        Record a connection handed out by the pool.
+        
+        Args:
+            pool: Pool the connection came from
+            wait: Seconds spent getting the connection
+        """
+        overflow = pool.checkedout() - pool.size() if isinstance(pool, QueuePool) else 0
+        with self._lock:
+            self.pool = pool
+            self._checkouts += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            if overflow > 0:
+                self._overflow_checkouts += 1
+                self._overflow_peak = max(self._overflow_peak, overflow)
+    
+    def record_timeout(self, pool: Pool, wait: float) -> None:
+        """
+        Record a checkout that gave up after the pool timeout.
+        
+        Args:
+            pool: Pool that had no connection available
+            wait: Seconds spent waiting
+        """
+        with self._lock:
+            self.pool = pool
+            self._timeouts += 1
+            self._wait_max = max(self._wait_max, wait)
+    
+    def reset(self) -> None:
+        """Reset the counters, e.g. after resizing the pool."""
+        with self._lock:
+            self._checkouts = 0
+            self._timeouts = 0
+            self._wait_total = 0.0
+            self._wait_max = 0.0
+            self._overflow_checkouts = 0
+            self._overflow_peak = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+        
+        Returns:
+            Dictionary with the pool class and size, checkout counts and wait times in milliseconds
+        """
+        pool = self.pool
+        with self._lock:
+            checkouts = self._checkouts
+            stats = {
+                "engine": self.name,
+                "pool": self.pool_class,
+                "checkouts": checkouts,
+                "timeouts": self._timeouts,
+                "wait_ms_avg": round(self._wait_total / checkouts * 1000, 3) if checkouts else 0.0,
+                "wait_ms_max": round(self._wait_max * 1000, 3),
+                "overflow_checkouts": self._overflow_checkouts,
+                "overflow_peak": self._overflow_peak,
+            }
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+            })
+        return stats
+
+
+def monitored_pool_class(pool_class: Type[Pool], monitor: PoolMonitor) -> Type[Pool]:
+    """
+    Subclass a pool class so that its checkouts are recorded.
+    
+    The monitor is a class attribute, so pools recreated after
+    ``engine.dispose()`` keep reporting to it.
+    
+    Args:
+        pool_class: Pool class the engine would use, e.g. QueuePool
+        monitor: Monitor to record checkouts in
+        
+    Returns:
+        The pool subclass to pass as ``poolclass``
+    """
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = pool_class._do_get(self)
+        except exc.TimeoutError:
+            self.monitor.record_timeout(self, time.perf_counter() - started)
+            raise
+        self.monitor.record_checkout(self, time.perf_counter() - started)
+        return record
+        
+    monitor.pool_class = pool_class.__name__
+    return type(f"Monitored{pool_class.__name__}", (pool_class,), {"monitor": monitor, "_do_get": _do_get})
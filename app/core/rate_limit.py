@@ -0,0 +1,180 @@
+"""
+In-process token-bucket rate limiting for Park Tycoon Game.
+
+Every login attempt costs a full bcrypt verification, so attempts are
+limited per client IP and per username before any hashing happens. Each
+key holds a single [tokens, updated] pair. Buckets that have refilled
+completely carry no information and are evicted periodically, so memory is
+bounded by the keys active within one refill period.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from app.core.config import get_settings
+
+
+class TokenBucketLimiter:
+    """Token buckets keyed by string, refilled continuously."""
+    
+    def __init__(self, burst: int, per_minute: float, max_keys: int = 100000, evict_interval: float = 60.0):
+        """
+        Initialize the limiter.
+        
+        Args:
+            burst: Bucket capacity, attempts allowed at once; 0 disables the limiter
+            per_minute: Tokens added per minute
+            max_keys: Maximum number of tracked keys, the oldest are dropped beyond it
+            evict_interval: Seconds between sweeps for full buckets
+        """
+        self.burst = burst
+        self.rate = per_minute / 60.0
+        self.max_keys = max_keys
+        self.evict_interval = evict_interval
+        self._buckets: Dict[str, List[float]] = {}
+        self._next_eviction = time.monotonic() + evict_interval
+        self.allowed = 0
+        self.rejected = 0
+        self.evicted = 0
+    
+    def acquire(self, key: str) -> float:
+        """
+        Take a token from a key's bucket.
+        
+        Args:
+            key: Bucket key, e.g. a client IP
+            
+        Returns:
+            float: 0 if allowed, otherwise seconds until a token is available
+        """
+        if self.burst <= 0:
+            return 0.0
+            
+        now = time.monotonic()
+        if now >= self._next_eviction:
+            self.evict(now)
+            
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                # Dicts keep insertion order, so this drops the oldest key
+                del self._buckets[next(iter(self._buckets))]
+                self.evicted += 1
+            bucket = self._buckets[key] = [float(self.burst), now]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            self.allowed += 1
+            return 0.0
+            
+        self.rejected += 1
+        return (1 - bucket[0]) / self.rate if self.rate > 0 else float("inf")
+    
+    def evict(self, now: Optional[float] = None) -> int:
+        """
+        Drop buckets that have refilled completely.
+        
+        Args:
+            now: Current monotonic time
+            
+        Returns:
+            int: Number of buckets dropped
+        """
+        now = time.monotonic() if now is None else now
+        self._next_eviction = now + self.evict_interval
+        if self.rate <= 0:
+            return 0
+            
+        full = [
+            key for key, (tokens, updated) in self._buckets.items()
+            if tokens + (now - updated) * self.rate >= self.burst
+        ]
+        for key in full:
+            del self._buckets[key]
+        self.evicted += len(full)
+        return len(full)
+    
+    def __len__(self) -> int:
+        return len(self._buckets)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+        
+        Returns:
+            Dictionary with limits, tracked keys and attempt counts
+        """
+        return {
+            "burst": self.burst,
+            "per_minute": round(self.rate * 60, 3),
+            "tracked_keys": len(self._buckets),
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "evicted": self.evicted,
+        }
+
+
+class LoginLimiter:
+    """Login attempt limits per client IP and per username."""
+    
+    def __init__(
+        self,
+        ip_burst: int,
+        ip_per_minute: float,
+        username_burst: int,
+        username_per_minute: float,
+        max_keys: int = 100000
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            ip_burst: Attempts one IP may make at once
+            ip_per_minute: Attempts one IP regains per minute
+            username_burst: Attempts on one username at once
+            username_per_minute: Attempts on one username regained per minute
+            max_keys: Maximum number of tracked IPs and of tracked usernames
+        """
+        self.by_ip = TokenBucketLimiter(ip_burst, ip_per_minute, max_keys)
+        self.by_username = TokenBucketLimiter(username_burst, username_per_minute, max_keys)
+    
+    def check(self, ip: Optional[str], username: str) -> float:
+        """
+        Count a login attempt against the IP and the username.
+        
+        Args:
+            ip: Client IP address, if known
+            username: Username being logged in to
+            
+        Returns:
+            float: 0 if the attempt may proceed, otherwise seconds to wait
+        """
+        retry_after = self.by_ip.acquire(ip) if ip else 0.0
+        if retry_after:
+            return retry_after
+        return self.by_username.acquire(username.strip().lower())
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+        
+        Returns:
+            Dictionary with per-IP and per-username statistics
+        """
+        return {
+            "ip": self.by_ip.get_stats(),
+            "username": self.by_username.get_stats(),
+        }
+
+
+_settings = get_settings()
+login_limiter = LoginLimiter(
+    _settings.login_ip_burst,
+    _settings.login_ip_per_minute,
+    _settings.login_username_burst,
+    _settings.login_username_per_minute,
+    _settings.login_limiter_max_keys
+)
@@ -1,19 +1,29 @@
 """
 Security utilities for authentication and password management
 """
+import asyncio
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # Get settings for JWT configuration
 settings = get_settings()
 
+# Password hashing context using bcrypt, hashes with other rounds need an update
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
+
+T = TypeVar("T")
+
 
 def hash_password(password: str) -> str:
     """
@@ -42,6 +52,151 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHashingOverloaded(RuntimeError):
+    """Raised when the password hashing queue is full and the request is shed."""
+
+
+class PasswordHashingPool:
+    """
+    Bounded executor for bcrypt work.
+    
+    Hashing and verification take 100-300 ms of CPU each, so they run on a
+    few dedicated threads instead of the event loop. At most ``max_queue``
+    calls wait for a thread; further calls fail fast with
+    PasswordHashingOverloaded instead of piling up behind a login burst.
+    """
+    
+    def __init__(self, max_workers: int, max_queue: int):
+        """
+        Initialize the pool.
+        
+        Args:
+            max_workers: Number of hashing threads
+            max_queue: Maximum number of calls waiting for a thread
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self._completed = 0
+        self._shed = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._hash_time_total = 0.0
+        self._hash_time_max = 0.0
+    
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a hashing function on the pool.
+        
+        Args:
+            func: Function to run, e.g. hash_password or verify_password
+            *args: Arguments for the function
+            
+        Returns:
+            The function's result
+            
+        Raises:
+            PasswordHashingOverloaded: If the queue is full
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._shed += 1
+                raise PasswordHashingOverloaded(
+                    f"{self._in_flight} password operations in progress, limit is "
+                    f"{self.max_workers} running and {self.max_queue} queued"
+                )
+            self._in_flight += 1
+            
+        submitted = time.perf_counter()
+        
+        def timed() -> T:
+            started = time.perf_counter()
+            with self._lock:
+                self._running += 1
+            try:
+                return func(*args)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._queue_wait_total += started - submitted
+                    self._queue_wait_max = max(self._queue_wait_max, started - submitted)
+                    self._hash_time_total += finished - started
+                    self._hash_time_max = max(self._hash_time_max, finished - started)
+                    
+        future = self._executor.submit(timed)
+        # Also runs when a cancelled caller's call is dropped from the queue
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+    
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+        
+        Returns:
+            Dictionary with pool limits, queue depth and timings in milliseconds
+        """
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self.max_workers,
+                "queue_limit": self.max_queue,
+                "running": self._running,
+                "queued": self._in_flight - self._running,
+                "completed": completed,
+                "shed": self._shed,
+                "queue_wait_ms_avg": round(self._queue_wait_total / completed * 1000, 3) if completed else 0.0,
+                "queue_wait_ms_max": round(self._queue_wait_max * 1000, 3),
+                "hash_time_ms_avg": round(self._hash_time_total / completed * 1000, 3) if completed else 0.0,
+                "hash_time_ms_max": round(self._hash_time_max * 1000, 3),
+            }
+
+
+# Shared pool for the password work of every request
+password_hashing = PasswordHashingPool(settings.password_hash_workers, settings.password_hash_queue_limit)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the password hashing pool.
+    
+    Args:
+        password: Plain text password to hash
+        
+    Returns:
+        str: Hashed password
+        
+    Raises:
+        PasswordHashingOverloaded: If the pool's queue is full
+    """
+    return await password_hashing.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash on the password hashing pool.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to verify against
+        
+    Returns:
+        bool: True if password matches, False otherwise
+        
+    Raises:
+        PasswordHashingOverloaded: If the pool's queue is full
+    """
+    return await password_hashing.run(verify_password, plain_password, hashed_password)
+
+
 def needs_update(hashed_password: str) -> bool:
     """
     Check if a password hash needs to be updated (e.g., due to algorithm changes).
@@ -59,6 +214,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     Create a JWT access token.
     
+    Every token gets a unique ``jti`` claim so it can be revoked on its own.
+    
     Args:
         data: Data to encode in the token
         expires_delta: Optional custom expiration time
@@ -74,10 +231,37 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     
     to_encode.update({"exp": expire})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
     encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
     return encoded_jwt
 
 
+def generate_refresh_token() -> str:
+    """
+    Generate an opaque refresh token.
+    
+    Returns:
+        str: Random URL-safe token
+    """
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    """
+    Digest a refresh token for storage and lookup.
+    
+    Keyed with the secret key, so a leaked table cannot be used to forge
+    or recognize tokens.
+    
+    Args:
+        token: Refresh token
+        
+    Returns:
+        str: Hex HMAC-SHA256 of the token
+    """
+    return hmac.new(settings.secret_key.encode("utf-8"), token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
 def verify_token(token: str) -> Optional[dict]:
     """
     Verify and decode a JWT token.
@@ -0,0 +1,180 @@
+"""
+SQLite production tuning for Park Tycoon Game.
+
+SQLite allows one writer at a time. In the default rollback journal a
+writer also blocks readers, and concurrent writers spin on the database
+lock until ``busy_timeout`` runs out with ``database is locked``. The
+prod-sqlite profile therefore sets WAL journaling and related pragmas on
+every new connection, so reads never wait for the writer, and routes
+every write transaction of the async engine through one FIFO writer
+queue. Writers then wait their turn in the event loop instead of inside
+SQLite's busy handler, while reads keep running in parallel on the other
+pooled connections.
+
+A connection joins the queue right before its first INSERT, UPDATE,
+DELETE or DDL statement and leaves it when it is returned to the pool,
+after its transaction has been committed or rolled back, or as soon as it
+is invalidated, closed or detached from the pool. The queue is per
+process; writers of other processes are still covered by ``busy_timeout``.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.util import await_only
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Statements that take SQLite's write lock
+_WRITE_STATEMENT = re.compile(r"^\s*(INSERT|UPDATE|DELETE|REPLACE|CREATE|DROP|ALTER)\b", re.IGNORECASE)
+
+# Pragma name per database option, in the order they are applied
+_PRAGMAS = (
+    ("journal_mode", "sqlite_journal_mode"),
+    ("synchronous", "sqlite_synchronous"),
+    ("busy_timeout", "sqlite_busy_timeout"),
+    ("mmap_size", "sqlite_mmap_size"),
+    ("cache_size", "sqlite_cache_size"),
+)
+
+
+def get_sqlite_pragmas(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the pragmas set by the database options.
+    
+    Args:
+        options: Database options, see Settings.get_database_options
+        
+    Returns:
+        Dict: Pragma values by name, unset pragmas are left out
+    """
+    return {pragma: options[name] for pragma, name in _PRAGMAS if options.get(name) is not None}
+
+
+def set_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """
+    Set pragmas on every new connection of an engine.
+    
+    Args:
+        engine: Sync engine, ``async_engine.sync_engine`` for async engines
+        pragmas: Pragma values by name, e.g. {"journal_mode": "WAL"}
+    """
+    if not pragmas:
+        return
+    
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in pragmas.items():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
+
+class WriteQueue:
+    """FIFO queue that lets one connection write at a time."""
+    
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the queue.
+        
+        Args:
+            enabled: Whether writers are queued
+        """
+        self.enabled = enabled
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writers: Set[int] = set()
+        self._acquired_at = 0.0
+        self._waiting = 0
+        self._transactions = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._hold_total = 0.0
+        self._hold_max = 0.0
+    
+    def _get_lock(self) -> asyncio.Lock:
+        # asyncio locks belong to one event loop, tests run several
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+    
+    async def acquire(self) -> None:
+        """Wait until every earlier writer has finished."""
+        lock = self._get_lock()
+        started = time.perf_counter()
+        self._waiting += 1
+        try:
+            await lock.acquire()
+        finally:
+            self._waiting -= 1
+        self._acquired_at = time.perf_counter()
+        wait = self._acquired_at - started
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+    
+    def release(self) -> None:
+        """Let the next writer proceed."""
+        held = time.perf_counter() - self._acquired_at
+        self._transactions += 1
+        self._hold_total += held
+        self._hold_max = max(self._hold_max, held)
+        self._lock.release()
+    
+    def attach(self, engine: Engine) -> None:
+        """
+        Queue the write transactions of an async engine.
+        
+        Args:
+            engine: ``async_engine.sync_engine``, whose statements run in a greenlet
+        """
+        @event.listens_for(engine, "before_cursor_execute")
+        def _join_queue(conn, cursor, statement, parameters, context, executemany) -> None:
+            writer = id(conn.connection.dbapi_connection)
+            if self.enabled and writer not in self._writers and _WRITE_STATEMENT.match(statement):
+                await_only(self.acquire())
+                self._writers.add(writer)
+        
+        def _leave_queue(dbapi_connection, *args) -> None:
+            writer = id(dbapi_connection)
+            if dbapi_connection is not None and writer in self._writers:
+                self._writers.discard(writer)
+                self.release()
+        
+        # Invalidated and detached connections are never checked in, detached ones are still reset
+        for identifier in ("reset", "checkin", "invalidate", "close", "detach", "close_detached"):
+            event.listen(engine, identifier, _leave_queue)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+        
+        Returns:
+            Dictionary with waiting writers, finished write transactions and timings in milliseconds
+        """
+        transactions = self._transactions
+        return {
+            "enabled": self.enabled,
+            "waiting": self._waiting,
+            "transactions": transactions,
+            "wait_ms_avg": round(self._wait_total / transactions * 1000, 3) if transactions else 0.0,
+            "wait_ms_max": round(self._wait_max * 1000, 3),
+            "hold_ms_avg": round(self._hold_total / transactions * 1000, 3) if transactions else 0.0,
+            "hold_ms_max": round(self._hold_max * 1000, 3),
+        }
+
+
+_settings = get_settings()
+write_queue = WriteQueue(
+    _settings.database_url.startswith("sqlite") and bool(_settings.get_database_options()["sqlite_serialize_writes"])
+)
@@ -2,7 +2,7 @@
 Translation model for internationalization support
 """
 from datetime import datetime
-from sqlalchemy import DateTime, Integer, String, Text, UniqueConstraint
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -28,7 +28,7 @@ class Translation(Base):
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
     
     # Ensure unique key-language combinations
     __table_args__ = (
@@ -36,4 +36,105 @@ class Translation(Base):
     )
     
     def __repr__(self) -> str:
-        return f"<Translation(id={self.id}, key='{self.key}', lang='{self.language_code}', category='{self.category}')>"
\ No newline at end of file
+        return f"<Translation(id={self.id}, key='{self.key}', lang='{self.language_code}', category='{self.category}')>"
+
+
+class TranslationVersion(Base):
+    """Monotonic change stamp for the translations of a language and category."""
+    
+    __tablename__ = "translation_versions"
+    
+    # Category stamped when a whole language changes
+    ALL_CATEGORIES = "*"
+    
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    
+    # Scope of the change
+    language_code: Mapped[str] = mapped_column(String(10), nullable=False)
+    category: Mapped[str] = mapped_column(String(50), nullable=False)
+    
+    # Catalog-wide version at the time of the last change to this scope
+    version: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    
+    # Timestamps
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint('language_code', 'category', name='uq_translation_version_scope'),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<TranslationVersion(lang='{self.language_code}', category='{self.category}', version={self.version})>"
+
+
+class TranslationVersionCounter(Base):
+    """Single-row counter that hands out catalog versions."""
+    
+    __tablename__ = "translation_version_counter"
+    
+    # The only row
+    ROW_ID = 1
+    
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    
+    # Last version handed out
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<TranslationVersionCounter(version={self.version})>"
+
+
+class TranslationUsage(Base):
+    """Sampled lookup count of a translation key in a language."""
+    
+    __tablename__ = "translation_usage"
+    
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    
+    # Key that was looked up and the language it was requested in
+    key: Mapped[str] = mapped_column(String(255), nullable=False)
+    language_code: Mapped[str] = mapped_column(String(10), nullable=False)
+    category: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    
+    # Estimated lookups, each sample counts for the sampling interval
+    hits: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    
+    # Timestamps
+    last_hit_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint('key', 'language_code', name='uq_translation_usage_key_language'),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<TranslationUsage(key='{self.key}', lang='{self.language_code}', hits={self.hits})>"
+
+
+class TranslationTombstone(Base):
+    """Record of a deleted translation, kept so clients can sync deletions."""
+    
+    __tablename__ = "translation_tombstones"
+    
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    
+    # Translation that was deleted
+    key: Mapped[str] = mapped_column(String(255), nullable=False)
+    language_code: Mapped[str] = mapped_column(String(10), nullable=False)
+    category: Mapped[str] = mapped_column(String(50), nullable=False)
+    
+    # Catalog version of the deletion
+    version: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    
+    # Timestamps
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint('key', 'language_code', name='uq_translation_tombstone_key_language'),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<TranslationTombstone(key='{self.key}', lang='{self.language_code}', version={self.version})>"
@@ -3,7 +3,7 @@ User model for authentication and account management
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -59,4 +59,49 @@ class User(Base):
         self.last_login = datetime.utcnow()
     
     def __repr__(self) -> str:
-        return f"<User(id={self.id}, username='{self.username}', is_admin={self.is_admin})>"
\ No newline at end of file
+        return f"<User(id={self.id}, username='{self.username}', is_admin={self.is_admin})>"
+
+
+class RevokedToken(Base):
+    """Access token revoked before its expiry, identified by its ``jti`` claim."""
+    
+    __tablename__ = "revoked_tokens"
+    
+    # Primary key, workers sync revocations newer than the last ID they saw
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    
+    # Token that was revoked and its owner
+    jti: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+    user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    
+    # The row is useless once the token would have expired anyway
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    revoked_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<RevokedToken(jti='{self.jti}', user_id={self.user_id}, expires_at={self.expires_at})>"
+
+
+class RefreshToken(Base):
+    """Long-lived refresh token, stored as an HMAC digest and rotated on every use."""
+    
+    __tablename__ = "refresh_tokens"
+    
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    
+    # HMAC-SHA256 of the token, the token itself is never stored
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+    
+    # Tokens rotated from the same login share a family
+    family_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    used_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    
+    def __repr__(self) -> str:
+        return f"<RefreshToken(id={self.id}, user_id={self.user_id}, family_id='{self.family_id}')>"
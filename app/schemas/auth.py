@@ -57,9 +57,17 @@ class TokenResponse(BaseModel):
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(default="bearer", description="Token type")
     expires_in: int = Field(..., description="Token expiration time in seconds")
+    refresh_token: Optional[str] = Field(None, description="Refresh token, valid for a single use")
+    refresh_expires_in: Optional[int] = Field(None, description="Refresh token expiration time in seconds")
     user: "UserResponse" = Field(..., description="User information")
 
 
+class RefreshTokenRequest(BaseModel):
+    """Schema for refresh token and logout requests."""
+    
+    refresh_token: str = Field(..., min_length=1, max_length=200, description="Refresh token")
+
+
 class UserResponse(BaseModel):
     """Schema for user information response."""
     
@@ -1,15 +1,80 @@
 """
 Authentication service for user registration, login, and token management
 """
+import asyncio
+import logging
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.models.user import User
-from app.core.security import hash_password, verify_password, create_access_token, verify_token
+from app.models.user import RefreshToken, RevokedToken, User
+from app.core.security import (
+    PasswordHashingOverloaded, hash_password_async, verify_password_async, needs_update,
+    create_access_token, verify_token, generate_refresh_token, hash_refresh_token
+)
 from app.core.config import get_settings
+from app.core.database import AsyncSessionLocal
+from app.services.principal_cache import principal_cache
+from app.services.token_denylist import to_datetime, token_denylist
+from app.services.write_behind import timestamp_writer
+
+logger = logging.getLogger(__name__)
+
+# Background rehashes, referenced until they finish
+_rehash_tasks: Set[asyncio.Task] = set()
+
+
+async def rehash_password(user_id: int, old_hash: str, password: str) -> bool:
+    """
+    Rehash a password with the configured bcrypt rounds.
+    
+    The new hash is only written if the stored hash is still the one that
+    was verified, so a concurrent password change always wins.
+    
+    Args:
+        user_id: ID of the user who just logged in
+        old_hash: Hash the password was verified against
+        password: Verified plain text password
+        
+    Returns:
+        bool: True if the stored hash was replaced, False otherwise
+    """
+    try:
+        new_hash = await hash_password_async(password)
+    except PasswordHashingOverloaded:
+        # The next login tries again
+        return False
+        
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            update(User)
+            .where(User.id == user_id, User.password_hash == old_hash)
+            .values(password_hash=new_hash)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        
+    if result.rowcount == 1:
+        logger.info(f"Rehashed password of user {user_id} with the current bcrypt rounds")
+        return True
+    return False
+
+
+def schedule_rehash(user_id: int, old_hash: str, password: str) -> None:
+    """Rehash a stale password hash in the background, after the login has answered."""
+    async def run() -> None:
+        try:
+            await rehash_password(user_id, old_hash, password)
+        except Exception as e:
+            logger.error(f"Error rehashing password of user {user_id}: {e}")
+            
+    task = asyncio.create_task(run())
+    _rehash_tasks.add(task)
+    task.add_done_callback(_rehash_tasks.discard)
 
 
 class AuthService:
@@ -39,6 +104,7 @@ class AuthService:
             
         Raises:
             ValueError: If username or password is invalid
+            PasswordHashingOverloaded: If too many password operations are queued
         """
         # Validate input
         if not username or len(username.strip()) < 3:
@@ -62,7 +128,7 @@ class AuthService:
                 is_active=True,
                 created_at=datetime.utcnow()
             )
-            user.set_password(password)
+            user.password_hash = await hash_password_async(password)
             
             self.db.add(user)
             await self.db.commit()
@@ -84,6 +150,9 @@ class AuthService:
             
         Returns:
             User: User object if authentication successful, None if failed
+            
+        Raises:
+            PasswordHashingOverloaded: If too many password operations are queued
         """
         if not username or not password:
             return None
@@ -94,12 +163,15 @@ class AuthService:
         if not user or not user.is_active:
             return None
         
-        if not user.check_password(password):
+        if not await verify_password_async(password, user.password_hash):
             return None
         
-        # Update last login timestamp
-        user.update_last_login()
-        await self.db.commit()
+        # Hashes made with other rounds are upgraded without delaying the login
+        if needs_update(user.password_hash):
+            schedule_rehash(user.id, user.password_hash, password)
+        
+        # Buffer the last login timestamp instead of an UPDATE and commit per login
+        set_committed_value(user, "last_login", timestamp_writer.touch(User.last_login, user.id))
         
         return user
     
@@ -157,14 +229,21 @@ class AuthService:
         """
         Verify a JWT token and return the associated user.
         
+        Users of recently verified tokens are served from the principal
+        cache without decoding the token or querying the database.
+        
         Args:
             token: JWT token to verify
             
         Returns:
             User: User object if token is valid, None if invalid
         """
+        user = principal_cache.get(token)
+        if user is not None:
+            return user
+            
         payload = verify_token(token)
-        if payload is None:
+        if payload is None or token_denylist.is_revoked(payload.get("jti")):
             return None
         
         user_id = payload.get("sub")
@@ -176,31 +255,142 @@ class AuthService:
         except (ValueError, TypeError):
             return None
         
+        # Changes committed while the user is loading must keep it out of the cache
+        generation = principal_cache.generation(user_id)
         user = await self.get_user_by_id(user_id)
         if user is None or not user.is_active:
             return None
+            
+        # The token may have been revoked while the user was loading
+        if token_denylist.is_revoked(payload.get("jti")):
+            return None
         
+        principal_cache.put(token, user, payload.get("exp"), payload.get("jti"), generation)
         return user
     
-    async def refresh_token(self, token: str) -> Optional[str]:
+    async def issue_refresh_token(self, user: User, family_id: Optional[str] = None) -> str:
         """
-        Refresh an access token if it's valid.
+        Create and store a refresh token for a user.
         
         Args:
-            token: Current JWT token
+            user: User to create the token for
+            family_id: Family of the token being rotated, a new one if None
             
         Returns:
-            str: New JWT token if refresh successful, None if failed
+            str: Refresh token, only its HMAC digest is stored
         """
-        user = await self.verify_token(token)
-        if user is None:
+        token = generate_refresh_token()
+        now = datetime.utcnow()
+        self.db.add(RefreshToken(
+            token_hash=hash_refresh_token(token),
+            family_id=family_id or uuid.uuid4().hex,
+            user_id=user.id,
+            created_at=now,
+            expires_at=now + timedelta(days=self.settings.refresh_token_expire_days)
+        ))
+        await self.db.commit()
+        
+        return token
+    
+    async def rotate_refresh_token(self, token: str) -> Optional[Tuple[User, str]]:
+        """
+        Exchange a refresh token for a new one.
+        
+        Costs an HMAC and one indexed lookup, never a password hash. Each
+        token can be used once; presenting a used token again revokes its
+        whole family, since either the client or an attacker holds a copy.
+        
+        Args:
+            token: Refresh token to exchange
+            
+        Returns:
+            Tuple of the token's user and the new refresh token, None if the
+            token is unknown, expired, revoked, reused or its user is inactive
+        """
+        if not token:
             return None
         
-        return self.create_access_token(user)
+        result = await self.db.execute(
+            select(RefreshToken, User)
+            .join(User, User.id == RefreshToken.user_id)
+            .where(RefreshToken.token_hash == hash_refresh_token(token))
+        )
+        row = result.first()
+        if row is None:
+            return None
+            
+        stored, user = row
+        family_id = stored.family_id
+        now = datetime.utcnow()
+        if stored.revoked_at is not None or stored.expires_at <= now or not user.is_active:
+            return None
+        
+        # Claim the token atomically, so concurrent requests cannot both rotate it
+        claimed = await self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == stored.id, RefreshToken.used_at.is_(None))
+            .values(used_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if claimed.rowcount != 1:
+            logger.warning(f"Refresh token reuse detected for user {user.id}, revoking its family")
+            await self.revoke_refresh_tokens(family_id=family_id)
+            return None
+            
+        return user, await self.issue_refresh_token(user, family_id)
+    
+    async def revoke_refresh_tokens(self, user_id: Optional[int] = None, family_id: Optional[str] = None) -> int:
+        """
+        Revoke the unrevoked refresh tokens of a user or a token family.
+        
+        Args:
+            user_id: Revoke every token of this user
+            family_id: Revoke every token rotated from the same login
+            
+        Returns:
+            int: Number of tokens revoked
+        """
+        if user_id is None and family_id is None:
+            return 0
+            
+        statement = update(RefreshToken).where(RefreshToken.revoked_at.is_(None))
+        if user_id is not None:
+            statement = statement.where(RefreshToken.user_id == user_id)
+        if family_id is not None:
+            statement = statement.where(RefreshToken.family_id == family_id)
+            
+        result = await self.db.execute(
+            statement.values(revoked_at=datetime.utcnow()).execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return result.rowcount
+    
+    async def revoke_refresh_token(self, token: str) -> bool:
+        """
+        Revoke the family of a refresh token, ending that login session.
+        
+        Args:
+            token: Refresh token
+            
+        Returns:
+            bool: True if the token was known, False otherwise
+        """
+        result = await self.db.execute(
+            select(RefreshToken.family_id).where(RefreshToken.token_hash == hash_refresh_token(token))
+        )
+        family_id = result.scalar_one_or_none()
+        if family_id is None:
+            return False
+            
+        await self.revoke_refresh_tokens(family_id=family_id)
+        return True
     
     async def revoke_token(self, token: str) -> bool:
         """
-        Revoke a token (placeholder for future token blacklisting).
+        Revoke a token until it expires.
+        
+        The token's ``jti`` is stored in ``revoked_tokens`` and added to the
+        in-memory denylist; other workers pick it up on their next sync.
         
         Args:
             token: JWT token to revoke
@@ -208,9 +398,34 @@ class AuthService:
         Returns:
             bool: True if revocation successful, False otherwise
         """
-        # For now, we don't implement token blacklisting
-        # In a production system, you would store revoked tokens in a cache/database
-        # and check against them in verify_token
+        payload = verify_token(token)
+        if payload is None or not payload.get("jti") or payload.get("exp") is None:
+            return False
+            
+        jti = payload["jti"]
+        if not token_denylist.is_revoked(jti):
+            try:
+                user_id = int(payload.get("sub"))
+            except (ValueError, TypeError):
+                user_id = None
+                
+            try:
+                self.db.add(RevokedToken(
+                    jti=jti,
+                    user_id=user_id,
+                    expires_at=to_datetime(payload["exp"]),
+                    revoked_at=datetime.utcnow()
+                ))
+                await self.db.commit()
+            except IntegrityError:
+                # Already revoked by another worker
+                await self.db.rollback()
+            except SQLAlchemyError as e:
+                # Still deny the token in this worker
+                logger.error(f"Error persisting token revocation: {e}")
+                await self.db.rollback()
+                
+        token_denylist.add(jti, payload["exp"])
         return True
     
     async def change_password(self, user_id: int, old_password: str, new_password: str) -> bool:
@@ -227,6 +442,7 @@ class AuthService:
             
         Raises:
             ValueError: If new password is invalid
+            PasswordHashingOverloaded: If too many password operations are queued
         """
         if not new_password or len(new_password) < 6:
             raise ValueError("New password must be at least 6 characters long")
@@ -235,12 +451,15 @@ class AuthService:
         if user is None or not user.is_active:
             return False
         
-        if not user.check_password(old_password):
+        if not await verify_password_async(old_password, user.password_hash):
             return False
         
-        user.set_password(new_password)
+        user.password_hash = await hash_password_async(new_password)
         await self.db.commit()
         
+        # Sessions started with the old password cannot be renewed
+        await self.revoke_refresh_tokens(user_id=user_id)
+        
         return True
     
     async def deactivate_user(self, user_id: int) -> bool:
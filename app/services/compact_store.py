@@ -0,0 +1,125 @@
+"""
+Compact in-memory translation store for Park Tycoon Game.
+
+A language's translations are kept in two UTF-8 blobs: sorted keys separated
+by NUL bytes, and values addressed by an offset array. Instead of a dict
+slot and two str objects per entry, each entry costs its encoded bytes plus
+a 4-byte offset. Lookups bisect a sparse index holding every BLOCK_SIZE-th
+key, then search the key's block in the blob, trading some latency for
+memory on very large catalogs (see scripts/benchmark_translation_store.py).
+"""
+
+from array import array
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Callable, Dict, ItemsView, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+# Keys per block of the sparse index
+BLOCK_SIZE = 16
+
+_SEPARATOR = b"\0"
+
+
+class _CompactItemsView(ItemsView):
+    """Items view that walks the blobs instead of searching for every key."""
+    
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return self._mapping._iter_items()
+
+
+class CompactTranslations(Mapping[str, str]):
+    """Immutable key -> translation mapping stored in sorted, packed blobs."""
+    
+    __slots__ = ("_keys", "_block_keys", "_block_offsets", "_values", "_value_offsets", "_count")
+    
+    def __init__(self, translations: Union[Mapping[str, str], Iterable[Tuple[str, str]]] = ()):
+        """
+        Build the store.
+        
+        Args:
+            translations: Mapping or (key, value) pairs; later pairs win on duplicate keys
+            
+        Raises:
+            ValueError: If a key contains a NUL character
+        """
+        if not isinstance(translations, Mapping):
+            translations = dict(translations)
+        items = sorted(translations.items())
+        
+        keys = bytearray(_SEPARATOR)
+        block_keys: List[str] = []
+        block_offsets = array("I")
+        values = bytearray()
+        value_offsets = array("I", [0])
+        for position, (key, value) in enumerate(items):
+            if "\0" in key:
+                raise ValueError(f"Translation key contains a NUL character: {key!r}")
+            if position % BLOCK_SIZE == 0:
+                block_keys.append(key)
+                block_offsets.append(len(keys) - 1)
+            keys += key.encode("utf-8")
+            keys += _SEPARATOR
+            values += value.encode("utf-8")
+            value_offsets.append(len(values))
+            
+        self._keys = bytes(keys)
+        self._block_keys = block_keys
+        self._block_offsets = block_offsets
+        self._values = bytes(values)
+        self._value_offsets = value_offsets
+        self._count = len(items)
+    
+    def _index(self, key: str) -> int:
+        """Position of a key, or -1 if it is not stored."""
+        block = bisect_right(self._block_keys, key) - 1
+        if block < 0 or "\0" in key:
+            return -1
+            
+        start = self._block_offsets[block]
+        end = self._block_offsets[block + 1] + 1 if block + 1 < len(self._block_offsets) else len(self._keys)
+        found = self._keys.find(_SEPARATOR + key.encode("utf-8") + _SEPARATOR, start, end)
+        if found < 0:
+            return -1
+        return block * BLOCK_SIZE + self._keys.count(_SEPARATOR, start, found)
+    
+    def _value(self, position: int) -> str:
+        return self._values[self._value_offsets[position]:self._value_offsets[position + 1]].decode("utf-8")
+    
+    def __getitem__(self, key: str) -> str:
+        position = self._index(key)
+        if position < 0:
+            raise KeyError(key)
+        return self._value(position)
+    
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        position = self._index(key)
+        return default if position < 0 else self._value(position)
+    
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._index(key) >= 0
+    
+    def __iter__(self) -> Iterator[str]:
+        if not self._count:
+            return iter(())
+        return iter(self._keys[1:-1].decode("utf-8").split("\0"))
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def items(self) -> ItemsView[str, str]:
+        return _CompactItemsView(self)
+    
+    def _iter_items(self) -> Iterator[Tuple[str, str]]:
+        values, offsets = self._values, self._value_offsets
+        for position, key in enumerate(self):
+            yield key, values[offsets[position]:offsets[position + 1]].decode("utf-8")
+    
+    def __repr__(self) -> str:
+        return f"CompactTranslations({self._count} keys, {len(self._keys) + len(self._values)} bytes)"
+
+
+# Ways to freeze a language's translations once they are published
+TRANSLATION_STORES: Dict[str, Callable[[Dict[str, str]], Mapping[str, str]]] = {
+    "dict": MappingProxyType,
+    "compact": CompactTranslations,
+}
@@ -5,29 +5,207 @@ This service handles translation key resolution, language detection,
 and caching for performance optimization.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Set
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from itertools import chain, product
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, TypeVar
 from functools import lru_cache
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy import and_, bindparam, delete, event, false, func, insert, inspect, or_, select, update
 
-from app.core.database import SessionLocal
-from app.models.translation import Translation
+from app.core.config import get_settings
+from app.core.database import SessionLocal, AsyncSessionLocal
+from app.models.translation import (
+    Translation,
+    TranslationTombstone,
+    TranslationUsage,
+    TranslationVersion,
+    TranslationVersionCounter
+)
+from app.services.compact_store import TRANSLATION_STORES
+from app.services.message_format import CompiledMessage, MessageFormatError, compile_message
+from app.services.translation_catalog import TranslationCatalog
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_MAPPING: Mapping[str, str] = MappingProxyType({})
+
+# Inserts that can skip a version counter row another writer created first
+_COUNTER_SEED_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A blocking load shared by every thread that misses on the same key."""
+    
+    __slots__ = ("done", "result")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class _ResolvedChain(Mapping[str, str]):
+    """Live view of a fully loaded fallback chain, walked instead of merged into a copy."""
+    
+    __slots__ = ("_languages", "_layers")
+    
+    def __init__(self, languages: Tuple[str, ...], layers: Callable[[str], Tuple[Mapping[str, str], ...]]):
+        self._languages = languages
+        self._layers = layers
+    
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        for language_code in self._languages:
+            for layer in self._layers(language_code):
+                translation = layer.get(key)
+                if translation is not None:
+                    return translation
+        return default
+    
+    def __getitem__(self, key: str) -> str:
+        translation = self.get(key)
+        if translation is None:
+            raise KeyError(key)
+        return translation
+    
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+    
+    def __iter__(self) -> Iterator[str]:
+        seen: Set[str] = set()
+        for language_code in self._languages:
+            for layer in self._layers(language_code):
+                for key in tuple(layer):
+                    if key not in seen:
+                        seen.add(key)
+                        yield key
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
 
 class I18nService:
-    """Service for handling internationalization operations."""
+    """
+    Service for handling internationalization operations.
+    
+    Translations are held in an immutable snapshot (``_cache``) that is
+    replaced wholesale whenever new translations are loaded. Readers never
+    take a lock and never see a partially updated language.
+    
+    Alongside it, ``_categories`` indexes language -> category -> frozen
+    mapping. A category only appears in the index once it has been loaded
+    completely, so category lookups are a single dict access.
+    
+    Single keys are written to a small mutable overlay per language
+    (``_overlays``) instead of copying the snapshot, so each costs one dict
+    insert. The overlay is merged into the snapshot by the next category
+    or language load.
+    
+    Keys that are missing from the database are remembered in a bounded
+    negative cache for NEGATIVE_CACHE_TTL seconds, so repeated lookups of
+    untranslated keys neither query the database nor log again.
+    
+    When a compiled catalog is attached, languages it contains are served
+    straight from the memory-mapped file and never query the database.
+    
+    Every translation write bumps a version stamp for its language and
+    category in ``translation_versions``. Workers poll the highest version
+    and reload only the scopes that changed since they last looked.
+    
+    Concurrent misses on the same language, category or key share a single
+    in-flight load (per event loop for async callers, per process for
+    blocking callers); ``get_cache_stats`` reports how many were coalesced.
+    
+    Once every language of a FALLBACK_CHAINS entry is fully loaded, the
+    chain is merged into one effective dictionary (``_resolved``), so a
+    lookup with fallbacks is a single dict access.
+    
+    Published translations are frozen by the configured store: read-only
+    dicts by default, or ``compact`` sorted arrays for very large catalogs.
+    Compact stores are only built by category and language loads, and
+    their resolved chains are live views that walk the chain instead of
+    merged copies.
+    
+    About one in USAGE_SAMPLE_RATE single-key lookups is counted per
+    (key, language); ``flush_usage`` adds the counts to
+    ``translation_usage`` so hot and never-hit keys can be reported.
+    """
     
     # Supported languages
     SUPPORTED_LANGUAGES = {"en", "zh", "es", "fr"}
     DEFAULT_LANGUAGE = "zh"  # Chinese as default per requirements
     
-    def __init__(self):
-        """Initialize the I18n service."""
-        self._cache: Dict[str, Dict[str, str]] = {}
+    # Languages consulted in order for each language, including region variants
+    FALLBACK_CHAINS = {
+        "zh": ("zh", "en"),
+        "en": ("en", "zh"),
+        "es": ("es", "en", "zh"),
+        "fr": ("fr", "en", "zh"),
+        "zh-TW": ("zh-TW", "zh", "en"),
+        "en-GB": ("en-GB", "en", "zh"),
+    }
+    
+    # Negative cache for (key, language) pairs without a translation
+    NEGATIVE_CACHE_SIZE = 10000
+    NEGATIVE_CACHE_TTL = 300.0  # seconds
+    
+    # Maximum number of keys per IN (...) clause in bulk lookups
+    BULK_QUERY_CHUNK_SIZE = 500
+    
+    # Compiled message formatters kept per (key, language)
+    FORMATTER_CACHE_SIZE = 10000
+    
+    # Lookups per usage sample on average (0 disables usage counters)
+    USAGE_SAMPLE_RATE = 64
+    
+    # Extra look-back for delta sync, covering writes that raced a version stamp
+    CHANGES_OVERLAP = timedelta(seconds=5)
+    
+    def __init__(self, store: str = "dict"):
+        """
+        Initialize the I18n service.
+        
+        Args:
+            store: Backend for published translations, one of TRANSLATION_STORES
+        """
+        if store not in TRANSLATION_STORES:
+            raise ValueError(f"Translation store must be one of: {sorted(TRANSLATION_STORES)}")
+        self._freeze = TRANSLATION_STORES[store]
+        self._merge_chains = store != "compact"
+        self._cache: Mapping[str, Mapping[str, str]] = MappingProxyType({})
+        self._categories: Mapping[str, Mapping[str, Mapping[str, str]]] = MappingProxyType({})
+        self._resolved: Mapping[str, Mapping[str, str]] = MappingProxyType({})
+        self._overlays: Dict[str, Dict[str, str]] = {}
         self._cache_loaded: Set[str] = set()
+        self._write_lock = threading.Lock()
+        self._background_loads: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._missing: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._missing_hits = 0
+        self._catalog: Optional[TranslationCatalog] = None
+        self._version: Optional[int] = None
+        self._ready = False
+        self._warmup_timings: Dict[str, float] = {}
+        self._warmup_failed: Set[str] = set()
+        self._in_flight: Dict[Tuple[str, ...], asyncio.Future] = {}
+        self._sync_flights: Dict[Tuple[str, ...], _Flight] = {}
+        self._flight_lock = threading.Lock()
+        self._coalesced = {"language": 0, "category": 0, "key": 0}
+        self._formatters: Dict[Tuple[str, str], Tuple[str, CompiledMessage]] = {}
+        self._usage: Dict[Tuple[str, str], int] = {}
+        self._usage_countdown = 0
+        self._reset_usage_countdown()
     
     def get_translation(
         self, 
@@ -41,54 +219,48 @@ class I18nService:
         Args:
             key: Translation key (e.g., 'ui.welcome')
             language_code: Target language code (defaults to DEFAULT_LANGUAGE)
-            fallback_language: Fallback language if translation not found
+            fallback_language: Fallback language instead of the FALLBACK_CHAINS entry
             
         Returns:
             Translated string or the key itself if no translation found
         """
-        if language_code is None:
-            language_code = self.DEFAULT_LANGUAGE
+        chain = self._resolve_chain(language_code, fallback_language)
+        language_code = chain[0]
         
-        if fallback_language is None:
-            fallback_language = "en" if language_code != "en" else self.DEFAULT_LANGUAGE
+        self._count_usage(key, language_code)
         
-        # Validate language code
-        if language_code not in self.SUPPORTED_LANGUAGES:
-            logger.warning(f"Unsupported language code: {language_code}, using default")
-            language_code = self.DEFAULT_LANGUAGE
-        
-        # Try to get from cache first
-        translation = self._get_from_cache(key, language_code)
-        if translation is not None:
-            return translation
-        
-        # Load from database if not in cache
-        translation = self._load_translation_from_db(key, language_code)
-        if translation is not None:
-            self._cache_translation(key, language_code, translation)
-            return translation
+        effective = self._resolved.get(language_code) if fallback_language is None else None
+        if effective is not None:
+            return self._lookup_effective(effective, key, language_code)
         
-        # Try fallback language
-        if fallback_language != language_code:
-            fallback_translation = self._get_from_cache(key, fallback_language)
-            if fallback_translation is None:
-                fallback_translation = self._load_translation_from_db(key, fallback_language)
-                if fallback_translation is not None:
-                    self._cache_translation(key, fallback_language, fallback_translation)
+        first_miss = False
+        for lang in chain:
+            # Try to get from cache first
+            translation = self._get_from_cache(key, lang)
             
-            if fallback_translation is not None:
-                logger.debug(f"Using fallback translation for key '{key}': {fallback_language}")
-                return fallback_translation
+            # Load from database unless the key is known to be missing
+            if translation is None and not self._is_known_missing(key, lang):
+                translation = self._load_translation_from_db(key, lang)
+                if translation is not None:
+                    self._cache_translation(key, lang, translation)
+                elif self._remember_missing(key, lang) and lang == language_code:
+                    first_miss = True
+                    
+            if translation is not None:
+                if lang != language_code:
+                    logger.debug(f"Using fallback translation for key '{key}': {lang}")
+                return translation
         
         # Return key as fallback if no translation found
-        logger.warning(f"No translation found for key '{key}' in languages {language_code}, {fallback_language}")
+        if first_miss:
+            logger.warning(f"No translation found for key '{key}' in languages {', '.join(chain)}")
         return key
     
     def get_translations_by_category(
         self, 
         category: str, 
         language_code: str = None
-    ) -> Dict[str, str]:
+    ) -> Mapping[str, str]:
         """
         Get all translations for a specific category.
         
@@ -97,24 +269,668 @@ class I18nService:
             language_code: Target language code
             
         Returns:
-            Dictionary of key-value translation pairs
+            Read-only mapping of key-value translation pairs
         """
-        if language_code is None:
-            language_code = self.DEFAULT_LANGUAGE
-        
-        if language_code not in self.SUPPORTED_LANGUAGES:
-            language_code = self.DEFAULT_LANGUAGE
+        language_code = self._normalize_language(language_code)
         
         # Load category translations if not cached
         if not self._is_category_cached(category, language_code):
             self._load_category_from_db(category, language_code)
         
-        # Return cached translations for the category
+        # Return the precomputed mapping for the category
+        return self._get_category_from_index(category, language_code)
+    
+    # Non-blocking API for async request handlers
+    
+    def lookup(
+        self,
+        key: str,
+        language_code: str = None,
+        fallback_language: str = None
+    ) -> str:
+        """
+        Get a translation from the in-memory snapshot without any I/O.
+        
+        On a miss the key's category is loaded in the background (when an
+        event loop is running) and the fallback translation or the key
+        itself is returned immediately.
+        
+        Args:
+            key: Translation key (e.g., 'ui.welcome')
+            language_code: Target language code (defaults to DEFAULT_LANGUAGE)
+            fallback_language: Fallback language instead of the FALLBACK_CHAINS entry
+            
+        Returns:
+            Translated string or the key itself if not cached yet
+        """
+        chain = self._resolve_chain(language_code, fallback_language)
+        language_code = chain[0]
+        
+        self._count_usage(key, language_code)
+        
+        effective = self._resolved.get(language_code) if fallback_language is None else None
+        if effective is not None:
+            return self._lookup_effective(effective, key, language_code)
+            
+        category = self._category_of(key)
+        for lang in chain:
+            translation = self._get_from_cache(key, lang)
+            if translation is not None:
+                return translation
+            if self._resolve_lookup_miss(key, category, lang) and lang == language_code:
+                logger.warning(f"No translation found for key '{key}' in language {language_code}")
+            
+        return key
+    
+    def format(self, key: str, language_code: str = None, /, **params: Any) -> str:
+        """
+        Get a translation with its arguments and plural forms filled in.
+        
+        The translation is compiled once per (key, language) and recompiled
+        only when its text changes, so hot paths never re-parse it.
+        
+        Args:
+            key: Translation key (e.g., 'farm.animal_count')
+            language_code: Target language code (defaults to DEFAULT_LANGUAGE)
+            **params: Argument values (e.g., count=3)
+            
+        Returns:
+            Formatted string, or the key itself if not cached yet
+        """
+        language_code = self._normalize_language(language_code)
+        text = self.lookup(key, language_code)
+        
+        cache_key = (key, language_code)
+        cached = self._formatters.get(cache_key)
+        if cached is None or (cached[0] is not text and cached[0] != text):
+            try:
+                compiled = compile_message(text, language_code)
+            except MessageFormatError as e:
+                logger.warning(f"Malformed translation for key '{key}' in {language_code}: {e}")
+                compiled = CompiledMessage((text,))
+                
+            if len(self._formatters) >= self.FORMATTER_CACHE_SIZE:
+                self._formatters.pop(next(iter(self._formatters)), None)
+            cached = self._formatters[cache_key] = (text, compiled)
+            
+        return cached[1].format(params)
+    
+    def get_cached_category(self, category: str, language_code: str = None) -> Mapping[str, str]:
+        """
+        Get cached translations for a category without any I/O.
+        
+        A background load is scheduled if the category is not cached yet.
+        
+        Args:
+            category: Translation category (e.g., 'ui', 'module')
+            language_code: Target language code
+            
+        Returns:
+            Read-only mapping of the category, empty until it has been loaded
+        """
+        language_code = self._normalize_language(language_code)
+        
+        if not self._is_category_cached(category, language_code):
+            self._schedule_category_load(category, language_code)
+            
+        return self._get_category_from_index(category, language_code)
+    
+    async def get_translation_async(
+        self,
+        key: str,
+        language_code: str = None,
+        fallback_language: str = None
+    ) -> str:
+        """
+        Get translation for a key, loading its category asynchronously on a miss.
+        
+        Args:
+            key: Translation key (e.g., 'ui.welcome')
+            language_code: Target language code (defaults to DEFAULT_LANGUAGE)
+            fallback_language: Fallback language instead of the FALLBACK_CHAINS entry
+            
+        Returns:
+            Translated string or the key itself if no translation found
+        """
+        chain = self._resolve_chain(language_code, fallback_language)
+        language_code = chain[0]
+        
+        self._count_usage(key, language_code)
+        
+        effective = self._resolved.get(language_code) if fallback_language is None else None
+        if effective is not None:
+            return self._lookup_effective(effective, key, language_code)
+            
+        category = self._category_of(key)
+        first_miss = False
+        for lang in chain:
+            translation = self._get_from_cache(key, lang)
+            if translation is None and not self._is_known_missing(key, lang):
+                if not self._is_category_complete(category, lang):
+                    await self.load_category(category, lang)
+                    translation = self._get_from_cache(key, lang)
+                if translation is None and self._remember_missing(key, lang) and lang == language_code:
+                    first_miss = True
+            if translation is not None:
+                return translation
+                
+        if first_miss:
+            logger.warning(f"No translation found for key '{key}' in languages {', '.join(chain)}")
+        return key
+    
+    async def get_translations_by_category_async(
+        self,
+        category: str,
+        language_code: str = None
+    ) -> Mapping[str, str]:
+        """
+        Get all translations for a category, loading them asynchronously if needed.
+        
+        Args:
+            category: Translation category (e.g., 'ui', 'module')
+            language_code: Target language code
+            
+        Returns:
+            Read-only mapping of key-value translation pairs
+        """
+        language_code = self._normalize_language(language_code)
+        
+        if not self._is_category_cached(category, language_code):
+            await self.load_category(category, language_code)
+            
+        return self._get_category_from_index(category, language_code)
+    
+    async def get_translations(
+        self,
+        keys: List[str],
+        languages: List[str] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Get translations for many keys in one or more languages.
+        
+        Every key that is neither cached nor known to be missing, in the
+        target language and its fallback chain, is resolved by a single
+        ``key IN (...) AND language_code IN (...)`` query.
+        
+        Args:
+            keys: Translation keys to resolve
+            languages: Target language codes (defaults to DEFAULT_LANGUAGE)
+            
+        Returns:
+            Dictionary of language code -> key -> translated string (or the key itself)
+        """
+        chains = [self._resolve_chain(lang, None) for lang in (languages or [self.DEFAULT_LANGUAGE])]
+        
+        # Collect (key, language) pairs that need the database
+        needed: Set[Tuple[str, str]] = set()
+        for chain in chains:
+            if chain[0] in self._resolved:
+                continue
+            for key in keys:
+                for lang in chain:
+                    if self._get_from_cache(key, lang) is not None:
+                        break
+                    needed.add((key, lang))
+                    
+        unresolved = set()
+        for key, lang in needed:
+            if self._is_known_missing(key, lang):
+                continue
+            if self._is_category_complete(self._category_of(key), lang):
+                self._remember_missing(key, lang)
+                continue
+            unresolved.add((key, lang))
+            
+        if unresolved:
+            await self._load_keys(unresolved)
+            
+        results: Dict[str, Dict[str, str]] = {}
+        for chain in chains:
+            effective = self._resolved.get(chain[0])
+            values = {}
+            for key in keys:
+                self._count_usage(key, chain[0])
+                if effective is not None:
+                    value = effective.get(key)
+                else:
+                    value = next((v for v in (self._get_from_cache(key, lang) for lang in chain) if v is not None), None)
+                values[key] = key if value is None else value
+            results[chain[0]] = values
+        return results
+    
+    async def load_category(self, category: str, language_code: str) -> Optional[int]:
+        """
+        Load all translations for a category using the async engine.
+        
+        Args:
+            category: Translation category to load
+            language_code: Language to load
+            
+        Returns:
+            Number of translations loaded, or None if the database could not be read
+        """
+        return await self._single_flight(
+            ("category", language_code, category),
+            lambda: self._fetch_category(category, language_code)
+        )
+    
+    async def load_language(self, language_code: str) -> Optional[int]:
+        """
+        Load all translations for a language using the async engine.
+        
+        Languages covered by the compiled catalog are not copied into memory.
+        
+        Args:
+            language_code: Language to load
+            
+        Returns:
+            Number of translations loaded, or None if the database could not be read
+        """
+        return await self._single_flight(
+            ("language", language_code),
+            lambda: self._fetch_language(language_code)
+        )
+    
+    async def _fetch_category(self, category: str, language_code: str) -> Optional[int]:
+        """Query and publish one category (callers go through load_category)."""
+        loaded = self._load_category_from_catalog(category, language_code)
+        if loaded is not None:
+            return loaded
+        return await self._query_category(category, language_code)
+    
+    async def _query_category(self, category: str, language_code: str) -> Optional[int]:
+        """Query and publish one category, bypassing the compiled catalog."""
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(Translation.key, Translation.value, Translation.category).where(
+                        self._category_clause(category),
+                        Translation.language_code == language_code
+                    )
+                )
+                rows = result.all()
+        except Exception as e:
+            logger.error(f"Error loading category {category} for {language_code}: {e}")
+            return None
+            
+        return self._publish_category(category, language_code, rows)
+    
+    async def _fetch_language(self, language_code: str) -> Optional[int]:
+        """Query and publish a whole language (callers go through load_language)."""
+        catalog = self._catalog
+        if catalog is not None and catalog.has_language(language_code):
+            logger.info(f"Serving {catalog.count(language_code)} translations for {language_code} from catalog")
+            return catalog.count(language_code)
+            
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(Translation.key, Translation.value, Translation.category).where(
+                        Translation.language_code == language_code
+                    )
+                )
+                rows = result.all()
+        except Exception as e:
+            logger.error(f"Error loading all translations for {language_code}: {e}")
+            return None
+            
+        self._publish_language(language_code, rows)
+        logger.debug(f"Loaded {len(rows)} translations for language {language_code}")
+        return len(rows)
+    
+    async def warm_up(
+        self,
+        languages: List[str] = None,
+        hot_categories: int = 0,
+        retry_interval: float = 0
+    ) -> Dict[str, int]:
+        """
+        Preload languages concurrently and mark the service as ready.
+        
+        The service only becomes ready once every language has loaded. A
+        language whose translations could not be read is logged and, when
+        retry_interval is set, loaded again until it succeeds.
+        
+        Args:
+            languages: Languages to preload (defaults to every language of every fallback chain)
+            hot_categories: Preload only this many most used categories per language,
+                whole languages are loaded when 0 or when no usage has been recorded
+            retry_interval: Seconds between attempts for failed languages (0 gives up after one)
+            
+        Returns:
+            Dictionary of language code -> number of translations loaded, without failed languages
+        """
+        languages = sorted(languages or self.get_chain_languages())
+        start = time.perf_counter()
+        
+        async def timed_load(language_code: str) -> Optional[int]:
+            language_start = time.perf_counter()
+            categories = await self.get_hot_categories(language_code, hot_categories) if hot_categories else []
+            if categories:
+                counts = await asyncio.gather(*(self.load_category(category, language_code) for category in categories))
+                loaded = None if None in counts else sum(counts)
+            else:
+                loaded = await self.load_language(language_code)
+            if loaded is None:
+                logger.error(f"Could not preload translations for {language_code}")
+                return None
+            self._warmup_timings[language_code] = time.perf_counter() - language_start
+            logger.info(
+                f"Preloaded {loaded} translations for {language_code} "
+                f"in {self._warmup_timings[language_code] * 1000:.1f} ms"
+            )
+            return loaded
+            
+        loaded: Dict[str, int] = {}
+        pending = languages
+        while True:
+            counts = await asyncio.gather(*(timed_load(lang) for lang in pending))
+            loaded.update((lang, count) for lang, count in zip(pending, counts) if count is not None)
+            pending = [lang for lang in pending if lang not in loaded]
+            self._warmup_failed = set(pending)
+            if not pending or retry_interval <= 0:
+                break
+            logger.warning(f"Retrying translation warmup for {', '.join(pending)} in {retry_interval} s")
+            await asyncio.sleep(retry_interval)
+            
+        if pending:
+            logger.error(f"Translation warmup failed for {', '.join(pending)}, not ready")
+            return dict(sorted(loaded.items()))
+            
+        self._ready = True
+        logger.info(
+            f"Translation warmup finished: {sum(loaded.values())} translations in {len(languages)} languages "
+            f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        return dict(sorted(loaded.items()))
+    
+    def is_ready(self) -> bool:
+        """Check if the startup warmup has finished."""
+        return self._ready
+    
+    def get_warmup_status(self) -> Dict:
+        """
+        Get the state of the startup warmup.
+        
+        Returns:
+            Dictionary with readiness, per-language load times in milliseconds
+            and the languages that failed to load
+        """
         return {
-            key: value for key, value in self._cache.get(language_code, {}).items()
-            if key.startswith(f"{category}.")
+            "ready": self._ready,
+            "failed": sorted(self._warmup_failed),
+            "languages": {
+                lang: round(seconds * 1000, 1) for lang, seconds in sorted(self._warmup_timings.items())
+            }
         }
     
+    def attach_catalog(self, path: str) -> bool:
+        """
+        Serve translations from a compiled catalog file.
+        
+        Args:
+            path: Path to a catalog built by scripts/build_translation_catalog.py
+            
+        Returns:
+            True if the catalog was attached, False if it could not be opened
+        """
+        catalog = self._open_catalog(path)
+        if catalog is None:
+            return False
+            
+        self._swap_catalog(catalog)
+        logger.info(f"Attached translation catalog {path} for languages {catalog.languages()}")
+        return True
+    
+    def detach_catalog(self) -> None:
+        """Stop serving translations from the compiled catalog."""
+        self._swap_catalog(None)
+    
+    async def sync_versions(self) -> int:
+        """
+        Reload the languages and categories changed by any worker.
+        
+        The first call only records the current version, so it should run
+        before translations are preloaded.
+        
+        Returns:
+            Number of changed scopes that were reloaded
+        """
+        await self._refresh_catalog()
+        
+        try:
+            async with AsyncSessionLocal() as session:
+                latest = (await session.execute(select(func.max(TranslationVersion.version)))).scalar() or 0
+                if self._version is not None and latest <= self._version:
+                    return 0
+                    
+                changed = []
+                if self._version is not None:
+                    result = await session.execute(
+                        select(TranslationVersion.language_code, TranslationVersion.category).where(
+                            TranslationVersion.version > self._version
+                        )
+                    )
+                    changed = result.all()
+        except Exception as e:
+            logger.error(f"Error checking translation versions: {e}")
+            return 0
+            
+        self._version = latest
+        for row in changed:
+            await self._reload_scope(row.language_code, row.category)
+            
+        if changed:
+            logger.info(f"Reloaded {len(changed)} changed translation scope(s), now at version {latest}")
+        return len(changed)
+    
+    async def watch_versions(self, interval: float) -> None:
+        """
+        Poll for translation changes until cancelled.
+        
+        Args:
+            interval: Seconds between version checks
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self.sync_versions()
+    
+    async def invalidate(self, language_code: str = None) -> None:
+        """
+        Mark whole languages as changed so every worker reloads them.
+        
+        Args:
+            language_code: Language to invalidate (invalidates all if None)
+        """
+        languages = [language_code] if language_code else sorted(self.get_chain_languages())
+        try:
+            async with AsyncSessionLocal() as session:
+                for lang in languages:
+                    await session.run_sync(bump_translation_version, lang)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Error invalidating translations for {languages}: {e}")
+    
+    async def get_changes(self, since: int, language_code: str = None) -> Dict:
+        """
+        Get translations added, changed or deleted since a catalog version.
+        
+        Only scopes stamped after ``since`` are scanned, for rows updated
+        after that version was stamped (less CHANGES_OVERLAP). The overlap
+        may repeat a few unchanged rows, so clients must apply changes
+        idempotently. Deletions come from tombstones stamped with their
+        exact version. A ``since`` of 0, or one newer than the catalog,
+        returns every translation.
+        
+        Args:
+            since: Catalog version the client last synced
+            language_code: Language to sync (syncs all if None)
+            
+        Returns:
+            Dictionary with the current version, and changed and deleted keys
+            grouped by language and category
+        """
+        async with AsyncSessionLocal() as session:
+            version = (await session.execute(select(func.max(TranslationVersion.version)))).scalar() or 0
+            reset = since <= 0 or since > version
+            changes = {"version": version, "since": since, "reset": reset, "changed": {}, "deleted": {}}
+            if since == version:
+                return changes
+                
+            changed = select(Translation.language_code, Translation.category, Translation.key, Translation.value)
+            if language_code:
+                changed = changed.where(Translation.language_code == language_code)
+                
+            if not reset:
+                scopes = select(TranslationVersion.language_code, TranslationVersion.category).where(
+                    TranslationVersion.version > since
+                )
+                if language_code:
+                    scopes = scopes.where(TranslationVersion.language_code == language_code)
+                conditions = [
+                    Translation.language_code == row.language_code if row.category == TranslationVersion.ALL_CATEGORIES
+                    else and_(Translation.language_code == row.language_code, Translation.category == row.category)
+                    for row in await session.execute(scopes)
+                ]
+                changed = changed.where(or_(false(), *conditions))
+                
+                # Newest stamp that survives from before ``since``; older stamps only widen the scan
+                synced_at = (await session.execute(
+                    select(func.max(TranslationVersion.updated_at)).where(TranslationVersion.version <= since)
+                )).scalar()
+                if synced_at is not None:
+                    changed = changed.where(Translation.updated_at > synced_at - self.CHANGES_OVERLAP)
+                    
+                deleted = select(
+                    TranslationTombstone.language_code, TranslationTombstone.category, TranslationTombstone.key
+                ).where(TranslationTombstone.version > since)
+                if language_code:
+                    deleted = deleted.where(TranslationTombstone.language_code == language_code)
+                for row in await session.execute(deleted):
+                    changes["deleted"].setdefault(row.language_code, {}).setdefault(row.category, []).append(row.key)
+                    
+            for row in await session.execute(changed):
+                changes["changed"].setdefault(row.language_code, {}).setdefault(row.category, {})[row.key] = row.value
+                
+        return changes
+    
+    async def flush_usage(self) -> int:
+        """
+        Add the sampled usage counts to the usage table.
+        
+        Counts that cannot be written are kept and retried on the next flush.
+        
+        Returns:
+            Number of (key, language) counters written
+        """
+        usage, self._usage = self._usage, {}
+        if not usage:
+            return 0
+            
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.run_sync(record_translation_usage, usage, datetime.utcnow())
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Error flushing translation usage: {e}")
+            for pair, hits in usage.items():
+                self._usage[pair] = self._usage.get(pair, 0) + hits
+            return 0
+            
+        logger.debug(f"Flushed usage of {len(usage)} translation keys")
+        return len(usage)
+    
+    async def watch_usage(self, interval: float) -> None:
+        """
+        Flush usage counts periodically until cancelled.
+        
+        Args:
+            interval: Seconds between flushes
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush_usage()
+    
+    async def get_hot_categories(self, language_code: str, limit: int) -> List[str]:
+        """
+        Get the most used categories of a language.
+        
+        Args:
+            language_code: Language to rank categories for
+            limit: Maximum number of categories
+            
+        Returns:
+            Category names ordered by recorded hits, empty if nothing was recorded
+        """
+        try:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    select(TranslationUsage.category)
+                    .where(TranslationUsage.language_code == language_code)
+                    .group_by(TranslationUsage.category)
+                    .order_by(func.sum(TranslationUsage.hits).desc(), TranslationUsage.category)
+                    .limit(limit)
+                )
+                return list(result.scalars())
+        except Exception as e:
+            logger.error(f"Error ranking categories for {language_code}: {e}")
+            return []
+    
+    async def get_usage_report(self, language_code: str, limit: int = 20) -> Dict:
+        """
+        Report the hottest and the never used translation keys of a language.
+        
+        Pending samples are flushed first so the report includes this worker.
+        
+        Args:
+            language_code: Language to report on
+            limit: Maximum number of keys in each list
+            
+        Returns:
+            Dictionary with hot keys, hot categories and never-hit keys
+        """
+        await self.flush_usage()
+        
+        never_hit = select(Translation.key).outerjoin(
+            TranslationUsage,
+            and_(
+                TranslationUsage.key == Translation.key,
+                TranslationUsage.language_code == Translation.language_code
+            )
+        ).where(
+            Translation.language_code == language_code,
+            TranslationUsage.id.is_(None)
+        )
+        
+        async with AsyncSessionLocal() as session:
+            hot_keys = await session.execute(
+                select(TranslationUsage.key, TranslationUsage.hits, TranslationUsage.last_hit_at)
+                .where(TranslationUsage.language_code == language_code)
+                .order_by(TranslationUsage.hits.desc(), TranslationUsage.key)
+                .limit(limit)
+            )
+            hot_categories = await session.execute(
+                select(TranslationUsage.category, func.sum(TranslationUsage.hits).label("hits"))
+                .where(TranslationUsage.language_code == language_code)
+                .group_by(TranslationUsage.category)
+                .order_by(func.sum(TranslationUsage.hits).desc(), TranslationUsage.category)
+                .limit(limit)
+            )
+            never_hit_keys = await session.execute(never_hit.order_by(Translation.key).limit(limit))
+            never_hit_count = await session.execute(select(func.count()).select_from(never_hit.subquery()))
+            
+            return {
+                "language": language_code,
+                "sample_rate": self.USAGE_SAMPLE_RATE,
+                "hot_keys": [
+                    {"key": row.key, "hits": row.hits, "last_hit_at": row.last_hit_at.isoformat()}
+                    for row in hot_keys
+                ],
+                "hot_categories": [{"category": row.category, "hits": row.hits} for row in hot_categories],
+                "never_hit_keys": list(never_hit_keys.scalars()),
+                "never_hit_count": never_hit_count.scalar_one()
+            }
+    
     def get_available_languages(self) -> List[str]:
         """
         Get list of available languages.
@@ -134,7 +950,23 @@ class I18nService:
         Returns:
             True if language is supported, False otherwise
         """
-        return language_code in self.SUPPORTED_LANGUAGES
+        return language_code in self.SUPPORTED_LANGUAGES or language_code in self.FALLBACK_CHAINS
+    
+    def get_fallback_chain(self, language_code: str) -> Tuple[str, ...]:
+        """
+        Get the languages consulted, in order, for a language.
+        
+        Args:
+            language_code: Language code (region variants such as 'zh-TW' included)
+            
+        Returns:
+            Tuple starting with the language itself
+        """
+        return self.FALLBACK_CHAINS.get(language_code, (language_code,))
+    
+    def get_chain_languages(self) -> Set[str]:
+        """Get every supported language and region variant used in a fallback chain."""
+        return set(self.SUPPORTED_LANGUAGES).union(*self.FALLBACK_CHAINS.values())
     
     def detect_language_from_header(self, accept_language: str) -> str:
         """
@@ -180,12 +1012,17 @@ class I18nService:
         Preload all translations for a language into cache.
         
         Args:
-            language_code: Language to preload (defaults to all supported languages)
+            language_code: Language to preload (defaults to every language of every fallback chain)
         """
-        languages_to_load = [language_code] if language_code else self.SUPPORTED_LANGUAGES
+        languages_to_load = [language_code] if language_code else sorted(self.get_chain_languages())
         
         for lang in languages_to_load:
-            if lang not in self.SUPPORTED_LANGUAGES:
+            if not self.is_language_supported(lang):
+                continue
+                
+            catalog = self._catalog
+            if catalog is not None and catalog.has_language(lang):
+                logger.info(f"Serving translations for language {lang} from catalog")
                 continue
                 
             if lang not in self._cache_loaded:
@@ -200,14 +1037,29 @@ class I18nService:
         Args:
             language_code: Specific language to clear (clears all if None)
         """
-        if language_code:
-            self._cache.pop(language_code, None)
-            self._cache_loaded.discard(language_code)
-            logger.info(f"Cleared cache for language: {language_code}")
-        else:
-            self._cache.clear()
-            self._cache_loaded.clear()
-            logger.info("Cleared all translation cache")
+        with self._write_lock:
+            if language_code:
+                snapshot = dict(self._cache)
+                snapshot.pop(language_code, None)
+                self._cache = MappingProxyType(snapshot)
+                self._overlays.pop(language_code, None)
+                index = dict(self._categories)
+                index.pop(language_code, None)
+                self._categories = MappingProxyType(index)
+                self._cache_loaded.discard(language_code)
+                self._refresh_resolved(language_code)
+                for missing_key in [k for k in list(self._missing) if k[1] == language_code]:
+                    del self._missing[missing_key]
+                logger.info(f"Cleared cache for language: {language_code}")
+            else:
+                self._cache = MappingProxyType({})
+                self._overlays.clear()
+                self._categories = MappingProxyType({})
+                self._resolved = MappingProxyType({})
+                self._cache_loaded.clear()
+                self._formatters.clear()
+                self._missing.clear()
+                logger.info("Cleared all translation cache")
     
     def get_cache_stats(self) -> Dict[str, int]:
         """
@@ -216,36 +1068,576 @@ class I18nService:
         Returns:
             Dictionary with cache statistics
         """
-        total_translations = sum(len(translations) for translations in self._cache.values())
+        snapshot = self._cache
+        overlays = {language_code: tuple(overlay) for language_code, overlay in tuple(self._overlays.items())}
+        overlay_translations = sum(len(overlay) for overlay in overlays.values())
+        total_translations = sum(len(translations) for translations in snapshot.values()) + sum(
+            sum(1 for key in overlay if key not in snapshot.get(language_code, _EMPTY_MAPPING))
+            for language_code, overlay in overlays.items()
+        )
+        catalog = self._catalog
         return {
-            "cached_languages": len(self._cache),
+            "cached_languages": len(set(snapshot) | set(overlays)),
             "total_cached_translations": total_translations,
-            "preloaded_languages": len(self._cache_loaded)
+            "overlay_translations": overlay_translations,
+            "preloaded_languages": len(self._cache_loaded),
+            "resolved_languages": len(self._resolved),
+            "compiled_formatters": len(self._formatters),
+            "indexed_categories": sum(len(categories) for categories in self._categories.values()),
+            "negative_cached_keys": len(self._missing),
+            "negative_cache_hits": self._missing_hits,
+            "catalog_languages": len(catalog.languages()) if catalog else 0,
+            "catalog_translations": sum(catalog.count(lang) for lang in catalog.languages()) if catalog else 0,
+            "coalesced_language_loads": self._coalesced["language"],
+            "coalesced_category_loads": self._coalesced["category"],
+            "coalesced_key_loads": self._coalesced["key"],
+            "pending_usage_keys": len(self._usage)
         }
     
     # Private methods
     
     def _get_from_cache(self, key: str, language_code: str) -> Optional[str]:
-        """Get translation from cache."""
-        return self._cache.get(language_code, {}).get(key)
+        """Get translation from the overlay, the snapshot, then the compiled catalog."""
+        # The overlay is read first: a load merges it into the snapshot before dropping it
+        translation = self._overlays.get(language_code, _EMPTY_MAPPING).get(key)
+        if translation is None:
+            translation = self._cache.get(language_code, _EMPTY_MAPPING).get(key)
+        if translation is None:
+            # Read once: a concurrent detach or rebuild swaps the attribute
+            catalog = self._catalog
+            if catalog is not None:
+                translation = catalog.get(key, language_code)
+        return translation
+    
+    def _layers(self, language_code: str) -> Tuple[Mapping[str, str], Mapping[str, str]]:
+        """Get the overlay and snapshot of a language, in lookup order."""
+        return self._overlays.get(language_code, _EMPTY_MAPPING), self._cache.get(language_code, _EMPTY_MAPPING)
     
     def _cache_translation(self, key: str, language_code: str, value: str) -> None:
         """Cache a translation."""
-        if language_code not in self._cache:
-            self._cache[language_code] = {}
-        self._cache[language_code][key] = value
+        self._publish(language_code, {key: value})
+    
+    def _publish(
+        self,
+        language_code: str,
+        translations: Dict[str, str],
+        categories: Optional[Dict[str, Dict[str, str]]] = None,
+        replace: bool = False
+    ) -> None:
+        """
+        Merge translations into a new snapshot and swap it in atomically.
+        
+        Single keys only go to the language's overlay. Category and language
+        loads also merge the overlay into the new snapshot and drop it.
+        
+        Args:
+            language_code: Language the translations belong to
+            translations: Key-value pairs to merge into the snapshot
+            categories: Complete contents of categories that were fully loaded
+            replace: Drop every cached translation of the language not in ``translations``
+        """
+        with self._write_lock:
+            if not categories and not replace:
+                self._publish_keys(language_code, translations)
+                return
+                
+            merged = {} if replace else dict(self._cache.get(language_code, _EMPTY_MAPPING).items())
+            if not replace:
+                merged.update(
+                    (key, value) for key, value in self._overlays.get(language_code, _EMPTY_MAPPING).items()
+                    if self._category_of(key) not in categories
+                )
+                # Keys dropped from a reloaded category, or under its prefix, are no longer served
+                previous_index = self._categories.get(language_code, _EMPTY_MAPPING)
+                for category, values in categories.items():
+                    for key in previous_index.get(category, _EMPTY_MAPPING):
+                        if key not in values:
+                            merged.pop(key, None)
+                for key in [k for k in merged if k not in translations and self._category_of(k) in categories]:
+                    del merged[key]
+            merged.update(translations)
+            snapshot = dict(self._cache)
+            snapshot[language_code] = self._freeze(merged)
+            self._cache = MappingProxyType(snapshot)
+            self._overlays.pop(language_code, None)
+            
+            language_index = {} if replace else dict(self._categories.get(language_code, _EMPTY_MAPPING))
+            for category, values in categories.items():
+                language_index[category] = self._freeze(dict(values))
+            index = dict(self._categories)
+            index[language_code] = MappingProxyType(language_index)
+            self._categories = MappingProxyType(index)
+                
+            self._refresh_resolved(language_code)
+            
+            if self._missing:
+                for key in translations:
+                    self._missing.pop((key, language_code), None)
+    
+    def _publish_keys(self, language_code: str, translations: Dict[str, str]) -> None:
+        """Write single keys to a language's overlay (``_write_lock`` must be held)."""
+        overlay = self._overlays.get(language_code)
+        if overlay is None:
+            overlay = self._overlays[language_code] = {}
+        overlay.update(translations)
+        
+        # Keep fully loaded categories in sync, they only miss keys written after their load
+        language_index = self._categories.get(language_code, _EMPTY_MAPPING)
+        updated: Dict[str, Dict[str, str]] = {}
+        for key, value in translations.items():
+            category = self._category_of(key)
+            if category in language_index:
+                updated.setdefault(category, dict(language_index[category].items()))[key] = value
+        if updated:
+            language_index = dict(language_index)
+            for category, values in updated.items():
+                language_index[category] = self._freeze(values)
+            index = dict(self._categories)
+            index[language_code] = MappingProxyType(language_index)
+            self._categories = MappingProxyType(index)
+            
+        if language_code in self._cache_loaded:
+            self._refresh_resolved(language_code, translations)
+            
+        if self._missing:
+            for key in translations:
+                self._missing.pop((key, language_code), None)
+    
+    def _refresh_resolved(self, language_code: str, translations: Optional[Dict[str, str]] = None) -> None:
+        """
+        Rebuild the effective dictionaries of every chain containing a language.
+        
+        Must be called with ``_write_lock`` held. A chain is only resolved when
+        all of its languages are fully loaded, so a miss in it is definitive.
+        Compact stores resolve chains to live views, which never need rebuilding.
+        
+        Args:
+            language_code: Language whose translations changed
+            translations: Translations merged by a single-key update, or None to rebuild from scratch
+        """
+        resolved = dict(self._resolved)
+        for dependent, chain in self.FALLBACK_CHAINS.items():
+            if language_code not in chain:
+                continue
+            if not all(lang in self._cache_loaded for lang in chain):
+                resolved.pop(dependent, None)
+                continue
+                
+            if not self._merge_chains:
+                if dependent not in resolved:
+                    resolved[dependent] = _ResolvedChain(chain, self._layers)
+                continue
+                
+            if translations is not None and dependent in resolved:
+                # Only keys without a translation earlier in the chain change
+                earlier = [layer for lang in chain[:chain.index(language_code)] for layer in self._layers(lang)]
+                effective = dict(resolved[dependent].items())
+                for key, value in translations.items():
+                    if not any(key in layer for layer in earlier):
+                        effective[key] = value
+            else:
+                effective = {}
+                for lang in reversed(chain):
+                    for layer in reversed(self._layers(lang)):
+                        effective.update(layer.items())
+            resolved[dependent] = self._freeze(effective)
+        self._resolved = MappingProxyType(resolved)
+    
+    def _count_usage(self, key: str, language_code: str) -> None:
+        """Count a lookup towards the next usage sample."""
+        self._usage_countdown -= 1
+        if self._usage_countdown <= 0:
+            self._sample_usage(key, language_code)
+    
+    def _sample_usage(self, key: str, language_code: str) -> None:
+        """Count a sampled lookup as USAGE_SAMPLE_RATE hits and schedule the next sample."""
+        pair = (key, language_code)
+        self._usage[pair] = self._usage.get(pair, 0) + self.USAGE_SAMPLE_RATE
+        self._reset_usage_countdown()
+    
+    def _reset_usage_countdown(self) -> None:
+        """Pick the number of lookups until the next sample, USAGE_SAMPLE_RATE on average."""
+        rate = self.USAGE_SAMPLE_RATE
+        self._usage_countdown = random.randint(1, 2 * rate - 1) if rate > 0 else sys.maxsize
+    
+    def _lookup_effective(self, effective: Mapping[str, str], key: str, language_code: str) -> str:
+        """Look up a key in a resolved chain, where a miss means no language has it."""
+        translation = effective.get(key)
+        if translation is not None:
+            return translation
+            
+        if not self._is_known_missing(key, language_code) and self._remember_missing(key, language_code):
+            logger.warning(f"No translation found for key '{key}' in languages {', '.join(self.get_fallback_chain(language_code))}")
+        return key
+    
+    async def _single_flight(self, flight_key: Tuple[str, ...], load: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a load, or wait for the identical load that is already in flight.
+        
+        Waiters are shielded, so a cancelled request never cancels the load
+        other requests are waiting for.
+        """
+        task = self._in_flight.get(flight_key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self._coalesced[flight_key[0]] += 1
+            return await asyncio.shield(task)
+            
+        task = asyncio.ensure_future(load())
+        self._track_flight(flight_key, task)
+        return await asyncio.shield(task)
+    
+    def _track_flight(self, flight_key: Tuple[str, ...], task: asyncio.Future) -> None:
+        """Register an in-flight load until it completes."""
+        self._in_flight[flight_key] = task
+        
+        def untrack(_):
+            if self._in_flight.get(flight_key) is task:
+                del self._in_flight[flight_key]
+                
+        task.add_done_callback(untrack)
+    
+    def _single_flight_sync(self, flight_key: Tuple[str, ...], load: Callable[[], T]) -> T:
+        """Blocking counterpart of _single_flight for threadpool callers."""
+        with self._flight_lock:
+            flight = self._sync_flights.get(flight_key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._sync_flights[flight_key] = _Flight()
+            else:
+                self._coalesced[flight_key[0]] += 1
+                
+        if not is_leader:
+            flight.done.wait()
+            return flight.result
+            
+        try:
+            flight.result = load()
+        finally:
+            with self._flight_lock:
+                del self._sync_flights[flight_key]
+            flight.done.set()
+        return flight.result
+    
+    async def _load_keys(self, pairs: Set[Tuple[str, str]]) -> None:
+        """Load (key, language) pairs, sharing any that another request is already loading."""
+        loop = asyncio.get_running_loop()
+        pending = set()
+        own = set()
+        for key, lang in pairs:
+            task = self._in_flight.get(("key", lang, key))
+            if task is not None and task.get_loop() is loop:
+                pending.add(task)
+                self._coalesced["key"] += 1
+            else:
+                own.add((key, lang))
+                
+        if own:
+            task = asyncio.ensure_future(self._fetch_keys(own))
+            for key, lang in own:
+                self._track_flight(("key", lang, key), task)
+            pending.add(task)
+            
+        await asyncio.shield(asyncio.gather(*pending))
+    
+    async def _fetch_keys(self, pairs: Set[Tuple[str, str]]) -> None:
+        """Load (key, language) pairs with one IN query per chunk and publish them."""
+        keys = sorted({key for key, _ in pairs})
+        languages = sorted({lang for _, lang in pairs})
+        found: Dict[str, Dict[str, str]] = {}
+        
+        try:
+            async with AsyncSessionLocal() as session:
+                for start in range(0, len(keys), self.BULK_QUERY_CHUNK_SIZE):
+                    chunk = keys[start:start + self.BULK_QUERY_CHUNK_SIZE]
+                    result = await session.execute(
+                        select(Translation.key, Translation.language_code, Translation.value).where(
+                            Translation.key.in_(chunk),
+                            Translation.language_code.in_(languages)
+                        )
+                    )
+                    for row in result:
+                        found.setdefault(row.language_code, {})[row.key] = row.value
+        except Exception as e:
+            logger.error(f"Error loading {len(keys)} translations for {languages}: {e}")
+            return
+            
+        for lang, translations in found.items():
+            self._publish(lang, translations)
+            
+        new_misses = [
+            (key, lang) for key, lang in pairs
+            if key not in found.get(lang, _EMPTY_MAPPING) and self._remember_missing(key, lang)
+        ]
+        if new_misses:
+            logger.warning(f"No translation found for {len(new_misses)} key(s): {sorted(new_misses)[:10]}")
+    
+    @classmethod
+    def _category_clause(cls, category: str):
+        """
+        Match the rows of a category plus every row whose key derives that category.
+        
+        A key may be stored under another category than its prefix, but
+        misses are judged by ``_category_of``. Loading the prefix matches
+        too makes a loaded category proof that a key with its prefix is missing.
+        """
+        derived = Translation.key.startswith(f"{category}.", autoescape=True)
+        if category == cls._category_of("general"):
+            derived = or_(derived, ~Translation.key.contains("."))
+        return or_(Translation.category == category, derived)
+    
+    def _publish_category(self, category: str, language_code: str, rows) -> int:
+        """Publish rows loaded by ``_category_clause``, indexing only those stored under the category."""
+        translations = {row.key: row.value for row in rows}
+        values = {row.key: row.value for row in rows if row.category == category}
+        self._publish(language_code, translations, {category: values})
+        logger.debug(f"Loaded {len(values)} translations for category '{category}' in {language_code}")
+        return len(values)
+    
+    def _publish_language(self, language_code: str, rows) -> None:
+        """Publish every translation of a language and mark it fully loaded."""
+        translations: Dict[str, str] = {}
+        categories: Dict[str, Dict[str, str]] = {}
+        for row in rows:
+            translations[row.key] = row.value
+            categories.setdefault(row.category, {})[row.key] = row.value
+            
+        self._publish(language_code, translations, categories, replace=True)
+        with self._write_lock:
+            self._cache_loaded.add(language_code)
+            self._refresh_resolved(language_code)
+    
+    def _get_category_from_index(self, category: str, language_code: str) -> Mapping[str, str]:
+        """Get the precomputed mapping for a category, empty if not loaded."""
+        return self._categories.get(language_code, _EMPTY_MAPPING).get(category, _EMPTY_MAPPING)
+    
+    def forget_missing(self, key: str, language_code: str) -> None:
+        """
+        Drop a (key, language) pair from the negative cache.
+        
+        Called whenever a translation is written so the next lookup sees it.
+        
+        Args:
+            key: Translation key that was written
+            language_code: Language of the written translation
+        """
+        self._missing.pop((key, language_code), None)
+    
+    def _is_known_missing(self, key: str, language_code: str) -> bool:
+        """Check the negative cache for an unexpired miss."""
+        expires_at = self._missing.get((key, language_code))
+        if expires_at is None:
+            return False
+            
+        if expires_at < time.monotonic():
+            self._missing.pop((key, language_code), None)
+            return False
+            
+        self._missing_hits += 1
+        return True
+    
+    def _remember_missing(self, key: str, language_code: str) -> bool:
+        """
+        Record a miss in the negative cache.
+        
+        Returns:
+            True if the miss was not already known (callers only log then)
+        """
+        missing_key = (key, language_code)
+        with self._write_lock:
+            is_new = missing_key not in self._missing
+            self._missing[missing_key] = time.monotonic() + self.NEGATIVE_CACHE_TTL
+            self._missing.move_to_end(missing_key)
+            while len(self._missing) > self.NEGATIVE_CACHE_SIZE:
+                self._missing.popitem(last=False)
+        return is_new
+    
+    def _resolve_lookup_miss(self, key: str, category: str, language_code: str) -> bool:
+        """
+        Handle a snapshot miss without blocking.
+        
+        Returns:
+            True if the key was just recorded as missing for the first time
+        """
+        if self._is_known_missing(key, language_code):
+            return False
+            
+        if self._is_category_complete(category, language_code):
+            return self._remember_missing(key, language_code)
+            
+        self._schedule_category_load(category, language_code)
+        return False
+    
+    def _normalize_language(self, language_code: Optional[str]) -> str:
+        """Return a supported language code, defaulting when missing or unsupported."""
+        if language_code is None or not self.is_language_supported(language_code):
+            return self.DEFAULT_LANGUAGE
+        return language_code
+    
+    def _resolve_chain(
+        self,
+        language_code: Optional[str],
+        fallback_language: Optional[str]
+    ) -> Tuple[str, ...]:
+        """Resolve the languages to consult, in order, for a lookup."""
+        if language_code is None:
+            language_code = self.DEFAULT_LANGUAGE
+            
+        # Validate language code
+        if not self.is_language_supported(language_code):
+            logger.warning(f"Unsupported language code: {language_code}, using default")
+            language_code = self.DEFAULT_LANGUAGE
+            
+        if fallback_language is None:
+            return self.get_fallback_chain(language_code)
+        if fallback_language == language_code:
+            return (language_code,)
+        return (language_code, fallback_language)
+    
+    @staticmethod
+    def _category_of(key: str) -> str:
+        """Derive the category of a translation key from its prefix."""
+        return key.split(".", 1)[0] if "." in key else "general"
+    
+    def _schedule_category_load(self, category: str, language_code: str) -> None:
+        """Load a category in the background if an event loop is running."""
+        if not self.is_language_supported(language_code):
+            return
+            
+        load_key = (language_code, category)
+        if load_key in self._background_loads:
+            return
+            
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+            
+        task = loop.create_task(self.load_category(category, language_code))
+        self._background_loads[load_key] = task
+        task.add_done_callback(lambda _: self._background_loads.pop(load_key, None))
     
     def _is_category_cached(self, category: str, language_code: str) -> bool:
         """Check if a category is fully cached for a language."""
-        if language_code not in self._cache:
-            return False
+        if language_code in self._cache_loaded:
+            return True
+        return category in self._categories.get(language_code, _EMPTY_MAPPING)
+    
+    async def _reload_scope(self, language_code: str, category: str) -> None:
+        """Replace the cached translations of a changed language or category."""
+        if not self.is_language_supported(language_code):
+            return
+            
+        reloaded = None
+        if category == TranslationVersion.ALL_CATEGORIES:
+            if language_code in self._cache_loaded:
+                # Replaced atomically once loaded, readers never see the language empty
+                await self.load_language(language_code)
+                return
+            
+            # Swap in the fully cached categories first, then drop the other single keys
+            reloaded = list(self._categories.get(language_code, _EMPTY_MAPPING))
+            for cached_category in reloaded:
+                await self.load_category(cached_category, language_code)
+                
+        elif self._is_category_cached(category, language_code):
+            # Swapped in atomically, readers never see the category empty
+            await self.load_category(category, language_code)
+            return
+        
+        # Only single keys are cached: drop them so they are looked up again
+        with self._write_lock:
+            cached = dict(self._cache.get(language_code, _EMPTY_MAPPING).items())
+            cached.update(self._overlays.get(language_code, _EMPTY_MAPPING))
+            if reloaded is None:
+                kept = {key: value for key, value in cached.items() if self._category_of(key) != category}
+            else:
+                kept = {key: value for key, value in cached.items() if self._category_of(key) in reloaded}
+            snapshot = dict(self._cache)
+            snapshot[language_code] = self._freeze(kept)
+            self._cache = MappingProxyType(snapshot)
+            self._overlays.pop(language_code, None)
+            self._refresh_resolved(language_code)
+            for missing_key in [k for k in self._missing if k[1] == language_code]:
+                del self._missing[missing_key]
+    
+    def _open_catalog(self, path: str) -> Optional[TranslationCatalog]:
+        """Open a compiled catalog, logging instead of raising if it cannot be read."""
+        try:
+            return TranslationCatalog(path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error opening translation catalog {path}: {e}")
+            return None
+    
+    def _swap_catalog(self, catalog: Optional[TranslationCatalog]) -> None:
+        """
+        Serve lookups from another catalog (or none).
+        
+        The replaced catalog is not closed: lookups running in other threads
+        may still read it, and its file is unmapped once the last of them
+        drops its reference.
+        """
+        with self._write_lock:
+            self._catalog = catalog
+            self._missing.clear()
+    
+    async def _refresh_catalog(self) -> None:
+        """Re-open the compiled catalog if its file has been rebuilt."""
+        catalog = self._catalog
+        if catalog is None or not catalog.is_stale():
+            return
+            
+        rebuilt = self._open_catalog(catalog.path)
+        if rebuilt is None:
+            return
         
-        # Simple heuristic: if we have any translations for this category, assume it's cached
-        # In a production system, you might want to track this more precisely
-        return any(key.startswith(f"{category}.") for key in self._cache[language_code])
+        # Republish categories copied from the old file before the new one is served, so they never go cold
+        for lang in set(catalog.languages()) | set(rebuilt.languages()):
+            for category in list(self._categories.get(lang, _EMPTY_MAPPING)):
+                if rebuilt.has_language(lang):
+                    translations = rebuilt.get_category(category, lang)
+                    self._publish(lang, translations, {category: translations})
+                else:
+                    await self._query_category(category, lang)
+                    
+        self._swap_catalog(rebuilt)
+        logger.info(f"Re-opened rebuilt translation catalog {rebuilt.path} for languages {rebuilt.languages()}")
+    
+    def _is_category_complete(self, category: str, language_code: str) -> bool:
+        """Check if a cache or catalog miss means the key has no translation."""
+        catalog = self._catalog
+        if catalog is not None and catalog.has_language(language_code):
+            return True
+        return self._is_category_cached(category, language_code)
+    
+    def _load_category_from_catalog(self, category: str, language_code: str) -> Optional[int]:
+        """
+        Publish a category from the compiled catalog.
+        
+        Returns:
+            Number of translations loaded, or None if the catalog does not cover the language
+        """
+        catalog = self._catalog
+        if catalog is None or not catalog.has_language(language_code):
+            return None
+            
+        translations = catalog.get_category(category, language_code)
+        self._publish(language_code, translations, {category: translations})
+        return len(translations)
     
     def _load_translation_from_db(self, key: str, language_code: str) -> Optional[str]:
-        """Load a single translation from database."""
+        """Load a single translation from database, coalescing concurrent misses."""
+        return self._single_flight_sync(
+            ("key", language_code, key),
+            lambda: self._fetch_translation_from_db(key, language_code)
+        )
+    
+    def _fetch_translation_from_db(self, key: str, language_code: str) -> Optional[str]:
+        """Query a single translation from database."""
+        catalog = self._catalog
+        if catalog is not None and catalog.has_language(language_code):
+            # The catalog is authoritative for the languages it contains
+            return None
+            
         session = SessionLocal()
         try:
             translation = session.query(Translation).filter(
@@ -262,18 +1654,25 @@ class I18nService:
             session.close()
     
     def _load_category_from_db(self, category: str, language_code: str) -> None:
-        """Load all translations for a category from database."""
+        """Load all translations for a category from database, coalescing concurrent misses."""
+        self._single_flight_sync(
+            ("category", language_code, category),
+            lambda: self._fetch_category_from_db(category, language_code)
+        )
+    
+    def _fetch_category_from_db(self, category: str, language_code: str) -> None:
+        """Query and publish all translations for a category from database."""
+        if self._load_category_from_catalog(category, language_code) is not None:
+            return
+            
         session = SessionLocal()
         try:
             translations = session.query(Translation).filter(
-                Translation.category == category,
+                self._category_clause(category),
                 Translation.language_code == language_code
             ).all()
             
-            for translation in translations:
-                self._cache_translation(translation.key, language_code, translation.value)
-                
-            logger.debug(f"Loaded {len(translations)} translations for category '{category}' in {language_code}")
+            self._publish_category(category, language_code, translations)
             
         except Exception as e:
             logger.error(f"Error loading category {category} for {language_code}: {e}")
@@ -288,8 +1687,7 @@ class I18nService:
                 Translation.language_code == language_code
             ).all()
             
-            for translation in translations:
-                self._cache_translation(translation.key, language_code, translation.value)
+            self._publish_language(language_code, translations)
                 
             logger.info(f"Loaded {len(translations)} translations for language {language_code}")
             
@@ -312,10 +1710,228 @@ def get_i18n_service() -> I18nService:
     """
     global _i18n_service
     if _i18n_service is None:
-        _i18n_service = I18nService()
+        settings = get_settings()
+        _i18n_service = I18nService(store=settings.translation_store)
+        catalog_path = settings.translation_catalog_path
+        if catalog_path:
+            _i18n_service.attach_catalog(catalog_path)
     return _i18n_service
 
 
+@event.listens_for(Translation, "after_insert")
+@event.listens_for(Translation, "after_update")
+def _forget_missing_translation(mapper, connection, target: Translation) -> None:
+    """Invalidate the negative cache entry for a translation written through the ORM."""
+    if _i18n_service is not None:
+        _i18n_service.forget_missing(target.key, target.language_code)
+
+
+def seed_translation_version_counter(connection) -> None:
+    """
+    Create the catalog version counter row unless it already exists.
+    
+    The counter continues from the highest existing stamp. Concurrent
+    seeders do not conflict: all but the first insert are skipped.
+    
+    Args:
+        connection: Connection whose transaction creates the row
+    """
+    table = TranslationVersion.__table__
+    counter = TranslationVersionCounter.__table__
+    values = {
+        "id": TranslationVersionCounter.ROW_ID,
+        "version": connection.execute(select(func.coalesce(func.max(table.c.version), 0))).scalar_one()
+    }
+    seed_insert = _COUNTER_SEED_INSERTS.get(connection.dialect.name)
+    if seed_insert is None:
+        if connection.execute(select(counter.c.id).where(counter.c.id == values["id"])).first() is None:
+            connection.execute(insert(counter).values(**values))
+        return
+    connection.execute(seed_insert(counter).values(**values).on_conflict_do_nothing(index_elements=[counter.c.id]))
+
+
+def bump_translation_version(
+    session: Session,
+    language_code: str,
+    category: str = TranslationVersion.ALL_CATEGORIES
+) -> int:
+    """
+    Stamp a language and category with the next catalog version.
+    
+    Runs in the caller's transaction, so the stamp becomes visible to other
+    workers together with the translation change itself. Versions come from
+    a single counter row that is incremented with UPDATE ... RETURNING. Its
+    row lock is held until the caller commits, so concurrent writers never
+    get the same version and versions become visible in the order they
+    were handed out; a worker that has seen version N has seen every
+    version below it.
+    
+    Args:
+        session: Session whose transaction records the change
+        language_code: Language that changed
+        category: Category that changed (ALL_CATEGORIES for the whole language)
+        
+    Returns:
+        The new version
+    """
+    table = TranslationVersion.__table__
+    counter = TranslationVersionCounter.__table__
+    connection = session.connection()
+    increment = (
+        update(counter)
+        .where(counter.c.id == TranslationVersionCounter.ROW_ID)
+        .values(version=counter.c.version + 1)
+        .returning(counter.c.version)
+    )
+    version = connection.execute(increment).scalar_one_or_none()
+    if version is None:
+        # Migrations and init_database seed the row, databases built otherwise get it here
+        seed_translation_version_counter(connection)
+        version = connection.execute(increment).scalar_one()
+    values = {"version": version, "updated_at": datetime.utcnow()}
+    
+    result = connection.execute(
+        update(table).where(
+            table.c.language_code == language_code,
+            table.c.category == category
+        ).values(**values)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(table).values(language_code=language_code, category=category, **values))
+    return version
+
+
+def record_translation_usage(
+    session: Session,
+    usage: Mapping[Tuple[str, str], int],
+    hit_at: datetime
+) -> None:
+    """
+    Add hit counts to the usage table with one UPDATE and one INSERT batch per chunk.
+    
+    Args:
+        session: Session whose transaction records the counts
+        usage: (key, language code) -> hits to add
+        hit_at: Time recorded as the last hit
+    """
+    table = TranslationUsage.__table__
+    connection = session.connection()
+    pairs = list(usage)
+    
+    for start in range(0, len(pairs), I18nService.BULK_QUERY_CHUNK_SIZE):
+        chunk = pairs[start:start + I18nService.BULK_QUERY_CHUNK_SIZE]
+        existing = {
+            tuple(row) for row in connection.execute(
+                select(table.c.key, table.c.language_code).where(
+                    table.c.key.in_({key for key, _ in chunk}),
+                    table.c.language_code.in_({lang for _, lang in chunk})
+                )
+            )
+        }
+        
+        updates = [
+            {"usage_key": key, "usage_language": lang, "usage_hits": usage[(key, lang)]}
+            for key, lang in chunk if (key, lang) in existing
+        ]
+        if updates:
+            connection.execute(
+                update(table).where(
+                    table.c.key == bindparam("usage_key"),
+                    table.c.language_code == bindparam("usage_language")
+                ).values(hits=table.c.hits + bindparam("usage_hits"), last_hit_at=hit_at),
+                updates
+            )
+            
+        inserts = [
+            {
+                "key": key,
+                "language_code": lang,
+                "category": I18nService._category_of(key),
+                "hits": usage[(key, lang)],
+                "last_hit_at": hit_at
+            }
+            for key, lang in chunk if (key, lang) not in existing
+        ]
+        if inserts:
+            connection.execute(insert(table), inserts)
+
+
+def record_translation_tombstones(
+    session: Session,
+    deleted: Iterable[Tuple[str, str, str, int]] = (),
+    written: Iterable[Tuple[str, str]] = ()
+) -> None:
+    """
+    Replace the tombstones of deleted translations and drop those of written ones.
+    
+    Args:
+        session: Session whose transaction records the change
+        deleted: (key, language code, category, version) of each deleted translation
+        written: (key, language code) of each translation that exists again
+    """
+    deleted = {(key, lang): (category, version) for key, lang, category, version in deleted}
+    pairs = set(written) | set(deleted)
+    if not pairs:
+        return
+        
+    table = TranslationTombstone.__table__
+    connection = session.connection()
+    connection.execute(
+        delete(table).where(
+            table.c.key == bindparam("tombstone_key"),
+            table.c.language_code == bindparam("tombstone_language")
+        ),
+        [{"tombstone_key": key, "tombstone_language": lang} for key, lang in pairs]
+    )
+    
+    now = datetime.utcnow()
+    tombstones = [
+        {"key": key, "language_code": lang, "category": category, "version": version, "deleted_at": now}
+        for (key, lang), (category, version) in deleted.items() if (key, lang) not in written
+    ]
+    if tombstones:
+        connection.execute(insert(table), tombstones)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_translation_changes(session: Session, flush_context) -> None:
+    """Bump the version of every language and category touched by a flush and record deletions."""
+    scopes = set()
+    deleted = []
+    written = set()
+    for target in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(target, Translation):
+            continue
+        
+        # Include the previous scope when a translation moves between categories
+        state = inspect(target)
+        languages = {target.language_code, *state.attrs.language_code.history.deleted}
+        categories = {target.category or "general", *state.attrs.category.history.deleted}
+        scopes.update(product(languages, categories))
+        
+        # A translation renamed to another key or language is deleted under its old one
+        old_category = (state.attrs.category.history.deleted or [target.category or "general"])[0]
+        old_pairs = set(product(
+            state.attrs.key.history.deleted or [target.key],
+            state.attrs.language_code.history.deleted or [target.language_code]
+        ))
+        if target in session.deleted:
+            deleted.extend((key, lang, old_category) for key, lang in old_pairs | {(target.key, target.language_code)})
+        else:
+            written.add((target.key, target.language_code))
+            deleted.extend((key, lang, old_category) for key, lang in old_pairs - {(target.key, target.language_code)})
+            
+    versions = {}
+    for language_code, category in sorted(scopes):
+        versions[(language_code, category)] = bump_translation_version(session, language_code, category)
+        
+    record_translation_tombstones(
+        session,
+        [(key, lang, category, versions[(lang, category)]) for key, lang, category in deleted],
+        written
+    )
+
+
 # Convenience functions
 
 def translate(key: str, language_code: str = None) -> str:
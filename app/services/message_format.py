@@ -0,0 +1,245 @@
+"""
+Message formatting for Park Tycoon Game translations.
+
+Translations may contain ICU-style arguments:
+
+    {name}                                         plain argument
+    {count, plural, =0 {none} one {# item} other {# items}}
+    {gender, select, male {He} female {She} other {They}}
+
+Each message is parsed once into a CompiledMessage, with the plural rule of
+its language bound at compile time, so formatting only walks the parts.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+_NAME = re.compile(r"\s*([A-Za-z_][A-Za-z0-9_]*)\s*")
+_SELECTOR = re.compile(r"\s*(=-?\d+|[A-Za-z_]+)\s*")
+
+# Simplified CLDR cardinal plural rules by base language
+PLURAL_RULES: Dict[str, Callable[[Any], str]] = {
+    "en": lambda n: "one" if n == 1 else "other",
+    "es": lambda n: "one" if n == 1 else "other",
+    "fr": lambda n: "one" if 0 <= n < 2 else "other",
+    "zh": lambda n: "other",
+}
+
+
+class MessageFormatError(ValueError):
+    """Raised when a message has malformed arguments."""
+
+
+def plural_rule(language_code: str) -> Callable[[Any], str]:
+    """
+    Get the plural rule for a language, region variants use their base language.
+    
+    Args:
+        language_code: Language code (e.g., 'fr', 'en-GB')
+        
+    Returns:
+        Function mapping a number to its plural category
+    """
+    return PLURAL_RULES.get(language_code.split("-", 1)[0], PLURAL_RULES["en"])
+
+
+class _Argument:
+    """A plain ``{name}`` argument."""
+    
+    __slots__ = ("name",)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def render(self, params: Mapping[str, Any], number: Any, out: List[str]) -> None:
+        value = params.get(self.name)
+        out.append("{" + self.name + "}" if value is None else str(value))
+
+
+class _Number:
+    """The ``#`` inside a plural branch."""
+    
+    __slots__ = ()
+    
+    def render(self, params: Mapping[str, Any], number: Any, out: List[str]) -> None:
+        out.append(str(number))
+
+
+class _Plural:
+    """A ``{name, plural, ...}`` argument."""
+    
+    __slots__ = ("name", "rule", "exact", "branches")
+    
+    def __init__(self, name: str, rule: Callable[[Any], str], branches: Dict[str, Tuple]):
+        self.name = name
+        self.rule = rule
+        self.exact = {int(selector[1:]): parts for selector, parts in branches.items() if selector[0] == "="}
+        self.branches = {selector: parts for selector, parts in branches.items() if selector[0] != "="}
+    
+    def render(self, params: Mapping[str, Any], number: Any, out: List[str]) -> None:
+        value = params.get(self.name)
+        if not isinstance(value, (int, float)):
+            _render(self.branches["other"], params, value, out)
+            return
+            
+        parts = self.exact.get(value)
+        if parts is None:
+            parts = self.branches.get(self.rule(value), self.branches["other"])
+        _render(parts, params, value, out)
+
+
+class _Select:
+    """A ``{name, select, ...}`` argument."""
+    
+    __slots__ = ("name", "branches")
+    
+    def __init__(self, name: str, branches: Dict[str, Tuple]):
+        self.name = name
+        self.branches = branches
+    
+    def render(self, params: Mapping[str, Any], number: Any, out: List[str]) -> None:
+        parts = self.branches.get(str(params.get(self.name)), self.branches["other"])
+        _render(parts, params, number, out)
+
+
+def _render(parts: Tuple, params: Mapping[str, Any], number: Any, out: List[str]) -> None:
+    """Append the rendering of compiled parts to ``out``."""
+    for part in parts:
+        if part.__class__ is str:
+            out.append(part)
+        else:
+            part.render(params, number, out)
+
+
+class CompiledMessage:
+    """A translation parsed once and formatted many times."""
+    
+    __slots__ = ("_parts", "_static")
+    
+    def __init__(self, parts: Tuple):
+        self._parts = parts
+        if not parts:
+            self._static = ""
+        elif len(parts) == 1 and parts[0].__class__ is str:
+            self._static = parts[0]
+        else:
+            self._static = None
+    
+    def format(self, params: Mapping[str, Any]) -> str:
+        """
+        Format the message.
+        
+        Args:
+            params: Argument values; missing plain arguments are left as ``{name}``
+            
+        Returns:
+            Formatted string
+        """
+        if self._static is not None:
+            return self._static
+            
+        out: List[str] = []
+        _render(self._parts, params, None, out)
+        return "".join(out)
+
+
+def compile_message(text: str, language_code: str) -> CompiledMessage:
+    """
+    Parse a translation into a reusable formatter.
+    
+    Args:
+        text: Translation text
+        language_code: Language whose plural rule applies
+        
+    Returns:
+        Compiled message
+        
+    Raises:
+        MessageFormatError: If an argument is malformed
+    """
+    if "{" not in text and "}" not in text:
+        return CompiledMessage((text,) if text else ())
+        
+    parts, position = _parse_message(text, 0, plural_rule(language_code), in_plural=False)
+    if position != len(text):
+        raise MessageFormatError(f"Unexpected '}}' at position {position}")
+    return CompiledMessage(parts)
+
+
+def _parse_message(text: str, position: int, rule: Callable[[Any], str], in_plural: bool) -> Tuple[Tuple, int]:
+    """Parse literal text and arguments until an unmatched '}' or the end."""
+    parts: List[Any] = []
+    literal: List[str] = []
+    length = len(text)
+    
+    while position < length:
+        char = text[position]
+        if char == "}":
+            break
+        if char == "#" and in_plural:
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            parts.append(_Number())
+            position += 1
+        elif char == "{":
+            if literal:
+                parts.append("".join(literal))
+                literal = []
+            argument, position = _parse_argument(text, position + 1, rule, in_plural)
+            parts.append(argument)
+        else:
+            literal.append(char)
+            position += 1
+            
+    if literal:
+        parts.append("".join(literal))
+    return tuple(parts), position
+
+
+def _parse_argument(text: str, position: int, rule: Callable[[Any], str], in_plural: bool) -> Tuple[Any, int]:
+    """Parse an argument after its opening '{' and return it with the position after '}'."""
+    match = _NAME.match(text, position)
+    if not match:
+        raise MessageFormatError(f"Expected an argument name at position {position}")
+    name = match.group(1)
+    position = match.end()
+    
+    if text.startswith("}", position):
+        return _Argument(name), position + 1
+    if not text.startswith(",", position):
+        raise MessageFormatError(f"Expected ',' or '}}' after '{name}'")
+        
+    match = _NAME.match(text, position + 1)
+    if not match or match.group(1) not in ("plural", "select"):
+        raise MessageFormatError(f"Unsupported argument type for '{name}'")
+    kind = match.group(1)
+    position = match.end()
+    if not text.startswith(",", position):
+        raise MessageFormatError(f"Expected ',' after '{name}, {kind}'")
+    position += 1
+    
+    branches: Dict[str, Tuple] = {}
+    while True:
+        match = _SELECTOR.match(text, position)
+        if not match:
+            break
+        selector = match.group(1)
+        position = match.end()
+        if not text.startswith("{", position):
+            raise MessageFormatError(f"Expected '{{' after selector '{selector}'")
+        parts, position = _parse_message(text, position + 1, rule, in_plural=kind == "plural" or in_plural)
+        if not text.startswith("}", position):
+            raise MessageFormatError(f"Unterminated branch '{selector}' of '{name}'")
+        branches[selector] = parts
+        position += 1
+        
+    position = len(text) - len(text[position:].lstrip())
+    if not text.startswith("}", position):
+        raise MessageFormatError(f"Unterminated argument '{name}'")
+    if "other" not in branches:
+        raise MessageFormatError(f"Argument '{name}' needs an 'other' branch")
+        
+    if kind == "plural":
+        return _Plural(name, rule, branches), position + 1
+    return _Select(name, branches), position + 1
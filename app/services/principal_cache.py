@@ -0,0 +1,253 @@
+"""
+Authenticated principal cache for Park Tycoon Game.
+
+Verifying a bearer token means decoding the JWT and loading the user row,
+once per authenticated request. This module keeps the verified user's
+columns in process, keyed by a SHA-256 digest of the token, so repeated
+requests with the same token skip both. Entries live for at most
+PRINCIPAL_CACHE_TTL seconds and never past the token's own expiry, and a
+committed change to a user's username, password, active or admin flag
+drops every entry of that user.
+
+Each such change also bumps a per-user generation. Callers read the
+generation before loading a user and pass it to ``put``, which refuses the
+principal if the user changed in between, so a row loaded just before a
+committed change is never cached.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.config import get_settings
+from app.models.user import User
+
+# Columns copied into a cached principal
+_PRINCIPAL_COLUMNS = tuple(column.key for column in User.__table__.columns)
+
+# Changes to these columns alter what a token grants
+_PRINCIPAL_FIELDS = ("username", "password_hash", "is_active", "is_admin")
+
+
+class PrincipalCache:
+    """TTL cache of verified tokens and the users they belong to."""
+    
+    def __init__(self, ttl: float, max_entries: int):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds an entry may be served, 0 disables the cache
+            max_entries: Maximum number of cached tokens
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any], Optional[str]]]" = OrderedDict()
+        self._by_user: Dict[int, Set[str]] = {}
+        self._by_jti: Dict[str, str] = {}
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+    
+    @staticmethod
+    def digest(token: str) -> str:
+        """Key a token by its SHA-256 digest so raw tokens are never kept."""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    
+    def get(self, token: str) -> Optional[User]:
+        """
+        Get the cached principal of a token.
+        
+        Args:
+            token: Bearer token
+            
+        Returns:
+            User: A detached copy of the cached user, None if not cached or expired
+        """
+        if self.ttl <= 0:
+            return None
+            
+        key = self.digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._discard(key)
+                self._misses += 1
+                return None
+            self._hits += 1
+            columns = entry[1]
+        
+        # Each request gets its own instance, so attaching it to a session is safe
+        user = User(**columns)
+        make_transient_to_detached(user)
+        return user
+    
+    def generation(self, user_id: int) -> int:
+        """
+        Get the number of committed principal changes seen for a user.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            int: Generation to pass to ``put`` after loading the user
+        """
+        with self._lock:
+            return self._generations.get(user_id, 0)
+    
+    def put(
+        self,
+        token: str,
+        user: User,
+        token_expires_at: Optional[float] = None,
+        jti: Optional[str] = None,
+        generation: Optional[int] = None
+    ) -> None:
+        """
+        Cache the principal of a verified token.
+        
+        Args:
+            token: Bearer token
+            user: Active user the token belongs to
+            token_expires_at: Token ``exp`` claim as a Unix timestamp
+            jti: Token ``jti`` claim, so a revocation can drop the entry
+            generation: User generation read before the user was loaded, the
+                principal is not cached if the user has changed since
+        """
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+            
+        lifetime = self.ttl
+        if token_expires_at is not None:
+            lifetime = min(lifetime, token_expires_at - time.time())
+        if lifetime <= 0:
+            return
+            
+        key = self.digest(token)
+        columns = {name: getattr(user, name) for name in _PRINCIPAL_COLUMNS}
+        with self._lock:
+            if generation is not None and self._generations.get(columns["id"], 0) != generation:
+                return
+            self._discard(key)
+            while len(self._entries) >= self.max_entries:
+                self._discard(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + lifetime, columns, jti)
+            self._by_user.setdefault(columns["id"], set()).add(key)
+            if jti is not None:
+                self._by_jti[jti] = key
+    
+    def invalidate_user(self, user_id: int) -> int:
+        """
+        Drop every cached token of a user.
+        
+        Args:
+            user_id: ID of the changed user
+            
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            keys = list(self._by_user.get(user_id, ()))
+            for key in keys:
+                self._discard(key)
+            self._invalidations += len(keys)
+            return len(keys)
+    
+    def invalidate_token(self, token: str) -> None:
+        """
+        Drop the cached principal of one token.
+        
+        Args:
+            token: Bearer token
+        """
+        with self._lock:
+            self._discard(self.digest(token))
+    
+    def invalidate_jti(self, jti: str) -> None:
+        """
+        Drop the cached principal of a revoked token.
+        
+        Args:
+            jti: Token ``jti`` claim
+        """
+        with self._lock:
+            key = self._by_jti.get(jti)
+            if key is not None:
+                self._discard(key)
+    
+    def clear(self) -> None:
+        """Drop every cached principal."""
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            self._by_jti.clear()
+    
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            _, columns, jti = entry
+            keys = self._by_user.get(columns["id"])
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_user[columns["id"]]
+            if jti is not None:
+                self._by_jti.pop(jti, None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with cache size, hit rate and invalidations
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "ttl": self.ttl,
+                "max_entries": self.max_entries,
+                "cached_tokens": len(self._entries),
+                "cached_users": len(self._by_user),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "invalidations": self._invalidations,
+            }
+
+
+_settings = get_settings()
+principal_cache = PrincipalCache(_settings.principal_cache_ttl, _settings.principal_cache_max_entries)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_principal_changes(session: Session, flush_context) -> None:
+    """Remember users whose principal fields were changed or deleted by a flush."""
+    for target in chain(session.dirty, session.deleted):
+        if not isinstance(target, User):
+            continue
+        state = inspect(target)
+        if target in session.deleted or any(state.attrs[name].history.has_changes() for name in _PRINCIPAL_FIELDS):
+            session.info.setdefault("principal_changes", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_principals(session: Session) -> None:
+    """Drop the cached tokens of users changed by a committed transaction."""
+    for user_id in session.info.pop("principal_changes", ()):
+        principal_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_principal_changes(session: Session) -> None:
+    """Forget changes that were rolled back."""
+    session.info.pop("principal_changes", None)
@@ -0,0 +1,173 @@
+"""
+Revoked access token denylist for Park Tycoon Game.
+
+Revoked token IDs (the ``jti`` claim) are persisted in ``revoked_tokens``
+and mirrored into an in-memory dict, so checking a token on the hot path is
+a single dict lookup instead of a query. Every entry is dropped once its
+token would have expired anyway, which bounds memory by the number of
+tokens revoked within one token lifetime. Workers pick up revocations made
+by other workers by polling for rows newer than the last one they saw.
+"""
+
+import asyncio
+import heapq
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+
+from app.core.database import AsyncSessionLocal
+from app.models.user import RevokedToken
+from app.services.principal_cache import principal_cache
+
+logger = logging.getLogger(__name__)
+
+
+def to_timestamp(value: datetime) -> float:
+    """Convert a naive UTC datetime to a Unix timestamp."""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def to_datetime(timestamp: float) -> datetime:
+    """Convert a Unix timestamp to a naive UTC datetime."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+class TokenDenylist:
+    """In-memory mirror of revoked token IDs that expires with the tokens."""
+    
+    def __init__(self):
+        """Initialize an empty denylist."""
+        self._expires: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._last_id = 0
+        self._lock = threading.Lock()
+        self._purged = 0
+    
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        """
+        Check whether a token ID was revoked.
+        
+        Args:
+            jti: Token ``jti`` claim
+            
+        Returns:
+            bool: True if the token was revoked and has not expired yet
+        """
+        expires_at = self._expires.get(jti) if jti else None
+        return expires_at is not None and expires_at > time.time()
+    
+    def add(self, jti: str, expires_at: float) -> None:
+        """
+        Deny a token ID until its expiry.
+        
+        Args:
+            jti: Token ``jti`` claim
+            expires_at: Token ``exp`` claim as a Unix timestamp
+        """
+        if expires_at <= time.time():
+            return
+            
+        with self._lock:
+            if jti not in self._expires:
+                heapq.heappush(self._heap, (expires_at, jti))
+                self._expires[jti] = expires_at
+            self._purge_locked()
+        principal_cache.invalidate_jti(jti)
+    
+    def purge(self) -> int:
+        """
+        Drop entries whose tokens have expired.
+        
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            return self._purge_locked()
+    
+    def _purge_locked(self) -> int:
+        now = time.time()
+        purged = 0
+        while self._heap and self._heap[0][0] <= now:
+            _, jti = heapq.heappop(self._heap)
+            del self._expires[jti]
+            purged += 1
+        self._purged += purged
+        return purged
+    
+    def clear(self) -> None:
+        """Forget every entry, the next sync reloads them from the database."""
+        with self._lock:
+            self._expires.clear()
+            self._heap.clear()
+            self._last_id = 0
+    
+    async def sync(self) -> int:
+        """
+        Mirror revocations persisted since the last sync, also by other workers.
+        
+        Returns:
+            int: Number of revocations read
+        """
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at)
+                .where(RevokedToken.id > self._last_id, RevokedToken.expires_at > datetime.utcnow())
+                .order_by(RevokedToken.id)
+            )
+            rows = result.all()
+            
+        for row_id, jti, expires_at in rows:
+            self.add(jti, to_timestamp(expires_at))
+            self._last_id = max(self._last_id, row_id)
+        return len(rows)
+    
+    async def load(self) -> int:
+        """
+        Delete expired revocations from the database and mirror the rest.
+        
+        Returns:
+            int: Number of revocations loaded
+        """
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= datetime.utcnow()))
+            await session.commit()
+            
+        count = await self.sync()
+        logger.info(f"Loaded {count} revoked token(s)")
+        return count
+    
+    async def watch(self, interval: float) -> None:
+        """
+        Poll for revocations made by other workers until cancelled.
+        
+        Args:
+            interval: Seconds between polls
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sync()
+                self.purge()
+            except Exception as e:
+                logger.error(f"Error syncing revoked tokens: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get denylist statistics.
+        
+        Returns:
+            Dictionary with the number of denied and purged token IDs
+        """
+        with self._lock:
+            return {
+                "revoked_tokens": len(self._expires),
+                "purged": self._purged,
+                "last_synced_id": self._last_id,
+            }
+
+
+token_denylist = TokenDenylist()
@@ -0,0 +1,290 @@
+"""
+Compiled binary translation catalog for Park Tycoon Game.
+
+The catalog is a read-only, memory-mapped snapshot of the ``translations``
+table. Every worker that opens the same file shares its pages through the OS
+page cache, so large catalogs are not duplicated per process and workers can
+serve translations without touching the database at startup.
+
+File layout (all integers little-endian, offsets from the start of the file):
+    
+    header      magic (8s) | format version (I) | language count (I)
+    languages   per language: code (16s) | entry count (I) | category count (I)
+                | entries offset (I) | key order offset (I) | categories offset (I)
+    sections    per language:
+                  entries     (key off, key len, value off, value len) sorted by (category, key)
+                  key order   entry indexes (I) sorted by key bytes
+                  categories  (name off, name len, first entry, entry count) sorted by name
+    strings     UTF-8 blob referenced by the offsets above
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+CATALOG_MAGIC = b"PTCATLG\0"
+CATALOG_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sII")
+_LANGUAGE = struct.Struct("<16sIIIII")
+_ENTRY = struct.Struct("<IIII")
+_KEY_INDEX = struct.Struct("<I")
+_CATEGORY = struct.Struct("<IIII")
+
+
+class CatalogFormatError(ValueError):
+    """Raised when a file is not a valid translation catalog."""
+
+
+class _LanguageSection:
+    """Offsets of one language inside the catalog."""
+    
+    __slots__ = ("entry_count", "category_count", "entries_offset", "key_order_offset", "categories_offset")
+    
+    def __init__(self, entry_count, category_count, entries_offset, key_order_offset, categories_offset):
+        self.entry_count = entry_count
+        self.category_count = category_count
+        self.entries_offset = entries_offset
+        self.key_order_offset = key_order_offset
+        self.categories_offset = categories_offset
+
+
+class TranslationCatalog:
+    """Read-only, memory-mapped translation catalog."""
+    
+    def __init__(self, path: str):
+        """
+        Open and map a compiled catalog file.
+        
+        Args:
+            path: Path to a file written by write_catalog
+            
+        Raises:
+            CatalogFormatError: If the file is not a valid catalog
+        """
+        self.path = path
+        with open(path, "rb") as catalog_file:
+            stat = os.fstat(catalog_file.fileno())
+            self.file_id = (stat.st_ino, stat.st_mtime_ns)
+            self._mm = mmap.mmap(catalog_file.fileno(), 0, access=mmap.ACCESS_READ)
+            
+        magic, version, language_count = _HEADER.unpack_from(self._mm, 0)
+        if magic != CATALOG_MAGIC or version != CATALOG_FORMAT_VERSION:
+            self._mm.close()
+            raise CatalogFormatError(f"{path} is not a version {CATALOG_FORMAT_VERSION} translation catalog")
+            
+        self._sections: Dict[str, _LanguageSection] = {}
+        offset = _HEADER.size
+        for _ in range(language_count):
+            code, *fields = _LANGUAGE.unpack_from(self._mm, offset)
+            self._sections[code.rstrip(b"\0").decode("ascii")] = _LanguageSection(*fields)
+            offset += _LANGUAGE.size
+    
+    def languages(self) -> List[str]:
+        """Get the language codes contained in the catalog."""
+        return list(self._sections)
+    
+    def has_language(self, language_code: str) -> bool:
+        """Check if the catalog contains a language."""
+        return language_code in self._sections
+    
+    def count(self, language_code: str) -> int:
+        """Get the number of translations for a language."""
+        section = self._sections.get(language_code)
+        return section.entry_count if section else 0
+    
+    def get(self, key: str, language_code: str) -> Optional[str]:
+        """
+        Look up a single translation by binary search over the key order.
+        
+        Args:
+            key: Translation key
+            language_code: Language code
+            
+        Returns:
+            Translated string or None if the catalog has no such entry
+        """
+        section = self._sections.get(language_code)
+        if section is None:
+            return None
+            
+        target = key.encode("utf-8")
+        mm = self._mm
+        low, high = 0, section.entry_count
+        while low < high:
+            middle = (low + high) // 2
+            entry_index, = _KEY_INDEX.unpack_from(mm, section.key_order_offset + middle * _KEY_INDEX.size)
+            key_off, key_len, value_off, value_len = _ENTRY.unpack_from(
+                mm, section.entries_offset + entry_index * _ENTRY.size
+            )
+            candidate = mm[key_off:key_off + key_len]
+            if candidate < target:
+                low = middle + 1
+            elif candidate > target:
+                high = middle
+            else:
+                return mm[value_off:value_off + value_len].decode("utf-8")
+        return None
+    
+    def categories(self, language_code: str) -> List[str]:
+        """Get the categories of a language in sorted order."""
+        section = self._sections.get(language_code)
+        if section is None:
+            return []
+        return [name for name, _, _ in self._iter_categories(section)]
+    
+    def get_category(self, category: str, language_code: str) -> Dict[str, str]:
+        """
+        Get every translation of a category.
+        
+        Args:
+            category: Translation category
+            language_code: Language code
+            
+        Returns:
+            Dictionary of key-value translation pairs (empty if unknown)
+        """
+        section = self._sections.get(language_code)
+        if section is None:
+            return {}
+            
+        for name, first, count in self._iter_categories(section):
+            if name == category:
+                return dict(self._iter_entries(section, first, count))
+        return {}
+    
+    def items(self, language_code: str) -> Iterator[Tuple[str, str, str]]:
+        """
+        Iterate over every (category, key, value) of a language.
+        
+        Args:
+            language_code: Language code
+        """
+        section = self._sections.get(language_code)
+        if section is None:
+            return
+            
+        for name, first, count in self._iter_categories(section):
+            for key, value in self._iter_entries(section, first, count):
+                yield name, key, value
+    
+    def is_stale(self) -> bool:
+        """Check if the file at ``path`` has been replaced since it was mapped."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_ino, stat.st_mtime_ns) != self.file_id
+    
+    def close(self) -> None:
+        """Unmap the catalog file."""
+        self._mm.close()
+    
+    def _iter_categories(self, section: _LanguageSection) -> Iterator[Tuple[str, int, int]]:
+        """Iterate over (name, first entry, entry count) of a language's categories."""
+        mm = self._mm
+        for i in range(section.category_count):
+            name_off, name_len, first, count = _CATEGORY.unpack_from(
+                mm, section.categories_offset + i * _CATEGORY.size
+            )
+            yield mm[name_off:name_off + name_len].decode("utf-8"), first, count
+    
+    def _iter_entries(self, section: _LanguageSection, first: int, count: int) -> Iterator[Tuple[str, str]]:
+        """Iterate over (key, value) for a contiguous run of entries."""
+        mm = self._mm
+        for i in range(first, first + count):
+            key_off, key_len, value_off, value_len = _ENTRY.unpack_from(mm, section.entries_offset + i * _ENTRY.size)
+            yield (
+                mm[key_off:key_off + key_len].decode("utf-8"),
+                mm[value_off:value_off + value_len].decode("utf-8"),
+            )
+
+
+def write_catalog(path: str, rows: Iterable[Tuple[str, str, str, str]]) -> int:
+    """
+    Compile translations into a catalog file.
+    
+    The file is written next to ``path`` and atomically renamed into place,
+    so processes that still map the previous catalog keep a consistent view.
+    
+    Args:
+        path: Destination catalog path
+        rows: Iterable of (language_code, category, key, value)
+        
+    Returns:
+        Number of translations written
+    """
+    languages: Dict[str, List[Tuple[bytes, bytes, bytes]]] = {}
+    for language_code, category, key, value in rows:
+        languages.setdefault(language_code, []).append(
+            (category.encode("utf-8"), key.encode("utf-8"), value.encode("utf-8"))
+        )
+        
+    strings = bytearray()
+    string_offsets: Dict[bytes, int] = {}
+    
+    def intern(data: bytes) -> int:
+        """Store a string once in the blob and return its relative offset."""
+        offset = string_offsets.get(data)
+        if offset is None:
+            offset = string_offsets[data] = len(strings)
+            strings.extend(data)
+        return offset
+    
+    # Build the fixed-size tables with blob-relative string offsets
+    sections = []
+    for language_code in sorted(languages):
+        entries = sorted(languages[language_code])
+        key_order = sorted(range(len(entries)), key=lambda i: entries[i][1])
+        
+        categories = []
+        for i, (category, _, _) in enumerate(entries):
+            if categories and categories[-1][0] == category:
+                categories[-1][2] += 1
+            else:
+                categories.append([category, i, 1])
+                
+        sections.append((
+            language_code,
+            [(intern(key), len(key), intern(value), len(value)) for _, key, value in entries],
+            key_order,
+            [(intern(name), len(name), first, count) for name, first, count in categories],
+        ))
+    
+    # Lay out the sections, then shift string offsets past them
+    offset = _HEADER.size + _LANGUAGE.size * len(sections)
+    layout = []
+    for _, entries, key_order, categories in sections:
+        entries_offset = offset
+        key_order_offset = entries_offset + _ENTRY.size * len(entries)
+        categories_offset = key_order_offset + _KEY_INDEX.size * len(key_order)
+        offset = categories_offset + _CATEGORY.size * len(categories)
+        layout.append((entries_offset, key_order_offset, categories_offset))
+    strings_offset = offset
+    
+    output = bytearray(_HEADER.pack(CATALOG_MAGIC, CATALOG_FORMAT_VERSION, len(sections)))
+    for (language_code, entries, _, categories), offsets in zip(sections, layout):
+        output += _LANGUAGE.pack(language_code.encode("ascii"), len(entries), len(categories), *offsets)
+    for _, entries, key_order, categories in sections:
+        for key_off, key_len, value_off, value_len in entries:
+            output += _ENTRY.pack(strings_offset + key_off, key_len, strings_offset + value_off, value_len)
+        for entry_index in key_order:
+            output += _KEY_INDEX.pack(entry_index)
+        for name_off, name_len, first, count in categories:
+            output += _CATEGORY.pack(strings_offset + name_off, name_len, first, count)
+    output += strings
+    
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(output)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+        
+    return sum(len(entries) for _, entries, _, _ in sections)
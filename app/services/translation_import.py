@@ -0,0 +1,340 @@
+"""
+Streaming translation import for Park Tycoon Game.
+
+JSON Lines, CSV and gettext .po files are parsed row by row and upserted
+into ``translations`` in chunks with ``INSERT ... ON CONFLICT (key,
+language_code)``, so memory use is bounded by the chunk size instead of
+the file size. The version of every touched language and category is
+bumped once after the last chunk, so each worker reloads every changed
+scope a single time.
+"""
+
+import csv
+import json
+import logging
+import re
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.translation import Translation
+from app.services.i18n_service import I18nService, bump_translation_version, record_translation_tombstones
+
+logger = logging.getLogger(__name__)
+
+# (language_code, category, key, value), the row shape of write_catalog
+Row = Tuple[str, str, str, str]
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Column limits of the translations table
+_MAX_KEY_LENGTH = 255
+_MAX_LANGUAGE_LENGTH = 10
+_MAX_CATEGORY_LENGTH = 50
+
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+_PO_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+_PO_ESCAPE = re.compile(r"\\(.)")
+_PO_LANGUAGE = re.compile(r"^Language:\s*(\S+)\s*$", re.MULTILINE)
+
+
+class TranslationImportError(ValueError):
+    """Raised when an import file contains a malformed row."""
+
+
+def _make_row(
+    key: Any,
+    language_code: Any,
+    value: Any,
+    category: Any,
+    line: int
+) -> Row:
+    """Validate one imported translation against the translations table."""
+    for name, field, limit in (
+        ("key", key, _MAX_KEY_LENGTH),
+        ("language_code", language_code, _MAX_LANGUAGE_LENGTH),
+    ):
+        if not isinstance(field, str) or not field:
+            raise TranslationImportError(f"Line {line}: missing {name}")
+        if len(field) > limit:
+            raise TranslationImportError(f"Line {line}: {name} is longer than {limit} characters")
+    if not isinstance(value, str):
+        raise TranslationImportError(f"Line {line}: missing value")
+        
+    category = category or I18nService._category_of(key)
+    if not isinstance(category, str) or len(category) > _MAX_CATEGORY_LENGTH:
+        raise TranslationImportError(f"Line {line}: category must be a string of at most {_MAX_CATEGORY_LENGTH} characters")
+    return language_code, category, key, value
+
+
+def parse_jsonl(lines: Iterable[str], language_code: Optional[str] = None) -> Iterator[Row]:
+    """
+    Parse JSON Lines with ``key``, ``value`` and optional ``language_code`` and ``category``.
+    
+    Args:
+        lines: Text lines of the file
+        language_code: Language for records without ``language_code``
+        
+    Yields:
+        Validated rows
+    """
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise TranslationImportError(f"Line {number}: invalid JSON: {e}")
+        if not isinstance(record, dict):
+            raise TranslationImportError(f"Line {number}: expected a JSON object")
+            
+        yield _make_row(
+            record.get("key"),
+            record.get("language_code", language_code),
+            record.get("value"),
+            record.get("category"),
+            number
+        )
+
+
+def parse_csv(lines: Iterable[str], language_code: Optional[str] = None) -> Iterator[Row]:
+    """
+    Parse CSV with a header naming ``key``, ``value`` and optional ``language_code`` and ``category``.
+    
+    Args:
+        lines: Text lines of the file, opened with ``newline=""``
+        language_code: Language for rows without ``language_code``
+        
+    Yields:
+        Validated rows
+    """
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None or not {"key", "value"} <= set(reader.fieldnames):
+        raise TranslationImportError("Line 1: CSV header must name 'key' and 'value' columns")
+        
+    for record in reader:
+        yield _make_row(
+            record.get("key"),
+            record.get("language_code") or language_code,
+            record.get("value"),
+            record.get("category"),
+            reader.line_num
+        )
+
+
+def parse_po(lines: Iterable[str], language_code: Optional[str] = None) -> Iterator[Row]:
+    """
+    Parse a gettext .po file, using each msgid as the translation key.
+    
+    Untranslated, fuzzy, obsolete and plural entries are skipped.
+    
+    Args:
+        lines: Text lines of the file
+        language_code: Language of the file (defaults to its ``Language:`` header)
+        
+    Yields:
+        Validated rows
+    """
+    entry: Dict[str, str] = {}
+    flags = ""
+    field = None
+    start = 0
+    
+    def finish() -> Optional[Row]:
+        nonlocal language_code
+        msgid, msgstr = entry.get("msgid"), entry.get("msgstr")
+        if msgid == "":
+            # Header entry
+            match = _PO_LANGUAGE.search(msgstr or "")
+            if match and not language_code:
+                language_code = match.group(1).replace("_", "-")
+            return None
+        if not msgid or not msgstr or "fuzzy" in flags or "msgid_plural" in entry:
+            return None
+        return _make_row(msgid, language_code, msgstr, None, start)
+        
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if line.startswith('"') and field is not None:
+            entry[field] += _unquote_po(line, number)
+            continue
+            
+        if not line or line.startswith("#"):
+            # Blank lines and comments end the previous entry
+            if entry:
+                row = finish()
+                if row is not None:
+                    yield row
+                entry, flags, field = {}, "", None
+            if line.startswith("#,"):
+                flags += line[2:]
+            continue
+            
+        name, _, text = line.partition(" ")
+        if name not in ("msgctxt", "msgid", "msgid_plural", "msgstr") and not name.startswith("msgstr["):
+            raise TranslationImportError(f"Line {number}: unexpected '{name}'")
+        if name in ("msgctxt", "msgid") and "msgstr" in entry:
+            row = finish()
+            if row is not None:
+                yield row
+            entry, flags = {}, ""
+        if not entry:
+            start = number
+        field = "msgstr" if name == "msgstr[0]" else name
+        entry[field] = _unquote_po(text.strip(), number)
+        
+    if entry:
+        row = finish()
+        if row is not None:
+            yield row
+
+
+def _unquote_po(text: str, line: int) -> str:
+    """Decode a double-quoted .po string."""
+    if len(text) < 2 or text[0] != '"' or text[-1] != '"':
+        raise TranslationImportError(f"Line {line}: expected a quoted string")
+    return _PO_ESCAPE.sub(lambda match: _PO_ESCAPES.get(match.group(1), match.group(0)), text[1:-1])
+
+
+IMPORT_PARSERS: Dict[str, Callable[[Iterable[str], Optional[str]], Iterator[Row]]] = {
+    "jsonl": parse_jsonl,
+    "csv": parse_csv,
+    "po": parse_po,
+}
+
+_EXTENSIONS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".po": "po"}
+
+
+def detect_format(filename: Optional[str]) -> Optional[str]:
+    """
+    Guess the import format from a file name.
+    
+    Args:
+        filename: Name of the uploaded or local file
+        
+    Returns:
+        Key of IMPORT_PARSERS, or None if the extension is unknown
+    """
+    for extension, import_format in _EXTENSIONS.items():
+        if filename and filename.lower().endswith(extension):
+            return import_format
+    return None
+
+
+def _upsert_chunk(session: Session, chunk: Dict[Tuple[str, str], Row], scopes: Set[Tuple[str, str]]) -> None:
+    """Upsert one chunk and collect the language and category scopes it changes."""
+    table = Translation.__table__
+    connection = session.connection()
+    
+    # Keys moving to another category also change the category they leave
+    existing = connection.execute(
+        select(table.c.key, table.c.language_code, table.c.category).where(
+            table.c.key.in_({key for key, _ in chunk}),
+            table.c.language_code.in_({lang for _, lang in chunk})
+        )
+    )
+    for key, language_code, category in existing:
+        row = chunk.get((key, language_code))
+        if row is not None and row[1] != category:
+            scopes.add((language_code, category))
+            
+    dialect = connection.dialect.name
+    if dialect not in _UPSERT_INSERTS:
+        raise TranslationImportError(f"Bulk import is not supported on {dialect}")
+        
+    now = datetime.utcnow()
+    statement = _UPSERT_INSERTS[dialect](table)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.key, table.c.language_code],
+        set_={
+            "value": statement.excluded.value,
+            "category": statement.excluded.category,
+            "updated_at": statement.excluded.updated_at
+        }
+    )
+    connection.execute(statement, [
+        {
+            "key": key,
+            "language_code": language_code,
+            "value": value,
+            "category": category,
+            "created_at": now,
+            "updated_at": now
+        }
+        for language_code, category, key, value in chunk.values()
+    ])
+    scopes.update((language_code, category) for language_code, category, _, _ in chunk.values())
+    record_translation_tombstones(session, written=chunk)
+
+
+def import_translations(rows: Iterable[Row], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Upsert translations in chunks, committing each chunk.
+    
+    Version stamps are bumped once per changed scope at the end, also when
+    a malformed row stops the import after some chunks were committed.
+    
+    Args:
+        rows: Rows from one of IMPORT_PARSERS
+        chunk_size: Rows per INSERT ... ON CONFLICT statement and transaction
+        
+    Returns:
+        Dictionary with import statistics
+        
+    Raises:
+        TranslationImportError: If a row is malformed
+    """
+    start = time.perf_counter()
+    committed: Set[Tuple[str, str]] = set()
+    imported = 0
+    chunks = 0
+    
+    with SessionLocal() as session:
+        def write(chunk: Dict[Tuple[str, str], Row]) -> None:
+            nonlocal committed, imported, chunks
+            scopes = set(committed)
+            _upsert_chunk(session, chunk, scopes)
+            session.commit()
+            committed = scopes
+            imported += len(chunk)
+            chunks += 1
+            
+        try:
+            chunk: Dict[Tuple[str, str], Row] = {}
+            for row in rows:
+                # The last duplicate of a key wins, ON CONFLICT cannot touch a row twice
+                chunk[(row[2], row[0])] = row
+                if len(chunk) >= chunk_size:
+                    write(chunk)
+                    chunk = {}
+            if chunk:
+                write(chunk)
+        finally:
+            session.rollback()
+            for language_code, category in sorted(committed):
+                bump_translation_version(session, language_code, category)
+            session.commit()
+            
+    seconds = time.perf_counter() - start
+    stats = {
+        "rows": imported,
+        "chunks": chunks,
+        "scopes": len(committed),
+        "languages": sorted({language_code for language_code, _ in committed}),
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(imported / seconds) if seconds > 0 else imported
+    }
+    logger.info(
+        f"Imported {imported} translations in {chunks} chunk(s), "
+        f"{stats['rows_per_second']} rows/sec, {len(committed)} scope(s) invalidated"
+    )
+    return stats
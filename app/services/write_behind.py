@@ -0,0 +1,197 @@
+"""
+Write-behind buffer for hot timestamp columns in Park Tycoon Game.
+
+Columns such as ``users.last_login`` change on every login but are only
+read for display. Instead of an UPDATE and a commit per request, which
+serialize on the SQLite database lock, the latest timestamp per row is kept
+in memory and written with one ``executemany`` UPDATE per column every few
+seconds and on shutdown. Any mapped timestamp column can be buffered, e.g.
+``players.last_played`` once turns are played through the API.
+
+The FastAPI app flushes ``timestamp_writer`` from its event loop. The Flask
+app, which has no event loop and its own database, keeps a separate buffer
+and flushes it with ``flush_sync``.
+"""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Column, bindparam, update
+from sqlalchemy.engine import Engine
+
+from app.core.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class TimestampWriteBehind:
+    """Coalesces timestamp updates per row and writes them in batches."""
+    
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self._pending: Dict[Column, Dict[Any, datetime]] = {}
+        self._lock = threading.Lock()
+        self._flushes = 0
+        self._rows_written = 0
+        self._coalesced = 0
+    
+    def touch(self, attribute: Any, row_id: Any, when: Optional[datetime] = None) -> datetime:
+        """
+        Record a new timestamp for a row, to be written on the next flush.
+        
+        Args:
+            attribute: Mapped timestamp attribute, e.g. ``User.last_login``
+            row_id: Primary key of the row
+            when: Timestamp to write, defaults to now
+            
+        Returns:
+            datetime: The recorded timestamp
+        """
+        column = attribute.property.columns[0] if hasattr(attribute, "property") else attribute
+        when = when or datetime.utcnow()
+        with self._lock:
+            rows = self._pending.setdefault(column, {})
+            previous = rows.get(row_id)
+            if previous is not None:
+                self._coalesced += 1
+                if previous >= when:
+                    return when
+            rows[row_id] = when
+        return when
+    
+    def pending_count(self) -> int:
+        """Number of rows waiting to be written."""
+        with self._lock:
+            return sum(len(rows) for rows in self._pending.values())
+    
+    def _merge_back(self, pending: Dict[Column, Dict[Any, datetime]]) -> None:
+        """Return unwritten timestamps to the buffer, keeping newer ones."""
+        with self._lock:
+            for column, rows in pending.items():
+                current = self._pending.setdefault(column, {})
+                for row_id, when in rows.items():
+                    if row_id not in current or current[row_id] < when:
+                        current[row_id] = when
+    
+    @staticmethod
+    def _statement(column: Column) -> Any:
+        """UPDATE of one column by primary key, for executemany."""
+        table = column.table
+        primary_key = list(table.primary_key.columns)[0]
+        return (
+            update(table)
+            .where(primary_key == bindparam("row_id"))
+            .values({column.key: bindparam("timestamp")})
+        )
+    
+    async def flush(self) -> int:
+        """
+        Write every buffered timestamp, one executemany UPDATE per column.
+        
+        Timestamps are put back into the buffer if the write fails.
+        
+        Returns:
+            int: Number of rows written
+        """
+        pending = self._take()
+        if not pending:
+            return 0
+            
+        written = 0
+        try:
+            async with AsyncSessionLocal() as session:
+                connection = await session.connection()
+                for column, rows in pending.items():
+                    await connection.execute(
+                        self._statement(column),
+                        [{"row_id": row_id, "timestamp": when} for row_id, when in rows.items()]
+                    )
+                    written += len(rows)
+                await session.commit()
+        except Exception:
+            self._merge_back(pending)
+            raise
+            
+        self._record_flush(written)
+        return written
+    
+    def flush_sync(self, engine: Engine) -> int:
+        """
+        Write every buffered timestamp through a blocking engine.
+        
+        Used by callers without an event loop, such as the Flask app.
+        Timestamps are put back into the buffer if the write fails.
+        
+        Args:
+            engine: Engine of the database the buffered columns live in
+            
+        Returns:
+            int: Number of rows written
+        """
+        pending = self._take()
+        if not pending:
+            return 0
+            
+        written = 0
+        try:
+            with engine.begin() as connection:
+                for column, rows in pending.items():
+                    connection.execute(
+                        self._statement(column),
+                        [{"row_id": row_id, "timestamp": when} for row_id, when in rows.items()]
+                    )
+                    written += len(rows)
+        except Exception:
+            self._merge_back(pending)
+            raise
+            
+        self._record_flush(written)
+        return written
+    
+    def _take(self) -> Dict[Column, Dict[Any, datetime]]:
+        """Swap out the buffer for an empty one and return its contents."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+    
+    def _record_flush(self, written: int) -> None:
+        """Count a successful flush."""
+        with self._lock:
+            self._flushes += 1
+            self._rows_written += written
+    
+    async def watch(self, interval: float) -> None:
+        """
+        Flush the buffer periodically until cancelled.
+        
+        Args:
+            interval: Seconds between flushes
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error writing buffered timestamps: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get buffer statistics.
+        
+        Returns:
+            Dictionary with pending rows, flushes, rows written and coalesced updates
+        """
+        pending = self.pending_count()
+        with self._lock:
+            return {
+                "pending_rows": pending,
+                "flushes": self._flushes,
+                "rows_written": self._rows_written,
+                "coalesced_updates": self._coalesced,
+            }
+
+
+timestamp_writer = TimestampWriteBehind()
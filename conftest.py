@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the async database tests.
+"""
+
+import pytest
+import pytest_asyncio
+from contextlib import ExitStack
+from unittest.mock import patch
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.services.auth_service import AuthService
+
+
+def pytest_configure(config):
+    """Register the markers used by the shared fixtures."""
+    config.addinivalue_line(
+        "markers",
+        "async_session_targets(*targets): AsyncSessionLocal names the async_session_local fixture patches"
+    )
+
+
+@pytest_asyncio.fixture
+async def async_engine():
+    """Create an async engine bound to an in-memory database with every table."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        
+    yield engine
+    
+    await engine.dispose()
+
+
+@pytest.fixture
+def async_session_local(request, async_engine):
+    """
+    Create an async session factory bound to an in-memory database.
+    
+    The factory replaces every AsyncSessionLocal named by the module's
+    async_session_targets marker, e.g.
+    ``pytestmark = pytest.mark.async_session_targets("app.services.write_behind.AsyncSessionLocal")``.
+    """
+    TestingSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    marker = request.node.get_closest_marker("async_session_targets")
+    with ExitStack() as stack:
+        for target in marker.args if marker else ():
+            stack.enter_context(patch(target, TestingSessionLocal))
+        yield TestingSessionLocal
+
+
+@pytest_asyncio.fixture
+async def auth_service(async_engine):
+    """Create an AuthService bound to an in-memory async database."""
+    async with async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield AuthService(session)
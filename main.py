@@ -1,6 +1,7 @@
 """
 Park Tycoon Game - FastAPI Application Entry Point
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
@@ -11,6 +12,9 @@ from app.core.database import init_database
 from app.core.logging import setup_logging
 from app.core.i18n_middleware import I18nMiddleware
 from app.api.routes import api_router
+from app.services.i18n_service import get_i18n_service
+from app.services.token_denylist import token_denylist
+from app.services.write_behind import timestamp_writer
 
 
 @asynccontextmanager
@@ -28,10 +32,51 @@ async def lifespan(app: FastAPI):
     await init_database()
     logger.info("Database initialized successfully")
     
+    # Mirror revoked tokens and follow revocations made by other workers
+    await token_denylist.load()
+    revocation_watcher = asyncio.create_task(
+        token_denylist.watch(settings.token_revocation_poll_interval)
+    )
+    
+    # Write buffered last_login timestamps in batches
+    timestamp_flusher = asyncio.create_task(
+        timestamp_writer.watch(settings.timestamp_flush_interval)
+    )
+    
+    # Follow translation changes made by other workers
+    i18n_service = get_i18n_service()
+    await i18n_service.sync_versions()
+    version_watcher = asyncio.create_task(
+        i18n_service.watch_versions(settings.translation_version_poll_interval)
+    )
+    
+    # Record which translation keys are used
+    usage_writer = asyncio.create_task(
+        i18n_service.watch_usage(settings.translation_usage_flush_interval)
+    )
+    
+    # Warm the translation cache; /ready reports 503 until every language has loaded
+    warmup = asyncio.create_task(
+        i18n_service.warm_up(
+            hot_categories=settings.translation_preload_hot_categories,
+            retry_interval=settings.translation_warmup_retry_interval
+        )
+    )
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Park Tycoon Game application")
+    warmup.cancel()
+    version_watcher.cancel()
+    usage_writer.cancel()
+    revocation_watcher.cancel()
+    timestamp_flusher.cancel()
+    await i18n_service.flush_usage()
+    try:
+        await timestamp_writer.flush()
+    except Exception as e:
+        logger.error(f"Error writing buffered timestamps on shutdown: {e}")
 
 
 def create_app() -> FastAPI:
@@ -3,7 +3,7 @@ from flask_babel import gettext as _, ngettext
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 from models import db, User, Farm, Crop, Plot
-from utils import login_required, admin_required, get_current_user
+from utils import login_required, admin_required, get_current_user, timestamp_writer
 from config.i18n import safe_translate, translate_error, translate_success
 
 def init_routes(app):
@@ -28,8 +28,8 @@ def init_routes(app):
                 session['username'] = user.username
                 # Load user's preferred language into session
                 session['language'] = user.preferred_language or 'en'
-                user.last_login = datetime.utcnow()
-                db.session.commit()
+                # Written in batches by the timestamp flusher, not one commit per login
+                timestamp_writer.touch(User.last_login, user.id)
                 flash(_('Welcome back, Farmer %(username)s!', username=user.username), 'success')
                 return redirect(url_for('home'))
             else:
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+I18n middleware benchmark script for Park Tycoon.
+
+This script compares requests/sec of the pure ASGI I18nMiddleware against the
+previous BaseHTTPMiddleware-based implementation. Requests are driven straight
+through the ASGI interface so the numbers reflect middleware overhead only.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import logging
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.i18n_middleware import I18nMiddleware
+from app.services.i18n_service import get_i18n_service
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+ACCEPT_LANGUAGE_VALUES = [
+    b"en-US,en;q=0.9",
+    b"fr-FR,fr;q=0.9,en;q=0.8",
+    b"es;q=0.7,zh;q=1.0",
+    b"de-DE,de;q=0.9",
+]
+
+
+class BaseHTTPI18nMiddleware(BaseHTTPMiddleware):
+    """Reference copy of the previous BaseHTTPMiddleware implementation."""
+    
+    def __init__(self, app, default_language: str = "zh"):
+        super().__init__(app)
+        self.default_language = default_language
+        self.i18n_service = get_i18n_service()
+    
+    async def dispatch(self, request: Request, call_next):
+        detected_language = self._detect_request_language(request)
+        request.state.language = detected_language
+        request.state.i18n_service = self.i18n_service
+        
+        response = await call_next(request)
+        response.headers["Content-Language"] = detected_language
+        return response
+    
+    def _detect_request_language(self, request: Request) -> str:
+        lang_param = request.query_params.get("lang")
+        if lang_param and self.i18n_service.is_language_supported(lang_param):
+            return lang_param
+            
+        lang_header = request.headers.get("X-Language")
+        if lang_header and self.i18n_service.is_language_supported(lang_header):
+            return lang_header
+            
+        accept_language = request.headers.get("Accept-Language")
+        if accept_language:
+            detected = self.i18n_service.detect_language_from_header(accept_language)
+            if detected != self.default_language:
+                return detected
+                
+        return self.default_language
+
+
+def build_app(middleware_class) -> FastAPI:
+    """Build a minimal app wrapped in the given middleware."""
+    app = FastAPI()
+    
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"language": request.state.language}
+        
+    app.add_middleware(middleware_class, default_language="zh")
+    return app
+
+
+async def run_requests(app: FastAPI, total_requests: int) -> float:
+    """Drive requests through the ASGI app and return requests/sec."""
+    
+    start = time.perf_counter()
+    for i in range(total_requests):
+        request_sent = False
+        response_complete = asyncio.Event()
+        
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Like a real server, only report a disconnect once the response is done
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+        
+        async def send(message):
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete.set()
+                
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/ping",
+            "raw_path": b"/ping",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"accept-language", ACCEPT_LANGUAGE_VALUES[i % len(ACCEPT_LANGUAGE_VALUES)]),
+            ],
+            "client": ("127.0.0.1", 12345),
+            "server": ("testserver", 80),
+        }
+        await app(scope, receive, send)
+    elapsed = time.perf_counter() - start
+    
+    return total_requests / elapsed
+
+
+async def benchmark(total_requests: int) -> None:
+    """Benchmark both middleware implementations."""
+    results = {}
+    for label, middleware_class in (
+        ("BaseHTTPMiddleware", BaseHTTPI18nMiddleware),
+        ("pure ASGI", I18nMiddleware),
+    ):
+        app = build_app(middleware_class)
+        # Warm up routing, the middleware stack and negotiation caches
+        await run_requests(app, min(total_requests, 500))
+        results[label] = await run_requests(app, total_requests)
+        logger.info(f"{label:>20}: {results[label]:,.0f} requests/sec")
+        
+    speedup = results["pure ASGI"] / results["BaseHTTPMiddleware"]
+    logger.info(f"✓ Pure ASGI middleware is {speedup:.2f}x the BaseHTTPMiddleware throughput")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the I18n middleware")
+    parser.add_argument("--requests", type=int, default=20000, help="Number of requests per run")
+    args = parser.parse_args()
+    
+    logger.info(f"Benchmarking I18n middleware with {args.requests} requests per run...")
+    asyncio.run(benchmark(args.requests))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+SQLite mixed read/write benchmark script for Park Tycoon.
+
+This script runs concurrent sessions that read and update rows of a fresh
+SQLite users table, first with the dev profile (rollback journal, a new
+connection per session, writers racing for the database lock) and then
+with the prod-sqlite profile (WAL pragmas, a connection pool and the
+single writer queue). It reports throughput, latency percentiles and
+``database is locked`` errors for each.
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import logging
+import statistics
+import tempfile
+from datetime import datetime
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import DATABASE_PROFILES
+from app.core.sqlite import WriteQueue, get_sqlite_pragmas, set_sqlite_pragmas
+from app.models.user import User
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def percentile(samples, fraction: float) -> float:
+    """Return a percentile of latencies in milliseconds."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000
+
+
+def create_engine_for(path: str, tuned: bool):
+    """Create an async engine with the dev or the prod-sqlite profile."""
+    url = f"sqlite+aiosqlite:///{path}"
+    if not tuned:
+        return create_async_engine(url, pool_pre_ping=True), None
+        
+    profile = DATABASE_PROFILES["prod-sqlite"]
+    engine = create_async_engine(
+        url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=profile["pool_size"],
+        max_overflow=profile["max_overflow"],
+        pool_timeout=profile["pool_timeout"],
+        pool_pre_ping=profile["pool_pre_ping"],
+    )
+    set_sqlite_pragmas(engine.sync_engine, get_sqlite_pragmas(profile))
+    queue = WriteQueue()
+    queue.attach(engine.sync_engine)
+    return engine, queue
+
+
+async def run(tuned: bool, sessions: int, duration: float, write_ratio: float, rows: int) -> dict:
+    """Run the mixed workload against a fresh database and return its results."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine, queue = create_engine_for(os.path.join(directory, "benchmark.db"), tuned)
+        async with engine.begin() as conn:
+            await conn.run_sync(User.__table__.create)
+            await conn.execute(insert(User), [
+                {"username": f"player{i}", "password_hash": "x", "is_admin": False,
+                 "is_active": True, "created_at": datetime.utcnow()}
+                for i in range(1, rows + 1)
+            ])
+            
+        session_local = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        reads, writes, errors = [], [], 0
+        deadline = time.perf_counter() + duration
+        
+        async def client(seed: int) -> None:
+            nonlocal errors
+            rng = random.Random(seed)
+            while time.perf_counter() < deadline:
+                user_id = rng.randint(1, rows)
+                is_write = rng.random() < write_ratio
+                started = time.perf_counter()
+                try:
+                    async with session_local() as session:
+                        if is_write:
+                            await session.execute(
+                                update(User).where(User.id == user_id).values(last_login=datetime.utcnow())
+                            )
+                            await session.commit()
+                        else:
+                            await session.scalar(select(User).where(User.id == user_id))
+                except OperationalError:
+                    errors += 1
+                    continue
+                (writes if is_write else reads).append(time.perf_counter() - started)
+                
+        started = time.perf_counter()
+        await asyncio.gather(*(client(seed) for seed in range(sessions)))
+        elapsed = time.perf_counter() - started
+        await engine.dispose()
+        
+    return {
+        "ops_per_second": (len(reads) + len(writes)) / elapsed,
+        "reads": len(reads),
+        "writes": len(writes),
+        "errors": errors,
+        "read_p50_ms": percentile(reads, 0.5),
+        "read_p99_ms": percentile(reads, 0.99),
+        "write_p50_ms": percentile(writes, 0.5),
+        "write_p99_ms": percentile(writes, 0.99),
+        "write_mean_ms": statistics.mean(writes) * 1000 if writes else 0.0,
+        "write_queue": queue.get_stats() if queue else None,
+    }
+
+
+async def benchmark(sessions: int, duration: float, write_ratio: float, rows: int) -> None:
+    """Benchmark the dev and prod-sqlite profiles."""
+    results = {}
+    for name, tuned in (("before", False), ("after", True)):
+        results[name] = result = await run(tuned, sessions, duration, write_ratio, rows)
+        logger.info(f"{name:>6}: {result['ops_per_second']:,.0f} ops/s "
+                    f"({result['reads']:,} reads, {result['writes']:,} writes, {result['errors']} errors), "
+                    f"read p50/p99 {result['read_p50_ms']:.1f}/{result['read_p99_ms']:.1f} ms, "
+                    f"write p50/p99 {result['write_p50_ms']:.1f}/{result['write_p99_ms']:.1f} ms")
+        if result["write_queue"]:
+            logger.info(f"        write queue wait avg {result['write_queue']['wait_ms_avg']:.1f} ms, "
+                        f"max {result['write_queue']['wait_ms_max']:.1f} ms")
+                        
+    speedup = results["after"]["ops_per_second"] / max(results["before"]["ops_per_second"], 1e-9)
+    mark = "✓" if speedup >= 1 and results["after"]["errors"] <= results["before"]["errors"] else "✗"
+    logger.info(f"{mark} prod-sqlite runs {speedup:.2f}x the throughput with "
+                f"{results['after']['errors']} instead of {results['before']['errors']} lock errors")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark mixed SQLite reads and writes before and after tuning")
+    parser.add_argument("--sessions", type=int, default=32, help="Concurrent sessions")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per run")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="Fraction of operations that write")
+    parser.add_argument("--rows", type=int, default=10_000, help="Rows in the users table")
+    args = parser.parse_args()
+    
+    logger.info(f"Benchmarking SQLite with {args.sessions} sessions, {args.write_ratio:.0%} writes, "
+                f"{args.duration:g}s per run...")
+    asyncio.run(benchmark(args.sessions, args.duration, args.write_ratio, args.rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Translation store benchmark script for Park Tycoon.
+
+This script loads a synthetic catalog into an I18nService backed by each
+translation store and reports memory per entry, lookup latency and the cost
+of single-key writes. Memory is measured with tracemalloc over the whole
+service (snapshots, category index and resolved fallback chains) and
+includes keys and values, since the service owns its strings once the
+source rows are gone.
+"""
+
+import os
+import sys
+import gc
+import time
+import random
+import argparse
+import logging
+import tracemalloc
+from collections import namedtuple
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.services.compact_store import TRANSLATION_STORES
+from app.services.i18n_service import I18nService
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+logging.getLogger("app.services.i18n_service").setLevel(logging.ERROR)
+
+CATEGORIES = ["ui", "module", "livestock", "error", "market", "tutorial", "achievement", "event"]
+
+# Languages loaded into the service, "en" resolves through the ("en", "zh") chain
+LANGUAGES = ("en", "zh")
+
+Row = namedtuple("Row", ["key", "value", "category"])
+
+
+def synthetic_rows(total_keys: int, language_code: str):
+    """Yield freshly allocated rows shaped like real translations."""
+    for i in range(total_keys):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        yield Row(f"{category}.item_{i:07d}.label", f"{category.capitalize()} label number {i} ({language_code})", category)
+
+
+def measure_memory(store_name: str, total_keys: int):
+    """Load every language into a service and return it with the bytes it retains."""
+    gc.collect()
+    tracemalloc.start()
+    service = I18nService(store=store_name)
+    service.USAGE_SAMPLE_RATE = 0
+    service._reset_usage_countdown()
+    for language_code in LANGUAGES:
+        service._publish_language(language_code, synthetic_rows(total_keys, language_code))
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return service, retained
+
+
+def measure_latency(service, keys, rounds: int) -> float:
+    """Return the mean nanoseconds per lookup over the given keys."""
+    lookup = service.lookup
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        for key in keys:
+            lookup(key, "en")
+        best = min(best, (time.perf_counter_ns() - start) / len(keys))
+    return best
+
+
+def measure_writes(service, writes: int) -> float:
+    """Return the mean nanoseconds per single-key write into a language that is not loaded."""
+    start = time.perf_counter_ns()
+    for i in range(writes):
+        service._cache_translation(f"ui.written_{i:07d}.label", "fr", f"Written label {i}")
+    return (time.perf_counter_ns() - start) / writes
+
+
+def benchmark(total_keys: int, lookups: int, rounds: int) -> None:
+    """Benchmark every translation store."""
+    rng = random.Random(42)
+    hit_keys = [f"{CATEGORIES[i % len(CATEGORIES)]}.item_{i:07d}.label"
+                for i in (rng.randrange(total_keys) for _ in range(lookups))]
+    miss_keys = [f"ui.missing_{i:07d}.label" for i in range(lookups)]
+    
+    entries = total_keys * len(LANGUAGES)
+    results = {}
+    for store_name in TRANSLATION_STORES:
+        start = time.perf_counter()
+        service, retained = measure_memory(store_name, total_keys)
+        build_seconds = time.perf_counter() - start
+        
+        results[store_name] = (
+            retained / entries,
+            measure_latency(service, hit_keys, rounds),
+            measure_latency(service, miss_keys, rounds),
+            measure_writes(service, lookups),
+        )
+        per_entry, hit_ns, miss_ns, write_ns = results[store_name]
+        logger.info(f"{store_name:>8}: {retained / 1024 / 1024:,.1f} MiB, {per_entry:,.1f} bytes/entry, "
+                    f"hit {hit_ns:,.0f} ns, miss {miss_ns:,.0f} ns, write {write_ns:,.0f} ns, "
+                    f"built in {build_seconds:.2f}s")
+        del service
+        
+    memory_ratio = results["dict"][0] / results["compact"][0]
+    latency_ratio = results["compact"][1] / results["dict"][1]
+    logger.info(f"✓ Compact store uses {memory_ratio:.2f}x less memory per entry "
+                f"at {latency_ratio:.1f}x the dict hit latency")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the translation stores")
+    parser.add_argument("--keys", type=int, default=1_000_000, help="Number of keys in the synthetic catalog")
+    parser.add_argument("--lookups", type=int, default=200_000, help="Number of lookups per round")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per measurement, the best is reported")
+    args = parser.parse_args()
+    
+    logger.info(f"Benchmarking translation stores with {args.keys:,} keys per language...")
+    benchmark(args.keys, args.lookups, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
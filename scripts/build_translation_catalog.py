@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Translation catalog build script for Park Tycoon.
+
+This script exports the translations table into a compact, sorted binary
+catalog that every worker can memory-map and serve lookups from directly.
+Point TRANSLATION_CATALOG_PATH at the output to enable it.
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from sqlalchemy.orm import Session
+from app.core.config import get_settings
+from app.core.database import sync_engine
+from app.models.translation import Translation
+from app.services.translation_catalog import TranslationCatalog, write_catalog
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = os.path.join(project_root, 'translations', 'translations.catalog')
+
+
+def build_catalog(output_path: str) -> bool:
+    """Export the translations table into a catalog file."""
+    try:
+        with Session(sync_engine) as session:
+            rows = session.query(
+                Translation.language_code,
+                Translation.category,
+                Translation.key,
+                Translation.value
+            ).yield_per(5000)
+            
+            count = write_catalog(output_path, rows)
+        
+        # Re-open the file to make sure it is readable before workers use it
+        catalog = TranslationCatalog(output_path)
+        for language_code in catalog.languages():
+            logger.info(f"✓ {language_code}: {catalog.count(language_code)} translations, "
+                        f"{len(catalog.categories(language_code))} categories")
+        catalog.close()
+        
+        logger.info(f"✓ Wrote {count} translations to {output_path} ({os.path.getsize(output_path)} bytes)")
+        return True
+        
+    except Exception as e:
+        logger.error(f"✗ Error building translation catalog: {e}")
+        return False
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Build the compiled translation catalog")
+    parser.add_argument(
+        "--output",
+        default=get_settings().translation_catalog_path or DEFAULT_CATALOG_PATH,
+        help="Catalog file to write"
+    )
+    args = parser.parse_args()
+    
+    logger.info("Building translation catalog...")
+    
+    if build_catalog(args.output):
+        logger.info("Translation catalog built successfully!")
+        sys.exit(0)
+    else:
+        logger.error("Translation catalog build failed!")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Bcrypt cost calibration script for Park Tycoon.
+
+This script times bcrypt hashing on the current host for increasing round
+counts and picks the highest count whose median hash time fits the
+configured latency budget. Run it on each host class and set the result
+as BCRYPT_ROUNDS; existing hashes are upgraded on the users' next login.
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+import logging
+import statistics
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from passlib.hash import bcrypt
+
+from app.core.config import get_settings
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+# Bcrypt supports 4 to 31 rounds, below 10 is too cheap for passwords
+MIN_ROUNDS = 10
+MAX_ROUNDS = 31
+
+
+def time_rounds(rounds: int, samples: int) -> float:
+    """Return the median milliseconds to hash a password with the given rounds."""
+    hasher = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(budget_ms: float, samples: int, min_rounds: int = MIN_ROUNDS) -> int:
+    """
+    Pick the highest rounds whose median hash time fits the budget.
+    
+    Each extra round doubles the cost, so timing stops at the first count
+    over budget.
+    
+    Args:
+        budget_ms: Latency budget for one hash in milliseconds
+        samples: Hashes timed per round count
+        min_rounds: Rounds used even if they exceed the budget
+        
+    Returns:
+        int: Rounds to configure
+    """
+    chosen = min_rounds
+    for rounds in range(min_rounds, MAX_ROUNDS + 1):
+        median_ms = time_rounds(rounds, samples)
+        fits = median_ms <= budget_ms
+        logger.info(f"{'✓' if fits else '✗'} {rounds} rounds: {median_ms:,.1f} ms")
+        if not fits:
+            if rounds == min_rounds:
+                logger.warning(f"Even {min_rounds} rounds exceed the {budget_ms:g} ms budget on this host")
+            break
+        chosen = rounds
+    return chosen
+
+
+def write_env(path: str, rounds: int) -> None:
+    """Set BCRYPT_ROUNDS in an env file, adding it if missing."""
+    line = f"BCRYPT_ROUNDS={rounds}"
+    content = ""
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+            
+    if re.search(r"^BCRYPT_ROUNDS=.*$", content, re.MULTILINE):
+        content = re.sub(r"^BCRYPT_ROUNDS=.*$", line, content, flags=re.MULTILINE)
+    else:
+        content += ("" if not content or content.endswith("\n") else "\n") + line + "\n"
+        
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def main():
+    """Main function."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Pick bcrypt rounds that fit a latency budget on this host")
+    parser.add_argument("--budget-ms", type=float, default=settings.password_hash_budget_ms,
+                        help="Latency budget for one hash in milliseconds (default: PASSWORD_HASH_BUDGET_MS)")
+    parser.add_argument("--samples", type=int, default=5, help="Hashes timed per round count")
+    parser.add_argument("--min-rounds", type=int, default=MIN_ROUNDS, help="Lowest rounds to consider")
+    parser.add_argument("--env-file", help="Env file to write BCRYPT_ROUNDS to, e.g. .env")
+    args = parser.parse_args()
+    
+    if not 4 <= args.min_rounds <= MAX_ROUNDS:
+        logger.error(f"✗ --min-rounds must be between 4 and {MAX_ROUNDS}")
+        sys.exit(1)
+        
+    logger.info(f"Calibrating bcrypt against a {args.budget_ms:g} ms budget "
+                f"(currently {settings.bcrypt_rounds} rounds)...")
+    rounds = calibrate(args.budget_ms, args.samples, args.min_rounds)
+    logger.info(f"✓ Use BCRYPT_ROUNDS={rounds}")
+    
+    if args.env_file:
+        write_env(args.env_file, rounds)
+        logger.info(f"✓ Wrote BCRYPT_ROUNDS={rounds} to {args.env_file}")
+
+
+if __name__ == '__main__':
+    main()
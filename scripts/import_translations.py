@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Bulk translation import script for Park Tycoon.
+
+This script streams a JSON Lines, CSV or gettext .po file into the
+translations table in chunked upserts, then bumps the version of every
+changed language and category once so running workers reload them.
+"""
+
+import os
+import sys
+import argparse
+import logging
+
+# Add the project root to the Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app.services.translation_import import (
+    DEFAULT_CHUNK_SIZE,
+    IMPORT_PARSERS,
+    TranslationImportError,
+    detect_format,
+    import_translations
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def import_file(path: str, import_format: str, language_code: str, chunk_size: int) -> bool:
+    """Import one translation file."""
+    try:
+        with open(path, encoding="utf-8-sig", newline="") as lines:
+            stats = import_translations(IMPORT_PARSERS[import_format](lines, language_code), chunk_size)
+            
+        logger.info(f"✓ Imported {stats['rows']} translations in {stats['chunks']} chunk(s) "
+                    f"({stats['rows_per_second']:,} rows/sec)")
+        logger.info(f"✓ Invalidated {stats['scopes']} scope(s) in languages {', '.join(stats['languages']) or '-'}")
+        return True
+        
+    except (OSError, TranslationImportError, UnicodeDecodeError) as e:
+        logger.error(f"✗ Error importing {path}: {e}")
+        return False
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Import translations from a JSON Lines, CSV or .po file")
+    parser.add_argument("path", help="File to import")
+    parser.add_argument("--format", choices=sorted(IMPORT_PARSERS), help="Import format (detected from the file name by default)")
+    parser.add_argument("--language", help="Language of rows that do not name one (defaults to the .po Language header)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per upsert")
+    args = parser.parse_args()
+    
+    import_format = args.format or detect_format(args.path)
+    if import_format is None:
+        parser.error(f"cannot detect the format of {args.path}, use --format")
+        
+    logger.info(f"Importing {args.path} as {import_format}...")
+    
+    if import_file(args.path, import_format, args.language, args.chunk_size):
+        logger.info("Translation import completed successfully!")
+        sys.exit(0)
+    else:
+        logger.error("Translation import failed!")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,8 +9,9 @@ from main import app
 
 @pytest.fixture
 def client():
-    """Create test client."""
-    return TestClient(app)
+    """Create test client, running startup so every table exists."""
+    with TestClient(app) as client:
+        yield client
 
 
 class TestUserRegistration:
@@ -254,17 +255,18 @@ class TestTokenRefresh:
     
     def test_refresh_token_success(self, client: TestClient):
         """Test successful token refresh."""
-        # Register user to get token
+        # Register user to get tokens
         register_response = client.post("/api/v1/auth/register", json={
             "username": "refreshuser",
             "password": "refreshpass123"
         })
         original_token = register_response.json()["access_token"]
+        original_refresh_token = register_response.json()["refresh_token"]
         
         # Refresh token
         response = client.post(
             "/api/v1/auth/refresh",
-            headers={"Authorization": f"Bearer {original_token}"}
+            json={"refresh_token": original_refresh_token}
         )
         
         assert response.status_code == 200
@@ -275,22 +277,40 @@ class TestTokenRefresh:
         assert "expires_in" in data
         assert data["user"]["username"] == "refreshuser"
         assert data["access_token"] != original_token  # New token should be different
+        assert data["refresh_token"] != original_refresh_token  # Refresh tokens are rotated
+    
+    def test_refresh_token_reuse(self, client: TestClient):
+        """Test that reusing a refresh token ends the whole session."""
+        register_response = client.post("/api/v1/auth/register", json={
+            "username": "reuseuser",
+            "password": "reusepass123"
+        })
+        original_refresh_token = register_response.json()["refresh_token"]
+        
+        rotated = client.post("/api/v1/auth/refresh", json={"refresh_token": original_refresh_token})
+        assert rotated.status_code == 200
+        
+        # The replayed token and the token rotated from it are both rejected
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": original_refresh_token})
+        assert response.status_code == 401
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": rotated.json()["refresh_token"]})
+        assert response.status_code == 401
     
     def test_refresh_token_invalid_token(self, client: TestClient):
         """Test token refresh with invalid token."""
         response = client.post(
             "/api/v1/auth/refresh",
-            headers={"Authorization": "Bearer invalid_token"}
+            json={"refresh_token": "invalid_token"}
         )
         
         assert response.status_code == 401
-        assert "Invalid or expired token" in response.json()["detail"]
+        assert "Invalid or expired refresh token" in response.json()["detail"]
     
     def test_refresh_token_missing_token(self, client: TestClient):
         """Test token refresh without token."""
         response = client.post("/api/v1/auth/refresh")
         
-        assert response.status_code == 403
+        assert response.status_code == 422
 
 
 class TestPasswordChange:
@@ -427,12 +447,12 @@ class TestAuthenticationFlow:
             "password": "flowpass123"
         })
         assert login_response.status_code == 200
-        login_token = login_response.json()["access_token"]
+        login_refresh_token = login_response.json()["refresh_token"]
         
         # 4. Refresh token
         refresh_response = client.post(
             "/api/v1/auth/refresh",
-            headers={"Authorization": f"Bearer {login_token}"}
+            json={"refresh_token": login_refresh_token}
         )
         assert refresh_response.status_code == 200
         refresh_token = refresh_response.json()["access_token"]
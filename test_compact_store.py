@@ -0,0 +1,152 @@
+"""
+Unit tests for the compact translation store.
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+
+from app.services.compact_store import BLOCK_SIZE, CompactTranslations
+from app.services.i18n_service import I18nService, _ResolvedChain
+
+
+@pytest.fixture
+def translations():
+    """Translations spanning several index blocks, including non-ASCII values."""
+    values = {f"ui.item_{i:03d}": f"Item {i}" for i in range(BLOCK_SIZE * 3 + 5)}
+    values["module.market"] = "市场"
+    values["ui.empty"] = ""
+    return values
+
+
+@pytest.fixture
+def i18n_service():
+    """Create an I18nService that publishes into compact stores."""
+    return I18nService(store="compact")
+
+
+class TestCompactTranslations:
+    """Test lookups against the packed arrays."""
+    
+    def test_round_trip(self, translations):
+        """Test that every key is found, including block boundaries."""
+        store = CompactTranslations(translations)
+        
+        assert len(store) == len(translations)
+        for key, value in translations.items():
+            assert store[key] == value
+            assert key in store
+        assert store == translations
+    
+    def test_missing_keys(self, translations):
+        """Test keys before, between and after the stored ones."""
+        store = CompactTranslations(translations)
+        
+        for key in ("", "a", "ui.item_000x", "ui.item", "ui.item_016.label", "zzz", "ui.item_001\0ui.item_002"):
+            assert store.get(key) is None
+            assert key not in store
+        with pytest.raises(KeyError):
+            store["zzz"]
+        assert store.get("zzz", "fallback") == "fallback"
+    
+    def test_iteration_is_sorted(self, translations):
+        """Test that keys and items iterate in key order."""
+        store = CompactTranslations(translations.items())
+        
+        assert list(store) == sorted(translations)
+        assert list(store.items()) == sorted(translations.items())
+        assert dict(store.items()) == translations
+    
+    def test_empty_store(self):
+        """Test that an empty store behaves like an empty mapping."""
+        store = CompactTranslations()
+        
+        assert len(store) == 0
+        assert list(store) == []
+        assert store.get("ui.welcome") is None
+    
+    def test_is_immutable(self, translations):
+        """Test that the store cannot be modified in place."""
+        store = CompactTranslations(translations)
+        
+        with pytest.raises(TypeError):
+            store["ui.welcome"] = "Welcome"
+    
+    def test_rejects_nul_in_keys(self):
+        """Test that keys cannot contain the separator byte."""
+        with pytest.raises(ValueError):
+            CompactTranslations({"ui.bad\0key": "Bad"})
+
+
+class TestCompactBackedService:
+    """Test I18nService publishing into compact stores."""
+    
+    def test_unknown_store(self):
+        """Test that only known stores can be selected."""
+        with pytest.raises(ValueError):
+            I18nService(store="btree")
+    
+    def test_published_snapshots_are_compact(self, i18n_service):
+        """Test that the snapshot and category index are compact and chains are not copied."""
+        i18n_service._publish("en", {"ui.welcome": "Welcome", "ui.login": "Login"},
+                              {"ui": {"ui.welcome": "Welcome", "ui.login": "Login"}})
+        i18n_service._cache_loaded.update({"en", "zh"})
+        i18n_service._publish("zh", {"ui.welcome": "欢迎"}, {"ui": {"ui.welcome": "欢迎"}})
+        
+        assert isinstance(i18n_service._cache["en"], CompactTranslations)
+        assert isinstance(i18n_service.get_cached_category("ui", "zh"), CompactTranslations)
+        assert isinstance(i18n_service._resolved["zh"], _ResolvedChain)
+        assert dict(i18n_service._resolved["zh"]) == {"ui.welcome": "欢迎", "ui.login": "Login"}
+        assert i18n_service.get_translation("ui.welcome", "zh") == "欢迎"
+        assert i18n_service.get_translation("ui.login", "zh") == "Login"
+        assert i18n_service.get_translations_by_category("ui", "en") == {"ui.welcome": "Welcome", "ui.login": "Login"}
+    
+    def test_single_key_updates(self, i18n_service):
+        """Test that single-key updates merge into loaded categories."""
+        i18n_service._publish("en", {"ui.welcome": "Welcome"}, {"ui": {"ui.welcome": "Welcome"}})
+        i18n_service._cache_translation("ui.login", "en", "Login")
+        i18n_service._cache_translation("ui.welcome", "en", "Welcome!")
+        
+        assert i18n_service.get_cached_category("ui", "en") == {"ui.welcome": "Welcome!", "ui.login": "Login"}
+        assert i18n_service.get_cache_stats()["total_cached_translations"] == 2
+
+    def test_single_keys_are_not_compacted(self, i18n_service):
+        """Test that single-key writes leave the snapshot and resolved chains alone."""
+        i18n_service._cache_loaded.update({"en", "zh"})
+        i18n_service._publish("en", {"ui.welcome": "Welcome"}, {"ui": {"ui.welcome": "Welcome"}})
+        i18n_service._publish("zh", {"ui.welcome": "欢迎"}, {"ui": {"ui.welcome": "欢迎"}})
+        snapshot = i18n_service._cache["en"]
+        chain = i18n_service._resolved["zh"]
+        
+        i18n_service._cache_translation("module.market", "en", "Market")
+        
+        assert i18n_service._cache["en"] is snapshot
+        assert i18n_service._resolved["zh"] is chain
+        assert i18n_service.lookup("module.market", "zh") == "Market"
+        
+        i18n_service._publish("en", {"module.shop": "Shop"}, {"module": {"module.shop": "Shop"}})
+        assert i18n_service._overlays == {}
+        assert i18n_service.lookup("module.shop", "zh") == "Shop"
+    
+    def test_service_uses_less_memory(self):
+        """Test that a compact-backed service retains less than a dict-backed one."""
+        def retained(store: str) -> int:
+            gc.collect()
+            tracemalloc.start()
+            service = I18nService(store=store)
+            service._cache_loaded.update({"en", "zh"})
+            for language_code in ("en", "zh"):
+                categories = {}
+                for i in range(5000):
+                    category = f"cat{i % 10}"
+                    categories.setdefault(category, {})[f"{category}.item_{i:05d}"] = f"{language_code} label {i}"
+                service._publish(language_code, {k: v for values in categories.values() for k, v in values.items()}, categories)
+                del categories
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del service
+            return size
+            
+        assert retained("compact") * 2 < retained("dict")
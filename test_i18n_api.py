@@ -0,0 +1,273 @@
+"""
+Integration tests for internationalization API endpoints
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.core.middleware import get_current_admin_user, get_current_user
+from app.models.user import User
+from app.services.i18n_service import get_i18n_service
+from app.core.i18n_helpers import get_bundle_cache, etag_matches
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+@pytest.fixture
+def admin():
+    """Authenticate every request as an admin user."""
+    app.dependency_overrides[get_current_admin_user] = lambda: User(
+        id=1, username="admin", password_hash="x", is_admin=True, is_active=True
+    )
+    yield
+    app.dependency_overrides.pop(get_current_admin_user, None)
+
+
+@pytest.fixture
+def player():
+    """Authenticate every request as a user without admin rights."""
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=2, username="player", password_hash="x", is_admin=False, is_active=True
+    )
+    yield
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.fixture
+def i18n_service():
+    """Seed the global I18n service with a fully loaded test category."""
+    service = get_i18n_service()
+    service._publish("en", {"bundle.hello": "Hello"}, {"bundle": {"bundle.hello": "Hello"}})
+    yield service
+    service.clear_cache()
+    get_bundle_cache().clear()
+
+
+class TestTranslationBundles:
+    """Test pre-serialized, ETag-cached translation bundles."""
+    
+    def test_bundle_response_headers(self, client, i18n_service):
+        """Test that category responses carry ETag and Cache-Control."""
+        response = client.get("/api/v1/i18n/translations?category=bundle&lang=en")
+        
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+        assert "max-age=" in response.headers["Cache-Control"]
+        assert response.headers["Content-Language"] == "en"
+        
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"]["translations"] == {"bundle.hello": "Hello"}
+        assert data["data"]["category"] == "bundle"
+        assert data["data"]["total_count"] == 1
+    
+    def test_if_none_match_returns_304(self, client, i18n_service):
+        """Test that a matching If-None-Match is answered with 304."""
+        etag = client.get("/api/v1/i18n/translations?category=bundle&lang=en").headers["ETag"]
+        
+        response = client.get(
+            "/api/v1/i18n/translations?category=bundle&lang=en",
+            headers={"If-None-Match": etag}
+        )
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+    
+    def test_bundle_is_only_rebuilt_when_translations_change(self, client, i18n_service):
+        """Test that bundles are reused until the category changes."""
+        client.get("/api/v1/i18n/translations?category=bundle&lang=en")
+        translations = i18n_service.get_cached_category("bundle", "en")
+        bundle = get_bundle_cache().get_bundle("en", "bundle", translations)
+        
+        first_etag = client.get("/api/v1/i18n/translations?category=bundle&lang=en").headers["ETag"]
+        assert get_bundle_cache().get_bundle("en", "bundle", translations) is bundle
+        
+        i18n_service._cache_translation("bundle.bye", "en", "Bye")
+        response = client.get(
+            "/api/v1/i18n/translations?category=bundle&lang=en",
+            headers={"If-None-Match": first_etag}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["ETag"] != first_etag
+        assert response.json()["data"]["translations"]["bundle.bye"] == "Bye"
+
+
+class TestTranslationBatch:
+    """Test the bulk translation lookup endpoint."""
+    
+    def test_batch_returns_every_language(self, client, i18n_service):
+        """Test that several languages are returned in one response."""
+        i18n_service._publish("zh", {"bundle.hello": "你好"})
+        
+        response = client.post("/api/v1/i18n/translations:batch", json={
+            "keys": ["bundle.hello"],
+            "languages": ["en", "zh"]
+        })
+        
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["translations"] == {
+            "en": {"bundle.hello": "Hello"},
+            "zh": {"bundle.hello": "你好"}
+        }
+        assert data["total_count"] == 2
+    
+    def test_batch_defaults_to_request_language(self, client, i18n_service):
+        """Test that the request language is used when none are given."""
+        response = client.post("/api/v1/i18n/translations:batch?lang=en", json={"keys": ["bundle.hello"]})
+        
+        assert response.json()["data"]["translations"] == {"en": {"bundle.hello": "Hello"}}
+    
+    def test_batch_rejects_unsupported_language(self, client, i18n_service):
+        """Test that unsupported languages are reported."""
+        response = client.post("/api/v1/i18n/translations:batch", json={
+            "keys": ["bundle.hello"],
+            "languages": ["en", "de"]
+        })
+        
+        error = response.json()["error"]
+        assert error["code"] == "unsupported_language"
+        assert error["details"]["requested_languages"] == ["de"]
+    
+    def test_batch_requires_keys(self, client):
+        """Test that an empty key list is rejected."""
+        response = client.post("/api/v1/i18n/translations:batch", json={"keys": []})
+        
+        assert response.status_code == 422
+
+
+class TestEtagMatching:
+    """Test If-None-Match parsing."""
+    
+    def test_etag_matches(self):
+        """Test strong, weak, list and wildcard If-None-Match values."""
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches('"xyz", "abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+        assert not etag_matches('"xyz"', '"abc"')
+        assert not etag_matches(None, '"abc"')
+
+
+class TestReadiness:
+    """Test the readiness endpoint."""
+    
+    @pytest.fixture
+    def warmup_state(self):
+        """Restore the global service's warmup state after the test."""
+        service = get_i18n_service()
+        ready = service._ready
+        yield service
+        service._ready = ready
+    
+    def test_not_ready_until_warm(self, client, warmup_state):
+        """Test that readiness is 503 while translations are warming up."""
+        warmup_state._ready = False
+        
+        response = client.get("/api/v1/ready")
+        
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+        assert client.get("/api/v1/health").status_code == 200
+    
+    def test_ready_after_warmup(self, client, warmup_state):
+        """Test that readiness is 200 once warmup has finished."""
+        warmup_state._ready = True
+        
+        response = client.get("/api/v1/ready")
+        
+        assert response.status_code == 200
+        assert response.json()["translations"]["ready"] is True
+
+
+class TestTranslationUsage:
+    """Test the translation usage endpoint."""
+    
+    def test_requires_admin(self, client, player):
+        """Test that the usage report is only served to admin users."""
+        assert client.get("/api/v1/i18n/usage").status_code == 403
+    
+    def test_unsupported_language(self, client, admin):
+        """Test that unknown languages are rejected before querying usage."""
+        response = client.get("/api/v1/i18n/usage?language=xx")
+        
+        assert response.json()["error"]["code"] == "unsupported_language"
+
+
+class TestCacheClear:
+    """Test the translation cache clearing endpoint."""
+    
+    def test_requires_authentication(self, client):
+        """Test that anonymous clients cannot clear the cache of every worker."""
+        assert client.post("/api/v1/i18n/cache/clear").status_code in (401, 403)
+    
+    def test_requires_admin(self, client, player):
+        """Test that the cache is only cleared for admin users."""
+        assert client.post("/api/v1/i18n/cache/clear").status_code == 403
+    
+    def test_unsupported_language(self, client, admin):
+        """Test that unknown languages are rejected before clearing anything."""
+        response = client.post("/api/v1/i18n/cache/clear?language=xx")
+        
+        assert response.json()["error"]["code"] == "unsupported_language"
+
+
+class TestTranslationImport:
+    """Test the bulk translation import endpoint."""
+    
+    def test_requires_authentication(self, client):
+        """Test that anonymous clients cannot import translations."""
+        response = client.post(
+            "/api/v1/i18n/translations:import?language=en",
+            files={"file": ("catalog.jsonl", b'{"key": "ui.welcome", "value": "Hacked"}\n', "application/x-ndjson")}
+        )
+        
+        assert response.status_code in (401, 403)
+    
+    def test_requires_admin(self, client, player):
+        """Test that users without admin rights cannot import translations."""
+        response = client.post(
+            "/api/v1/i18n/translations:import?language=en",
+            files={"file": ("catalog.jsonl", b'{"key": "ui.welcome", "value": "Hacked"}\n', "application/x-ndjson")}
+        )
+        
+        assert response.status_code == 403
+    
+    def test_unsupported_format(self, client, admin):
+        """Test that files of unknown formats are rejected before importing."""
+        response = client.post(
+            "/api/v1/i18n/translations:import",
+            files={"file": ("notes.txt", b"ui.welcome=Welcome\n", "text/plain")}
+        )
+        
+        assert response.json()["error"]["code"] == "unsupported_format"
+    
+    def test_invalid_rows_are_reported(self, client, admin):
+        """Test that malformed files are reported with the failing line."""
+        response = client.post(
+            "/api/v1/i18n/translations:import?language=en",
+            files={"file": ("catalog.jsonl", b'{"value": "Welcome"}\n', "application/x-ndjson")}
+        )
+        
+        assert response.json()["error"]["code"] == "invalid_import"
+        assert "Line 1" in response.json()["error"]["details"]["message"]
+
+
+class TestTranslationChanges:
+    """Test the delta sync endpoint."""
+    
+    def test_unsupported_language(self, client):
+        """Test that unknown languages are rejected."""
+        response = client.get("/api/v1/i18n/translations/changes?since=0&language=xx")
+        
+        assert response.json()["error"]["code"] == "unsupported_language"
+    
+    def test_since_is_required(self, client):
+        """Test that the client version must be given."""
+        assert client.get("/api/v1/i18n/translations/changes").status_code == 422
@@ -0,0 +1,79 @@
+"""
+Unit tests for the I18n ASGI middleware.
+"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.i18n_middleware import I18nMiddleware, get_request_language
+
+
+@pytest.fixture
+def app():
+    """Create a minimal app wrapped in the I18n middleware."""
+    app = FastAPI()
+    
+    @app.get("/language")
+    async def language(request: Request):
+        return {"language": get_request_language(request)}
+        
+    app.add_middleware(I18nMiddleware, default_language="zh", accept_language_cache_size=2)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create test client."""
+    return TestClient(app)
+
+
+def get_middleware(app) -> I18nMiddleware:
+    """Find the I18n middleware instance in the built middleware stack."""
+    node = app.middleware_stack
+    while not isinstance(node, I18nMiddleware):
+        node = node.app
+    return node
+
+
+class TestI18nMiddleware:
+    """Test cases for I18nMiddleware."""
+    
+    def test_default_language(self, client):
+        """Test that requests without hints use the default language."""
+        response = client.get("/language")
+        
+        assert response.json() == {"language": "zh"}
+        assert response.headers["Content-Language"] == "zh"
+    
+    def test_detection_priority(self, client):
+        """Test query parameter > X-Language > Accept-Language priority."""
+        headers = {"X-Language": "es", "Accept-Language": "fr"}
+        
+        assert client.get("/language?lang=en", headers=headers).json()["language"] == "en"
+        assert client.get("/language", headers=headers).json()["language"] == "es"
+        assert client.get("/language", headers={"Accept-Language": "fr"}).json()["language"] == "fr"
+    
+    def test_unsupported_hints_are_ignored(self, client):
+        """Test that unsupported languages fall through to the next source."""
+        response = client.get("/language?lang=de", headers={"X-Language": "it", "Accept-Language": "en-GB"})
+        
+        assert response.json()["language"] == "en"
+        assert response.headers["Content-Language"] == "en"
+    
+    def test_accept_language_is_memoized(self, app, client):
+        """Test that repeated Accept-Language values are served from the LRU cache."""
+        for _ in range(3):
+            client.get("/language", headers={"Accept-Language": "fr-FR,fr;q=0.9"})
+            
+        cache_info = get_middleware(app).get_accept_language_cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+    
+    def test_accept_language_cache_is_bounded(self, app, client):
+        """Test that the negotiation cache never exceeds its configured size."""
+        for value in ("en", "fr", "es", "zh", "en-US"):
+            client.get("/language", headers={"Accept-Language": value})
+            
+        cache_info = get_middleware(app).get_accept_language_cache_info()
+        assert cache_info.currsize == 2
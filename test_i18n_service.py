@@ -2,14 +2,35 @@
 Unit tests for I18nService operations.
 """
 
+import asyncio
+import threading
+import time
+from datetime import timedelta
 import pytest
+import pytest_asyncio
 from unittest.mock import Mock, patch
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.core.database import Base
-from app.models.translation import Translation
-from app.services.i18n_service import I18nService, get_i18n_service, translate, t
+from app.models.translation import (
+    Translation,
+    TranslationTombstone,
+    TranslationUsage,
+    TranslationVersion,
+    TranslationVersionCounter
+)
+from app.services.i18n_service import (
+    I18nService,
+    bump_translation_version,
+    get_i18n_service,
+    seed_translation_version_counter,
+    translate,
+    t
+)
+from app.services.message_format import compile_message
 
 
 # Test database setup
@@ -41,6 +62,35 @@ def test_db():
     session.close()
 
 
+@pytest_asyncio.fixture
+async def async_session_local():
+    """Create an async session factory bound to a seeded in-memory database."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(seed_translation_version_counter)
+        
+    TestAsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with TestAsyncSessionLocal() as session:
+        session.add_all([
+            Translation(key="ui.welcome", language_code="en", value="Welcome", category="ui"),
+            Translation(key="ui.welcome", language_code="zh", value="欢迎", category="ui"),
+            Translation(key="ui.login", language_code="en", value="Login", category="ui"),
+            Translation(key="module.market", language_code="en", value="Market", category="module"),
+            Translation(key="module.market", language_code="zh", value="市场", category="module"),
+        ])
+        await session.commit()
+        
+    with patch('app.services.i18n_service.AsyncSessionLocal', TestAsyncSessionLocal):
+        yield TestAsyncSessionLocal
+        
+    await engine.dispose()
+
+
 @pytest.fixture
 def i18n_service():
     """Create a fresh I18nService instance for testing."""
@@ -263,6 +313,881 @@ class TestI18nService:
         mock_session.close.assert_called()
 
 
+class TestNegativeCache:
+    """Test the negative cache for missing translation keys."""
+    
+    def test_repeated_miss_queries_database_once(self, i18n_service):
+        """Test that a missing key is only looked up once per language."""
+        with patch.object(i18n_service, '_load_translation_from_db', return_value=None) as mock_load:
+            for _ in range(3):
+                assert i18n_service.get_translation("ui.missing", "fr") == "ui.missing"
+                
+            assert mock_load.call_count == 3  # fr -> en -> zh fallback chain
+            assert i18n_service.get_cache_stats()["negative_cached_keys"] == 3
+            assert i18n_service.get_cache_stats()["negative_cache_hits"] == 6
+    
+    def test_repeated_miss_warns_once(self, i18n_service, caplog):
+        """Test that warnings for the same missing key are rate-limited."""
+        with patch.object(i18n_service, '_load_translation_from_db', return_value=None):
+            with caplog.at_level("WARNING", logger="app.services.i18n_service"):
+                for _ in range(5):
+                    i18n_service.get_translation("ui.missing", "en")
+                    
+        assert len([r for r in caplog.records if "ui.missing" in r.getMessage()]) == 1
+    
+    def test_negative_entries_expire(self, i18n_service):
+        """Test that negative entries are retried after their TTL."""
+        i18n_service.NEGATIVE_CACHE_TTL = -1
+        with patch.object(i18n_service, '_load_translation_from_db', return_value=None) as mock_load:
+            i18n_service.get_translation("ui.missing", "en")
+            i18n_service.get_translation("ui.missing", "en")
+            
+            assert mock_load.call_count == 4
+    
+    def test_negative_cache_is_bounded(self, i18n_service):
+        """Test that the oldest misses are evicted beyond the size limit."""
+        i18n_service.NEGATIVE_CACHE_SIZE = 2
+        for key in ("a.one", "a.two", "a.three"):
+            i18n_service._remember_missing(key, "en")
+            
+        assert list(i18n_service._missing) == [("a.two", "en"), ("a.three", "en")]
+    
+    def test_caching_translation_clears_negative_entry(self, i18n_service):
+        """Test that newly loaded translations invalidate negative entries."""
+        i18n_service._remember_missing("ui.new", "en")
+        i18n_service._cache_translation("ui.new", "en", "New")
+        
+        assert not i18n_service._is_known_missing("ui.new", "en")
+        assert i18n_service.get_translation("ui.new", "en") == "New"
+    
+    def test_orm_write_invalidates_negative_entry(self, test_db, i18n_service):
+        """Test that writing a translation through the ORM invalidates its miss."""
+        i18n_service._remember_missing("ui.added", "en")
+        
+        with patch('app.services.i18n_service._i18n_service', i18n_service):
+            test_db.add(Translation(key="ui.added", language_code="en", value="Added", category="ui"))
+            test_db.commit()
+            
+        assert not i18n_service._is_known_missing("ui.added", "en")
+    
+    def test_clear_cache_clears_negative_entries(self, i18n_service):
+        """Test that clearing the cache also drops negative entries."""
+        i18n_service._remember_missing("ui.missing", "en")
+        i18n_service._remember_missing("ui.missing", "zh")
+        
+        i18n_service.clear_cache("en")
+        assert list(i18n_service._missing) == [("ui.missing", "zh")]
+        
+        i18n_service.clear_cache()
+        assert len(i18n_service._missing) == 0
+
+
+class TestCategoryIndex:
+    """Test the per-category index inside the translation cache."""
+    
+    def test_partially_cached_category_is_not_loaded(self, i18n_service):
+        """Test that a single cached key does not mark its category as loaded."""
+        i18n_service._cache_translation("ui.welcome", "en", "Welcome")
+        
+        assert not i18n_service._is_category_cached("ui", "en")
+        assert i18n_service.get_cached_category("ui", "en") == {}
+    
+    def test_category_lookup_returns_precomputed_mapping(self, i18n_service):
+        """Test that loaded categories are served from a frozen mapping."""
+        i18n_service._publish("en", {"ui.welcome": "Welcome"}, {"ui": {"ui.welcome": "Welcome"}})
+        
+        with patch.object(i18n_service, '_load_category_from_db') as mock_load:
+            first = i18n_service.get_translations_by_category("ui", "en")
+            second = i18n_service.get_translations_by_category("ui", "en")
+            
+            mock_load.assert_not_called()
+            
+        assert first is second
+        assert first == {"ui.welcome": "Welcome"}
+        with pytest.raises(TypeError):
+            first["ui.login"] = "Login"
+    
+    def test_empty_category_is_tracked_as_loaded(self, i18n_service):
+        """Test that a category without rows is not queried again."""
+        with patch.object(i18n_service, '_load_category_from_db', wraps=i18n_service._load_category_from_db) as mock_load:
+            with patch('app.services.i18n_service.SessionLocal') as mock_session_local:
+                mock_session_local.return_value.query.return_value.filter.return_value.all.return_value = []
+                
+                assert i18n_service.get_translations_by_category("empty", "en") == {}
+                assert i18n_service.get_translations_by_category("empty", "en") == {}
+                
+            assert mock_load.call_count == 1
+    
+    def test_single_key_update_refreshes_loaded_category(self, i18n_service):
+        """Test that caching a key keeps an already loaded category in sync."""
+        i18n_service._publish("en", {"ui.welcome": "Welcome"}, {"ui": {"ui.welcome": "Welcome"}})
+        i18n_service._cache_translation("ui.login", "en", "Login")
+        
+        assert i18n_service.get_cached_category("ui", "en") == {"ui.welcome": "Welcome", "ui.login": "Login"}
+    
+    def test_clear_cache_drops_category_index(self, i18n_service):
+        """Test that clearing the cache also clears the category index."""
+        i18n_service._publish("en", {"ui.welcome": "Welcome"}, {"ui": {"ui.welcome": "Welcome"}})
+        i18n_service._publish("zh", {"ui.welcome": "欢迎"}, {"ui": {"ui.welcome": "欢迎"}})
+        
+        i18n_service.clear_cache("en")
+        assert not i18n_service._is_category_cached("ui", "en")
+        assert i18n_service._is_category_cached("ui", "zh")
+        assert i18n_service.get_cache_stats()["indexed_categories"] == 1
+
+
+class TestOverlay:
+    """Test the per-language overlay for single-key writes."""
+    
+    def test_single_keys_do_not_copy_snapshot(self, i18n_service):
+        """Test that single keys of unloaded categories are written to the overlay only."""
+        i18n_service._publish("en", {"ui.welcome": "Welcome"}, {"ui": {"ui.welcome": "Welcome"}})
+        snapshot = i18n_service._cache
+        
+        i18n_service._cache_translation("module.market", "en", "Market")
+        i18n_service._cache_translation("module.market", "en", "Market!")
+        
+        assert i18n_service._cache is snapshot
+        assert i18n_service._get_from_cache("module.market", "en") == "Market!"
+        assert i18n_service.get_cache_stats()["overlay_translations"] == 1
+        assert i18n_service.get_cache_stats()["total_cached_translations"] == 2
+    
+    def test_load_merges_overlay(self, i18n_service):
+        """Test that the next load merges the overlay into the snapshot and drops it."""
+        i18n_service._cache_translation("module.market", "en", "Market")
+        i18n_service._cache_translation("ui.removed", "en", "Removed")
+        
+        i18n_service._publish("en", {"ui.welcome": "Welcome"}, {"ui": {"ui.welcome": "Welcome"}})
+        
+        assert dict(i18n_service._cache["en"]) == {"module.market": "Market", "ui.welcome": "Welcome"}
+        assert "en" not in i18n_service._overlays
+        assert i18n_service.get_cache_stats()["overlay_translations"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_bulk_key_loads_use_overlay(self, async_session_local, i18n_service):
+        """Test that keys loaded by a bulk lookup land in the overlay."""
+        result = await i18n_service.get_translations(["ui.welcome", "module.market"], ["en"])
+        
+        assert result == {"en": {"ui.welcome": "Welcome", "module.market": "Market"}}
+        assert dict(i18n_service._cache) == {}
+        assert i18n_service._overlays["en"] == {"ui.welcome": "Welcome", "module.market": "Market"}
+        
+        await i18n_service.load_language("en")
+        assert "en" not in i18n_service._overlays
+        assert i18n_service.lookup("module.market", "en") == "Market"
+    
+    @pytest.mark.asyncio
+    async def test_reloaded_scope_drops_overlay_keys(self, async_session_local, i18n_service):
+        """Test that a changed scope drops the overlay keys it covers."""
+        await i18n_service.sync_versions()
+        i18n_service._cache_translation("ui.welcome", "en", "stale")
+        i18n_service._cache_translation("module.market", "en", "Market")
+        
+        await i18n_service.invalidate("en")
+        await i18n_service.sync_versions()
+        
+        assert i18n_service._get_from_cache("ui.welcome", "en") is None
+        assert i18n_service._get_from_cache("module.market", "en") is None
+
+
+class TestAsyncLoading:
+    """Test the non-blocking async loading path."""
+    
+    @pytest.mark.asyncio
+    async def test_load_category_publishes_snapshot(self, async_session_local, i18n_service):
+        """Test that loading a category publishes an immutable snapshot."""
+        loaded = await i18n_service.load_category("ui", "en")
+        
+        assert loaded == 2
+        assert i18n_service._get_from_cache("ui.welcome", "en") == "Welcome"
+        with pytest.raises(TypeError):
+            i18n_service._cache["en"]["ui.welcome"] = "Changed"
+    
+    @pytest.mark.asyncio
+    async def test_snapshot_is_replaced_not_mutated(self, async_session_local, i18n_service):
+        """Test that readers holding an old snapshot are unaffected by loads."""
+        await i18n_service.load_category("ui", "en")
+        old_snapshot = i18n_service._cache
+        
+        await i18n_service.load_category("module", "en")
+        
+        assert "module.market" not in old_snapshot["en"]
+        assert i18n_service._get_from_cache("module.market", "en") == "Market"
+    
+    @pytest.mark.asyncio
+    async def test_key_stored_under_another_category(self, async_session_local, i18n_service):
+        """Test that a key whose category differs from its prefix is not reported missing."""
+        async with async_session_local() as session:
+            session.add(Translation(key="ui.market_banner", language_code="en", value="Market open", category="module"))
+            await session.commit()
+            
+        await i18n_service.load_category("ui", "en")
+        
+        assert i18n_service.lookup("ui.market_banner", "en") == "Market open"
+        assert await i18n_service.get_translation_async("ui.market_banner", "en") == "Market open"
+        assert not i18n_service._is_known_missing("ui.market_banner", "en")
+        assert i18n_service.get_cached_category("ui", "en") == {"ui.welcome": "Welcome", "ui.login": "Login"}
+    
+    @pytest.mark.asyncio
+    async def test_get_translation_async_with_fallback(self, async_session_local, i18n_service):
+        """Test async lookup falls back to the fallback language."""
+        assert await i18n_service.get_translation_async("ui.welcome", "zh") == "欢迎"
+        assert await i18n_service.get_translation_async("ui.login", "zh") == "Login"
+        assert await i18n_service.get_translation_async("ui.unknown", "zh") == "ui.unknown"
+    
+    @pytest.mark.asyncio
+    async def test_lookup_miss_loads_in_background(self, async_session_local, i18n_service):
+        """Test that a cold lookup returns immediately and warms the cache."""
+        assert i18n_service.lookup("module.market", "zh") == "module.market"
+        assert i18n_service._background_loads
+        
+        await asyncio.gather(*i18n_service._background_loads.values())
+        
+        assert i18n_service.lookup("module.market", "zh") == "市场"
+        assert not i18n_service._background_loads
+    
+    @pytest.mark.asyncio
+    async def test_lookup_miss_in_loaded_category_is_not_reloaded(self, async_session_local, i18n_service):
+        """Test that a key missing from a loaded category does not trigger reloads."""
+        await i18n_service.load_category("ui", "en")
+        await i18n_service.load_category("ui", "zh")
+        
+        assert i18n_service.lookup("ui.unknown", "zh") == "ui.unknown"
+        assert not i18n_service._background_loads
+        assert i18n_service._is_known_missing("ui.unknown", "zh")
+    
+    @pytest.mark.asyncio
+    async def test_bulk_lookup_uses_single_query(self, async_session_local, i18n_service):
+        """Test that bulk lookups resolve all misses with one IN query."""
+        statements = []
+        engine = async_session_local.kw["bind"].sync_engine
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            keys = ["ui.welcome", "ui.login", "module.market", "ui.unknown"]
+            result = await i18n_service.get_translations(keys, ["zh", "en", "fr"])
+            
+            assert len(statements) == 1
+            assert " IN " in statements[0]
+            assert result["zh"] == {
+                "ui.welcome": "欢迎",
+                "ui.login": "Login",
+                "module.market": "市场",
+                "ui.unknown": "ui.unknown"
+            }
+            assert result["fr"]["ui.welcome"] == "Welcome"
+            assert result["en"]["module.market"] == "Market"
+            
+            # Everything is now cached or known to be missing
+            assert await i18n_service.get_translations(keys, ["zh", "en", "fr"]) == result
+            assert len(statements) == 1
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+    
+    def test_lookup_without_event_loop(self, i18n_service):
+        """Test that lookup outside an event loop does no I/O."""
+        with patch.object(i18n_service, 'load_category') as mock_load:
+            assert i18n_service.lookup("ui.welcome", "en") == "ui.welcome"
+            mock_load.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_load_language_marks_preloaded(self, async_session_local, i18n_service):
+        """Test that loading a whole language marks it as preloaded."""
+        loaded = await i18n_service.load_language("zh")
+        
+        assert loaded == 2
+        assert "zh" in i18n_service._cache_loaded
+        assert i18n_service.get_cached_category("module", "zh") == {"module.market": "市场"}
+        # Categories without rows are known to be empty once the language is loaded
+        assert i18n_service._is_category_cached("error", "zh")
+
+
+class TestFallbackChains:
+    """Test fallback chains pre-resolved at load time."""
+    
+    def test_fallback_chains(self, i18n_service):
+        """Test chain order and region variant support."""
+        assert i18n_service.get_fallback_chain("fr") == ("fr", "en", "zh")
+        assert i18n_service.get_fallback_chain("zh-TW") == ("zh-TW", "zh", "en")
+        assert i18n_service.is_language_supported("en-GB")
+        assert "zh-TW" not in i18n_service.get_available_languages()
+    
+    @pytest.mark.asyncio
+    async def test_loaded_chain_is_merged(self, async_session_local, i18n_service):
+        """Test that a fully loaded chain answers lookups from one dictionary."""
+        await i18n_service.warm_up(["es", "en", "zh"])
+        
+        assert i18n_service._resolved["es"]["ui.welcome"] == "Welcome"
+        assert i18n_service._resolved["es"]["module.market"] == "Market"
+        assert "fr" not in i18n_service._resolved  # fr itself is not loaded
+        
+        with patch.object(i18n_service, '_get_from_cache') as mock_get, \
+                patch.object(i18n_service, '_load_translation_from_db') as mock_load:
+            assert i18n_service.lookup("ui.login", "zh") == "Login"
+            assert i18n_service.get_translation("ui.welcome", "es") == "Welcome"
+            assert await i18n_service.get_translation_async("ui.unknown", "es") == "ui.unknown"
+            mock_get.assert_not_called()
+            mock_load.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_region_variant_overrides_base_language(self, async_session_local, i18n_service):
+        """Test that a region variant only needs its own differences."""
+        async with async_session_local() as session:
+            session.add(Translation(key="ui.welcome", language_code="zh-TW", value="歡迎", category="ui"))
+            await session.commit()
+            
+        await i18n_service.warm_up(["zh-TW", "zh", "en"])
+        
+        assert i18n_service.lookup("ui.welcome", "zh-TW") == "歡迎"
+        assert i18n_service.lookup("module.market", "zh-TW") == "市场"
+        assert i18n_service.lookup("ui.login", "zh-TW") == "Login"
+        assert await i18n_service.get_translations(["ui.welcome"], ["zh-TW", "zh"]) == {
+            "zh-TW": {"ui.welcome": "歡迎"},
+            "zh": {"ui.welcome": "欢迎"}
+        }
+    
+    @pytest.mark.asyncio
+    async def test_empty_translation_is_not_skipped(self, async_session_local, i18n_service):
+        """Test that an empty translation ends the chain instead of falling back."""
+        async with async_session_local() as session:
+            session.add_all([
+                Translation(key="ui.tagline", language_code="fr", value="", category="ui"),
+                Translation(key="ui.tagline", language_code="en", value="Build your dream park", category="ui")
+            ])
+            await session.commit()
+            
+        assert await i18n_service.get_translations(["ui.tagline"], ["fr"]) == {"fr": {"ui.tagline": ""}}
+    
+    @pytest.mark.asyncio
+    async def test_single_key_update_respects_chain_order(self, async_session_local, i18n_service):
+        """Test that updates only change keys not shadowed earlier in the chain."""
+        await i18n_service.warm_up(["zh", "en"])
+        
+        i18n_service._cache_translation("ui.welcome", "en", "Welcome!")
+        i18n_service._cache_translation("ui.new", "en", "New")
+        
+        assert i18n_service._resolved["en"]["ui.welcome"] == "Welcome!"
+        assert i18n_service._resolved["zh"]["ui.welcome"] == "欢迎"
+        assert i18n_service._resolved["zh"]["ui.new"] == "New"
+    
+    @pytest.mark.asyncio
+    async def test_clearing_a_language_unresolves_dependent_chains(self, async_session_local, i18n_service):
+        """Test that chains are only resolved while every language is loaded."""
+        await i18n_service.warm_up(["zh", "en"])
+        
+        i18n_service.clear_cache("en")
+        
+        assert dict(i18n_service._resolved) == {}
+        assert i18n_service.get_cache_stats()["resolved_languages"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_explicit_fallback_bypasses_chain(self, async_session_local, i18n_service):
+        """Test that an explicit fallback language is still honoured."""
+        await i18n_service.warm_up(["fr", "en", "zh"])
+        
+        assert i18n_service.lookup("module.market", "fr") == "Market"
+        assert i18n_service.lookup("module.market", "fr", fallback_language="zh") == "市场"
+
+
+class TestMessageFormat:
+    """Test the cached message formatting layer."""
+    
+    def test_format_compiles_once(self, i18n_service):
+        """Test that each (key, language) is only compiled once."""
+        i18n_service._publish("en", {"farm.animals": "{count, plural, one {# animal} other {# animals}}"})
+        
+        with patch('app.services.i18n_service.compile_message', wraps=compile_message) as mock_compile:
+            assert i18n_service.format("farm.animals", "en", count=1) == "1 animal"
+            assert i18n_service.format("farm.animals", "en", count=3) == "3 animals"
+            
+        assert mock_compile.call_count == 1
+        assert i18n_service.get_cache_stats()["compiled_formatters"] == 1
+    
+    def test_format_recompiles_changed_text(self, i18n_service):
+        """Test that an updated translation replaces its formatter."""
+        i18n_service._publish("en", {"ui.greeting": "Hello {name}"})
+        assert i18n_service.format("ui.greeting", "en", name="Ana") == "Hello Ana"
+        
+        i18n_service._publish("en", {"ui.greeting": "Hi {name}"})
+        
+        assert i18n_service.format("ui.greeting", "en", name="Ana") == "Hi Ana"
+    
+    def test_format_accepts_key_and_language_as_params(self, i18n_service):
+        """Test that arguments may be named like the positional parameters."""
+        i18n_service._publish("en", {"ui.label": "{key} ({language_code})"})
+        
+        assert i18n_service.format("ui.label", "en", key="K", language_code="L") == "K (L)"
+    
+    def test_malformed_translation_is_returned_verbatim(self, i18n_service, caplog):
+        """Test that a malformed translation never breaks formatting."""
+        i18n_service._publish("en", {"ui.broken": "Hello {name"})
+        
+        with caplog.at_level("WARNING", logger="app.services.i18n_service"):
+            assert i18n_service.format("ui.broken", "en", name="Ana") == "Hello {name"
+            assert i18n_service.format("ui.broken", "en", name="Ana") == "Hello {name"
+            
+        assert len([r for r in caplog.records if "Malformed" in r.getMessage()]) == 1
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent cache misses."""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_category_loads_share_one_query(self, async_session_local, i18n_service):
+        """Test that concurrent misses on one category run a single query."""
+        statements = []
+        engine = async_session_local.kw["bind"].sync_engine
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            results = await asyncio.gather(*(i18n_service.load_category("ui", "en") for _ in range(10)))
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+            
+        assert results == [2] * 10
+        assert len(statements) == 1
+        assert i18n_service.get_cache_stats()["coalesced_category_loads"] == 9
+        assert not i18n_service._in_flight
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_key_loads_share_one_query(self, async_session_local, i18n_service):
+        """Test that overlapping bulk lookups only query each key once."""
+        statements = []
+        engine = async_session_local.kw["bind"].sync_engine
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            first, second = await asyncio.gather(
+                i18n_service.get_translations(["ui.welcome", "ui.login"], ["en"]),
+                i18n_service.get_translations(["ui.welcome", "ui.login"], ["en"])
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+            
+        assert first == second == {"en": {"ui.welcome": "Welcome", "ui.login": "Login"}}
+        assert len(statements) == 1
+        # Both keys in the target and the fallback language
+        assert i18n_service.get_cache_stats()["coalesced_key_loads"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_load(self, async_session_local, i18n_service):
+        """Test that the shared load survives a cancelled request."""
+        first = asyncio.ensure_future(i18n_service.load_category("ui", "en"))
+        second = asyncio.ensure_future(i18n_service.load_category("ui", "en"))
+        await asyncio.sleep(0)
+        first.cancel()
+        
+        assert await second == 2
+        assert first.cancelled()
+    
+    def test_concurrent_threads_share_one_load(self, i18n_service):
+        """Test that blocking callers in several threads share one load."""
+        calls = []
+        
+        def slow_fetch(category, language_code):
+            calls.append((category, language_code))
+            time.sleep(0.05)
+            i18n_service._publish(language_code, {"ui.welcome": "Welcome"}, {category: {"ui.welcome": "Welcome"}})
+            
+        barrier = threading.Barrier(8)
+        results = []
+        
+        def worker():
+            barrier.wait()
+            results.append(i18n_service.get_translations_by_category("ui", "en"))
+            
+        with patch.object(i18n_service, '_fetch_category_from_db', side_effect=slow_fetch):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+                
+        assert calls == [("ui", "en")]
+        assert all(result == {"ui.welcome": "Welcome"} for result in results)
+        # Threads arriving after the load finished hit the cache instead
+        assert 0 < i18n_service.get_cache_stats()["coalesced_category_loads"] <= 7
+
+
+class TestWarmup:
+    """Test startup warmup of all languages."""
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_loads_languages_concurrently(self, async_session_local, i18n_service):
+        """Test that every language is loaded concurrently before becoming ready."""
+        in_flight = 0
+        max_in_flight = 0
+        load_language = i18n_service.load_language
+        
+        async def tracked_load(language_code):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            try:
+                return await load_language(language_code)
+            finally:
+                in_flight -= 1
+                
+        assert not i18n_service.is_ready()
+        with patch.object(i18n_service, 'load_language', side_effect=tracked_load):
+            counts = await i18n_service.warm_up()
+            
+        assert counts == {"en": 3, "en-GB": 0, "es": 0, "fr": 0, "zh": 2, "zh-TW": 0}
+        assert max_in_flight == 6
+        assert i18n_service.is_ready()
+        assert i18n_service._cache_loaded == {"en", "en-GB", "es", "fr", "zh", "zh-TW"}
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_logs_timing_per_language(self, async_session_local, i18n_service, caplog):
+        """Test that load times are logged and reported for each language."""
+        with caplog.at_level("INFO", logger="app.services.i18n_service"):
+            await i18n_service.warm_up(["en", "zh"])
+            
+        messages = [r.getMessage() for r in caplog.records]
+        assert any(m.startswith("Preloaded 3 translations for en in ") for m in messages)
+        assert any(m.startswith("Preloaded 2 translations for zh in ") for m in messages)
+        assert set(i18n_service.get_warmup_status()["languages"]) == {"en", "zh"}
+
+    @pytest.mark.asyncio
+    async def test_failed_language_keeps_service_unready(self, async_session_local, i18n_service, caplog):
+        """Test that a language that could not be read is reported and blocks readiness."""
+        fetch_language = i18n_service._fetch_language
+        
+        async def failing_fetch(language_code):
+            if language_code == "zh":
+                return None
+            return await fetch_language(language_code)
+            
+        with patch.object(i18n_service, '_fetch_language', side_effect=failing_fetch), \
+                caplog.at_level("ERROR", logger="app.services.i18n_service"):
+            counts = await i18n_service.warm_up(["en", "zh"])
+            
+        assert counts == {"en": 3}
+        assert not i18n_service.is_ready()
+        assert i18n_service.get_warmup_status()["failed"] == ["zh"]
+        assert any("zh" in r.getMessage() for r in caplog.records)
+    
+    @pytest.mark.asyncio
+    async def test_failed_language_is_retried(self, async_session_local, i18n_service):
+        """Test that failed languages are loaded again until every language succeeds."""
+        attempts = []
+        fetch_language = i18n_service._fetch_language
+        
+        async def flaky_fetch(language_code):
+            attempts.append(language_code)
+            if attempts.count(language_code) == 1 and language_code == "zh":
+                return None
+            return await fetch_language(language_code)
+            
+        with patch.object(i18n_service, '_fetch_language', side_effect=flaky_fetch):
+            counts = await i18n_service.warm_up(["en", "zh"], retry_interval=0.01)
+            
+        assert counts == {"en": 3, "zh": 2}
+        assert sorted(attempts) == ["en", "zh", "zh"]
+        assert i18n_service.is_ready()
+        assert i18n_service.get_warmup_status()["failed"] == []
+
+
+class TestVersionSync:
+    """Test cross-worker invalidation through translation version stamps."""
+    
+    @pytest.mark.asyncio
+    async def test_writes_stamp_their_scope(self, async_session_local):
+        """Test that ORM writes bump one version per language and category."""
+        async with async_session_local() as session:
+            result = await session.execute(select(TranslationVersion.language_code, TranslationVersion.category))
+            
+        assert sorted(result.all()) == [("en", "module"), ("en", "ui"), ("zh", "module"), ("zh", "ui")]
+    
+    @pytest.mark.asyncio
+    async def test_versions_come_from_counter(self, async_session_local):
+        """Test that every stamp takes the next counter value, seeded from existing stamps."""
+        async with async_session_local() as session:
+            assert (await session.get(TranslationVersionCounter, TranslationVersionCounter.ROW_ID)).version == 4
+            
+            versions = [
+                await session.run_sync(bump_translation_version, "en", "ui"),
+                await session.run_sync(bump_translation_version, "zh"),
+                await session.run_sync(bump_translation_version, "en", "ui")
+            ]
+            await session.commit()
+            
+            counter = await session.get(TranslationVersionCounter, TranslationVersionCounter.ROW_ID, populate_existing=True)
+            stamped = (await session.execute(
+                select(TranslationVersion.version).where(TranslationVersion.language_code == "en", TranslationVersion.category == "ui")
+            )).scalar_one()
+            
+        assert versions == [5, 6, 7]
+        assert counter.version == 7
+        assert stamped == 7
+    
+    @pytest.mark.asyncio
+    async def test_missing_counter_is_seeded_once(self, async_session_local):
+        """Test that a missing counter row is created from the stamps, and seeding twice is harmless."""
+        async with async_session_local() as session:
+            await session.execute(delete(TranslationVersionCounter))
+            await session.run_sync(lambda sync_session: seed_translation_version_counter(sync_session.connection()))
+            await session.run_sync(lambda sync_session: seed_translation_version_counter(sync_session.connection()))
+            assert (await session.get(TranslationVersionCounter, TranslationVersionCounter.ROW_ID)).version == 4
+            
+            await session.execute(delete(TranslationVersionCounter))
+            assert await session.run_sync(bump_translation_version, "en", "ui") == 5
+            await session.commit()
+    
+    @pytest.mark.asyncio
+    async def test_only_changed_category_is_reloaded(self, async_session_local, i18n_service):
+        """Test that another worker's write reloads just the affected category."""
+        assert await i18n_service.sync_versions() == 0
+        await i18n_service.load_category("ui", "en")
+        await i18n_service.load_category("module", "en")
+        module_mapping = i18n_service.get_cached_category("module", "en")
+        
+        async with async_session_local() as session:
+            translation = (await session.execute(
+                select(Translation).where(Translation.key == "ui.welcome", Translation.language_code == "en")
+            )).scalar_one()
+            translation.value = "Welcome back"
+            await session.commit()
+            
+        assert await i18n_service.sync_versions() == 1
+        assert i18n_service.lookup("ui.welcome", "en") == "Welcome back"
+        assert i18n_service.get_cached_category("module", "en") is module_mapping
+        assert await i18n_service.sync_versions() == 0
+    
+    @pytest.mark.asyncio
+    async def test_deleted_keys_are_dropped(self, async_session_local, i18n_service):
+        """Test that keys deleted by another worker stop being served."""
+        await i18n_service.sync_versions()
+        await i18n_service.load_category("ui", "en")
+        
+        async with async_session_local() as session:
+            translation = (await session.execute(
+                select(Translation).where(Translation.key == "ui.login", Translation.language_code == "en")
+            )).scalar_one()
+            await session.delete(translation)
+            await session.commit()
+            
+        await i18n_service.sync_versions()
+        
+        assert i18n_service.get_cached_category("ui", "en") == {"ui.welcome": "Welcome"}
+        assert i18n_service.lookup("ui.login", "en") == "ui.login"
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_reaches_other_workers(self, async_session_local, i18n_service):
+        """Test that invalidating a language reloads it in every service instance."""
+        other_worker = I18nService()
+        await other_worker.sync_versions()
+        await other_worker.load_language("zh")
+        other_worker._publish("zh", {"ui.welcome": "stale"})
+        
+        await i18n_service.invalidate("zh")
+        assert await other_worker.sync_versions() == 1
+        
+        assert other_worker.lookup("ui.welcome", "zh") == "欢迎"
+        assert "zh" in other_worker._cache_loaded
+        assert "en" not in other_worker._cache
+    
+    @pytest.mark.asyncio
+    async def test_invalidated_language_is_never_empty(self, async_session_local, i18n_service):
+        """Test that a reloaded language is swapped in only after it has been loaded."""
+        await i18n_service.sync_versions()
+        await i18n_service.load_language("en")
+        await i18n_service.invalidate("en")
+        
+        served = []
+        real_execute = AsyncSession.execute
+        
+        async def execute(session, *args, **kwargs):
+            served.append(i18n_service.lookup("ui.welcome", "en"))
+            return await real_execute(session, *args, **kwargs)
+            
+        with patch.object(AsyncSession, "execute", execute):
+            assert await i18n_service.sync_versions() == 1
+            
+        assert served and set(served) == {"Welcome"}
+        assert "en" in i18n_service._cache_loaded
+    
+    @pytest.mark.asyncio
+    async def test_invalidated_language_drops_deleted_categories(self, async_session_local, i18n_service):
+        """Test that reloading a whole language drops keys of categories that no longer exist."""
+        await i18n_service.sync_versions()
+        await i18n_service.load_language("en")
+        
+        async with async_session_local() as session:
+            translation = (await session.execute(
+                select(Translation).where(Translation.key == "module.market", Translation.language_code == "en")
+            )).scalar_one()
+            await session.delete(translation)
+            await session.commit()
+        await i18n_service.invalidate("en")
+        await i18n_service.sync_versions()
+        
+        assert i18n_service.lookup("module.market", "en") == "module.market"
+        assert i18n_service.lookup("ui.login", "en") == "Login"
+
+
+class TestDeltaSync:
+    """Test catalog changes since a version."""
+    
+    @pytest.fixture
+    def exact_service(self, i18n_service):
+        """Disable the look-back overlap so changes are exact."""
+        i18n_service.CHANGES_OVERLAP = timedelta(0)
+        return i18n_service
+    
+    async def _write(self, async_session_local, key, language_code, value=None, rename=None):
+        """Update, rename or (without a value) delete one translation."""
+        async with async_session_local() as session:
+            translation = (await session.execute(
+                select(Translation).where(Translation.key == key, Translation.language_code == language_code)
+            )).scalar_one()
+            if rename:
+                translation.key = rename
+            elif value is None:
+                await session.delete(translation)
+            else:
+                translation.value = value
+            await session.commit()
+    
+    @pytest.mark.asyncio
+    async def test_full_sync(self, async_session_local, exact_service):
+        """Test that version 0 returns the whole catalog."""
+        changes = await exact_service.get_changes(0)
+        
+        assert changes["reset"] is True
+        assert changes["version"] == 4
+        assert changes["changed"]["en"] == {
+            "ui": {"ui.welcome": "Welcome", "ui.login": "Login"},
+            "module": {"module.market": "Market"}
+        }
+        assert changes["deleted"] == {}
+    
+    @pytest.mark.asyncio
+    async def test_only_changes_since_version(self, async_session_local, exact_service):
+        """Test that a synced client only receives what changed after its version."""
+        version = (await exact_service.get_changes(0))["version"]
+        assert (await exact_service.get_changes(version))["changed"] == {}
+        
+        await self._write(async_session_local, "ui.welcome", "en", "Welcome back")
+        changes = await exact_service.get_changes(version)
+        
+        assert changes["reset"] is False
+        assert changes["version"] == version + 1
+        assert changes["changed"] == {"en": {"ui": {"ui.welcome": "Welcome back"}}}
+        assert (await exact_service.get_changes(version, "zh"))["changed"] == {}
+    
+    @pytest.mark.asyncio
+    async def test_deletions_are_tombstoned(self, async_session_local, exact_service):
+        """Test that deleted and renamed keys are reported until they exist again."""
+        version = (await exact_service.get_changes(0))["version"]
+        
+        await self._write(async_session_local, "ui.login", "en")
+        await self._write(async_session_local, "module.market", "zh", rename="module.shop")
+        changes = await exact_service.get_changes(version)
+        
+        assert changes["deleted"] == {"en": {"ui": ["ui.login"]}, "zh": {"module": ["module.market"]}}
+        assert changes["changed"] == {"zh": {"module": {"module.shop": "市场"}}}
+        
+        async with async_session_local() as session:
+            session.add(Translation(key="ui.login", language_code="en", value="Sign in", category="ui"))
+            await session.commit()
+            tombstones = (await session.execute(select(TranslationTombstone.key))).scalars().all()
+            
+        assert tombstones == ["module.market"]
+        assert "en" not in (await exact_service.get_changes(version))["deleted"]
+
+
+class TestUsageTelemetry:
+    """Test sampled translation key usage counters."""
+    
+    @pytest.fixture
+    def counting_service(self, i18n_service):
+        """Sample every lookup so counts are exact."""
+        i18n_service.USAGE_SAMPLE_RATE = 1
+        i18n_service._reset_usage_countdown()
+        return i18n_service
+    
+    @pytest.mark.asyncio
+    async def test_lookups_are_counted_and_flushed(self, async_session_local, counting_service):
+        """Test that sampled hits accumulate in the usage table across flushes."""
+        await counting_service.warm_up(["zh", "en"])
+        for _ in range(3):
+            counting_service.lookup("ui.welcome", "en")
+        counting_service.get_translation("module.market", "zh")
+        
+        assert await counting_service.flush_usage() == 2
+        counting_service.format("ui.welcome", "en")
+        assert await counting_service.flush_usage() == 1
+        assert await counting_service.flush_usage() == 0
+        
+        async with async_session_local() as session:
+            result = await session.execute(
+                select(TranslationUsage.key, TranslationUsage.language_code, TranslationUsage.category, TranslationUsage.hits)
+            )
+        assert sorted(result.all()) == [("module.market", "zh", "module", 1), ("ui.welcome", "en", "ui", 4)]
+    
+    def test_sampling_is_disabled_with_zero_rate(self, i18n_service):
+        """Test that a zero sample rate records nothing."""
+        i18n_service.USAGE_SAMPLE_RATE = 0
+        i18n_service._reset_usage_countdown()
+        i18n_service._publish("en", {"ui.welcome": "Welcome"})
+        
+        for _ in range(1000):
+            i18n_service.lookup("ui.welcome", "en")
+            
+        assert i18n_service.get_cache_stats()["pending_usage_keys"] == 0
+    
+    def test_samples_are_scaled_by_rate(self, i18n_service):
+        """Test that each sample stands for USAGE_SAMPLE_RATE lookups on average."""
+        i18n_service._publish("en", {"ui.welcome": "Welcome"})
+        
+        for _ in range(64 * 200):
+            i18n_service.lookup("ui.welcome", "en")
+            
+        assert 64 * 100 < i18n_service._usage[("ui.welcome", "en")] < 64 * 400
+    
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_counts(self, counting_service):
+        """Test that counts survive a database error and are retried."""
+        counting_service._publish("en", {"ui.welcome": "Welcome"})
+        counting_service.lookup("ui.welcome", "en")
+        
+        with patch('app.services.i18n_service.AsyncSessionLocal', side_effect=Exception("Database error")):
+            assert await counting_service.flush_usage() == 0
+            
+        assert counting_service._usage == {("ui.welcome", "en"): 1}
+    
+    @pytest.mark.asyncio
+    async def test_usage_report(self, async_session_local, counting_service):
+        """Test hot and never-hit keys per language."""
+        await counting_service.warm_up(["zh", "en"])
+        counting_service.lookup("ui.welcome", "en")
+        counting_service.lookup("ui.welcome", "en")
+        counting_service.lookup("module.market", "en")
+        
+        report = await counting_service.get_usage_report("en", limit=10)
+        
+        assert [(row["key"], row["hits"]) for row in report["hot_keys"]] == [("ui.welcome", 2), ("module.market", 1)]
+        assert report["hot_categories"] == [{"category": "ui", "hits": 2}, {"category": "module", "hits": 1}]
+        assert report["never_hit_keys"] == ["ui.login"]
+        assert report["never_hit_count"] == 1
+        assert (await counting_service.get_usage_report("zh"))["never_hit_count"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_preloads_hot_categories(self, async_session_local, counting_service):
+        """Test that recorded usage limits warmup to the most used categories."""
+        counting_service.lookup("module.market", "en")
+        await asyncio.gather(*counting_service._background_loads.values())
+        await counting_service.flush_usage()
+        counting_service.clear_cache()
+        
+        assert await counting_service.warm_up(["en", "zh"], hot_categories=1) == {"en": 1, "zh": 2}
+        assert counting_service._is_category_cached("module", "en")
+        assert not counting_service._is_category_cached("ui", "en")
+        assert "zh" in counting_service._cache_loaded  # no usage recorded, whole language
+
+
 class TestConvenienceFunctions:
     """Test convenience functions."""
     
@@ -0,0 +1,64 @@
+"""
+Unit tests for compiled message formatting.
+"""
+
+import pytest
+
+from app.services.message_format import MessageFormatError, compile_message, plural_rule
+
+ANIMALS = "{count, plural, =0 {No animals} one {# animal} other {# animals}} in {farm}"
+
+
+class TestCompileMessage:
+    """Test parsing and formatting of messages."""
+    
+    def test_plain_text_is_static(self):
+        """Test that messages without arguments format to themselves."""
+        assert compile_message("Welcome", "en").format({}) == "Welcome"
+        assert compile_message("", "en").format({"unused": 1}) == ""
+    
+    def test_arguments(self):
+        """Test plain argument substitution."""
+        message = compile_message("Hello {name}, you have {money} coins", "en")
+        
+        assert message.format({"name": "Ana", "money": 10}) == "Hello Ana, you have 10 coins"
+        assert message.format({"name": "Ana"}) == "Hello Ana, you have {money} coins"
+    
+    def test_plural_branches(self):
+        """Test exact matches, plural categories and the # placeholder."""
+        message = compile_message(ANIMALS, "en")
+        
+        assert message.format({"count": 0, "farm": "Farm"}) == "No animals in Farm"
+        assert message.format({"count": 1, "farm": "Farm"}) == "1 animal in Farm"
+        assert message.format({"count": 7, "farm": "Farm"}) == "7 animals in Farm"
+    
+    def test_plural_rules_follow_language(self):
+        """Test that the language's plural rule is bound at compile time."""
+        message = "{count, plural, one {# poule} other {# poules}}"
+        
+        assert compile_message(message, "fr").format({"count": 0}) == "0 poule"
+        assert compile_message(message, "en").format({"count": 0}) == "0 poules"
+        assert compile_message(message, "zh").format({"count": 1}) == "1 poules"
+        assert plural_rule("en-GB") is plural_rule("en")
+    
+    def test_select(self):
+        """Test select arguments with nested plurals."""
+        message = compile_message(
+            "{role, select, owner {You own {count, plural, one {# farm} other {# farms}}} other {Guest}}",
+            "en"
+        )
+        
+        assert message.format({"role": "owner", "count": 2}) == "You own 2 farms"
+        assert message.format({"role": "visitor"}) == "Guest"
+    
+    @pytest.mark.parametrize("text", [
+        "{",
+        "}",
+        "{count, plural, one {x}}",
+        "{count, date}",
+        "{count, plural, other {x}",
+    ])
+    def test_malformed_messages(self, text):
+        """Test that malformed arguments are rejected."""
+        with pytest.raises(MessageFormatError):
+            compile_message(text, "en")
@@ -0,0 +1,183 @@
+"""
+Unit tests for the bounded password hashing pool.
+"""
+
+import asyncio
+import threading
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+
+from app.core.middleware import get_current_admin_user
+from app.core.security import PasswordHashingOverloaded, PasswordHashingPool, hash_password, verify_password
+from app.models.user import User
+from app.services import auth_service as auth_module
+from app.services.auth_service import AuthService
+from main import app
+
+pytestmark = pytest.mark.async_session_targets("app.services.auth_service.AsyncSessionLocal")
+
+
+@pytest.fixture
+def client():
+    """Create test client, running startup so every table exists."""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def gate():
+    """An event that blocks pool workers until the test sets it."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+class TestPasswordHashingPool:
+    """Test the executor limits and metrics."""
+    
+    @pytest.mark.asyncio
+    async def test_hashes_off_the_event_loop(self):
+        """Test that hashing runs on a pool thread and is timed."""
+        pool = PasswordHashingPool(max_workers=1, max_queue=1)
+        
+        hashed = await pool.run(hash_password, "secret123")
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+        
+        assert verify_password("secret123", hashed)
+        assert thread_name.startswith("password-hash")
+        stats = pool.get_stats()
+        assert stats["completed"] == 2
+        assert stats["running"] == stats["queued"] == stats["shed"] == 0
+        assert stats["hash_time_ms_max"] > 0
+    
+    @pytest.mark.asyncio
+    async def test_sheds_calls_over_the_queue_limit(self, gate):
+        """Test that calls beyond the running and queued limit fail fast."""
+        pool = PasswordHashingPool(max_workers=1, max_queue=1)
+        running = asyncio.ensure_future(pool.run(gate.wait))
+        queued = asyncio.ensure_future(pool.run(gate.wait))
+        await asyncio.sleep(0.05)
+        
+        with pytest.raises(PasswordHashingOverloaded):
+            await pool.run(hash_password, "secret123")
+        assert pool.get_stats()["running"] == 1
+        assert pool.get_stats()["queued"] == 1
+        
+        gate.set()
+        await asyncio.gather(running, queued)
+        stats = pool.get_stats()
+        assert stats["shed"] == 1
+        assert stats["completed"] == 2
+        assert stats["queue_wait_ms_max"] > 0
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_callers_free_their_slot(self, gate):
+        """Test that a caller cancelled while queued does not hold the queue."""
+        pool = PasswordHashingPool(max_workers=1, max_queue=1)
+        running = asyncio.ensure_future(pool.run(gate.wait))
+        queued = asyncio.ensure_future(pool.run(gate.wait))
+        await asyncio.sleep(0.05)
+        
+        queued.cancel()
+        await asyncio.sleep(0)
+        assert pool.get_stats()["queued"] == 0
+        
+        gate.set()
+        await running
+        assert await pool.run(verify_password, "secret123", hash_password("secret123"))
+
+
+class TestOverloadedEndpoints:
+    """Test that shed password work is reported as 503."""
+    
+    def test_login_is_shed_with_503(self, client):
+        """Test that a full hashing queue rejects logins with Retry-After."""
+        client.post("/api/v1/auth/register", json={"username": "shedlogin", "password": "testpass123"})
+        
+        with patch("app.services.auth_service.verify_password_async", side_effect=PasswordHashingOverloaded("full")):
+            response = client.post("/api/v1/auth/login", json={"username": "shedlogin", "password": "testpass123"})
+            
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+    
+    def test_register_is_shed_with_503(self, client):
+        """Test that a full hashing queue rejects registrations."""
+        with patch("app.services.auth_service.hash_password_async", side_effect=PasswordHashingOverloaded("full")):
+            response = client.post("/api/v1/auth/register", json={"username": "shedregister", "password": "testpass123"})
+            
+        assert response.status_code == 503
+    
+    def test_hashing_stats(self, client):
+        """Test that the pool statistics are exposed to admin users only."""
+        assert client.get("/api/v1/auth/hashing/stats").status_code in (401, 403)
+        
+        with patch.dict(app.dependency_overrides, {get_current_admin_user: lambda: User(id=1, username="admin", password_hash="x", is_admin=True, is_active=True)}):
+            response = client.get("/api/v1/auth/hashing/stats")
+        
+        assert response.status_code == 200
+        assert {"workers", "queue_limit", "queued", "shed", "queue_wait_ms_avg", "hash_time_ms_avg"} <= set(response.json())
+
+
+@pytest.fixture
+def async_session_local(async_session_local):
+    """Use the shared in-memory database with cheaper configured hashing rounds."""
+    with patch("app.core.security.pwd_context", CryptContext(schemes=["bcrypt"], bcrypt__rounds=5)):
+        yield async_session_local
+
+
+async def stored_hash(async_session_local, user_id):
+    """Return the password hash stored for a user."""
+    async with async_session_local() as session:
+        return (await session.get(User, user_id)).password_hash
+
+
+class TestRehashOnLogin:
+    """Test that stale hashes are upgraded to the configured rounds."""
+    
+    @pytest_asyncio.fixture
+    async def stale_user(self, async_session_local):
+        """A user whose password was hashed with fewer rounds than configured."""
+        async with async_session_local() as session:
+            user = User(username="keeper", password_hash=CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("password123"))
+            session.add(user)
+            await session.commit()
+            return user.id
+    
+    @pytest.mark.asyncio
+    async def test_successful_login_rehashes_in_background(self, async_session_local, stale_user):
+        """Test that a login with a stale hash rewrites it after returning."""
+        with patch.object(auth_module, "schedule_rehash") as schedule_rehash:
+            async with async_session_local() as session:
+                assert await AuthService(session).authenticate_user("keeper", "password123") is not None
+                
+        schedule_rehash.assert_called_once()
+        assert (await stored_hash(async_session_local, stale_user)).startswith("$2b$04$")
+        
+        assert await auth_module.rehash_password(*schedule_rehash.call_args.args)
+        new_hash = await stored_hash(async_session_local, stale_user)
+        assert new_hash.startswith("$2b$05$")
+        assert verify_password("password123", new_hash)
+    
+    @pytest.mark.asyncio
+    async def test_failed_login_does_not_rehash(self, async_session_local, stale_user):
+        """Test that only verified passwords are rehashed."""
+        with patch.object(auth_module, "schedule_rehash") as schedule_rehash:
+            async with async_session_local() as session:
+                assert await AuthService(session).authenticate_user("keeper", "wrong-password") is None
+                
+        schedule_rehash.assert_not_called()
+        assert (await stored_hash(async_session_local, stale_user)).startswith("$2b$04$")
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_password_change_wins(self, async_session_local, stale_user):
+        """Test that a hash changed since verification is not overwritten."""
+        old_hash = await stored_hash(async_session_local, stale_user)
+        async with async_session_local() as session:
+            (await session.get(User, stale_user)).password_hash = hash_password("password456")
+            await session.commit()
+            
+        assert not await auth_module.rehash_password(stale_user, old_hash, "password123")
+        assert verify_password("password456", await stored_hash(async_session_local, stale_user))
@@ -0,0 +1,120 @@
+"""
+Unit tests for database pool profiles and pool instrumentation.
+"""
+
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+from app.core import database
+from app.core.config import Settings
+from app.core.pool_monitor import PoolMonitor, monitored_pool_class
+
+
+class TestDatabaseProfiles:
+    """Test pool options of the database profiles."""
+    
+    def test_dev_profile_keeps_driver_defaults(self):
+        """Test that the dev profile only enables pre-ping."""
+        options = Settings(database_profile="dev").get_database_options()
+        
+        assert options["pool_pre_ping"] is True
+        assert options["pool_size"] is None and options["max_overflow"] is None
+    
+    def test_overrides_replace_profile_values(self):
+        """Test that DATABASE_* settings override single profile options."""
+        options = Settings(
+            database_profile="prod-postgres", database_pool_size=3, database_pool_pre_ping=True
+        ).get_database_options()
+        
+        assert options["pool_size"] == 3
+        assert options["pool_pre_ping"] is True
+        assert options["pool_recycle"] == 1800
+    
+    def test_unknown_profile_is_rejected(self):
+        """Test that only known profiles are accepted."""
+        with pytest.raises(ValueError):
+            Settings(database_profile="prod-mysql")
+    
+    def test_prod_sqlite_pools_aiosqlite_connections(self):
+        """Test that a sized profile replaces aiosqlite's per-checkout connections with a pool."""
+        with patch.object(database, "settings", Settings(database_profile="prod-sqlite")):
+            options = database.get_engine_options("sqlite+aiosqlite:///./game.db", PoolMonitor("test"), is_async=True)
+            
+        assert issubclass(options["poolclass"], AsyncAdaptedQueuePool)
+        assert options["pool_size"] == 8 and options["max_overflow"] == 0
+        assert options["pool_pre_ping"] is False
+    
+    def test_memory_database_is_not_sized(self):
+        """Test that the shared in-memory connection gets no pool size."""
+        with patch.object(database, "settings", Settings(database_profile="prod-sqlite")):
+            options = database.get_engine_options("sqlite+aiosqlite:///:memory:", PoolMonitor("test"), is_async=True)
+            
+        assert issubclass(options["poolclass"], StaticPool)
+        assert "pool_size" not in options
+    
+    def test_postgres_profile_sets_statement_cache(self):
+        """Test that the asyncpg statement cache size is passed to the driver."""
+        with patch.object(database, "settings", Settings(database_profile="prod-postgres")):
+            options = database.get_engine_options(
+                "postgresql+asyncpg://park:secret@db/park_tycoon", PoolMonitor("test"), is_async=True
+            )
+            
+        assert options["connect_args"]["prepared_statement_cache_size"] == 500
+        assert options["pool_recycle"] == 1800
+
+
+class TestPoolMonitor:
+    """Test checkout instrumentation."""
+    
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Create a file SQLite engine with one pooled and one overflow connection."""
+        monitor = PoolMonitor("test")
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=monitored_pool_class(QueuePool, monitor),
+            pool_size=1,
+            max_overflow=1,
+            pool_timeout=0.1,
+        )
+        yield engine, monitor
+        engine.dispose()
+    
+    def test_records_checkouts_and_overflow(self, engine):
+        """Test that checkouts beyond the pool size count as overflow."""
+        engine, monitor = engine
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            stats = monitor.get_stats()
+            assert stats["checked_out"] == 2
+            
+        stats = monitor.get_stats()
+        assert stats["pool"] == "QueuePool"
+        assert stats["checkouts"] == 2
+        assert stats["overflow_checkouts"] == 1
+        assert stats["overflow_peak"] == 1
+    
+    def test_records_timeouts(self, engine):
+        """Test that a checkout that times out is counted with its wait."""
+        engine, monitor = engine
+        with engine.connect(), engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+                
+        stats = monitor.get_stats()
+        assert stats["timeouts"] == 1
+        assert stats["wait_ms_max"] >= 100
+    
+    def test_recreated_pool_keeps_monitor(self, engine):
+        """Test that checkouts are still recorded after the engine is disposed."""
+        engine, monitor = engine
+        with engine.connect():
+            pass
+        engine.dispose()
+        with engine.connect():
+            pass
+            
+        assert monitor.get_stats()["checkouts"] == 2
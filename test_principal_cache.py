@@ -0,0 +1,201 @@
+"""
+Unit tests for the authenticated principal cache.
+"""
+
+import time
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.user import User
+from app.services.auth_service import AuthService
+from app.services.principal_cache import PrincipalCache
+from main import app
+
+
+@pytest.fixture
+def cache():
+    """Replace the shared principal cache with a fresh one."""
+    fresh = PrincipalCache(ttl=60, max_entries=100)
+    with patch("app.services.principal_cache.principal_cache", fresh), \
+            patch("app.services.auth_service.principal_cache", fresh):
+        yield fresh
+
+
+@pytest.fixture
+def session_local():
+    """Create a session factory bound to an in-memory database with one user."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    with TestingSessionLocal() as session:
+        session.add(User(id=1, username="keeper", password_hash="x", is_admin=False, is_active=True))
+        session.commit()
+        
+    return TestingSessionLocal
+
+
+def cached_user(cache, session_local, token="token"):
+    """Cache the seeded user under a token."""
+    with session_local() as session:
+        cache.put(token, session.get(User, 1))
+
+
+class TestPrincipalCache:
+    """Test lookups, expiry and eviction."""
+    
+    def test_hits_return_detached_copies(self, cache, session_local):
+        """Test that every hit gets its own detached user with the cached columns."""
+        cached_user(cache, session_local)
+        
+        first, second = cache.get("token"), cache.get("token")
+        
+        assert first is not second
+        assert (first.id, first.username, first.is_active) == (1, "keeper", True)
+        with session_local() as session:
+            assert session.merge(first).username == "keeper"
+        assert cache.get("other") is None
+        assert cache.get_stats()["hits"] == 2
+        assert cache.get_stats()["misses"] == 1
+    
+    def test_entries_never_outlive_the_token(self, cache, session_local):
+        """Test that expired tokens are not cached or served."""
+        with session_local() as session:
+            user = session.get(User, 1)
+            cache.put("expired", user, time.time() - 1)
+            cache.put("expiring", user, time.time() + 0.05)
+            
+        assert cache.get("expired") is None
+        assert cache.get("expiring") is not None
+        time.sleep(0.06)
+        assert cache.get("expiring") is None
+        assert cache.get_stats()["cached_tokens"] == 0
+    
+    def test_oldest_entries_are_evicted(self, session_local):
+        """Test that the cache holds at most max_entries tokens."""
+        cache = PrincipalCache(ttl=60, max_entries=2)
+        for token in ("a", "b", "c"):
+            cached_user(cache, session_local, token)
+            
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+        assert cache.get_stats()["cached_tokens"] == 2
+    
+    def test_zero_ttl_disables_the_cache(self, session_local):
+        """Test that a zero TTL caches nothing."""
+        cache = PrincipalCache(ttl=0, max_entries=100)
+        cached_user(cache, session_local)
+        
+        assert cache.get("token") is None
+
+
+class TestInvalidation:
+    """Test that committed user changes drop cached principals."""
+    
+    @pytest.mark.parametrize("field, value", [("is_admin", True), ("is_active", False), ("password_hash", "y")])
+    def test_principal_changes_invalidate(self, cache, session_local, field, value):
+        """Test that admin, activation and password changes invalidate on commit."""
+        cached_user(cache, session_local, "a")
+        cached_user(cache, session_local, "b")
+        
+        with session_local() as session:
+            setattr(session.get(User, 1), field, value)
+            session.flush()
+            assert cache.get("a") is not None
+            session.commit()
+            
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get_stats()["invalidations"] == 2
+    
+    def test_rolled_back_and_unrelated_changes_keep_entries(self, cache, session_local):
+        """Test that rollbacks and last_login updates leave the cache alone."""
+        cached_user(cache, session_local)
+        
+        with session_local() as session:
+            session.get(User, 1).is_admin = True
+            session.flush()
+            session.rollback()
+            session.get(User, 1).update_last_login()
+            session.commit()
+            
+        assert cache.get("token") is not None
+
+    def test_changed_generation_is_not_cached(self, cache, session_local):
+        """Test that a principal loaded before a committed change is refused."""
+        generation = cache.generation(1)
+        with session_local() as session:
+            stale = session.get(User, 1)
+            session.expunge(stale)
+            
+        with session_local() as session:
+            session.get(User, 1).is_active = False
+            session.commit()
+            
+        cache.put("token", stale, generation=generation)
+        assert cache.get("token") is None
+        
+        cache.put("token", stale, generation=cache.generation(1))
+        assert cache.get("token") is not None
+
+
+class TestAuthServiceCache:
+    """Test AuthService.verify_token with the cache."""
+    
+    @pytest.mark.asyncio
+    async def test_verified_tokens_skip_the_database(self, cache, auth_service):
+        """Test that a second verification is served without a user lookup."""
+        user = await auth_service.register_user("keeper", "password123")
+        token = auth_service.create_access_token(user)
+        assert (await auth_service.verify_token(token)).id == user.id
+        
+        with patch.object(AuthService, "get_user_by_id", side_effect=AssertionError("queried")):
+            assert (await auth_service.verify_token(token)).username == "keeper"
+    
+    @pytest.mark.asyncio
+    async def test_deactivation_and_password_change_invalidate(self, cache, auth_service):
+        """Test that deactivate_user and change_password drop cached tokens."""
+        user = await auth_service.register_user("keeper", "password123")
+        token = auth_service.create_access_token(user)
+        await auth_service.verify_token(token)
+        
+        assert await auth_service.change_password(user.id, "password123", "password456")
+        assert cache.get_stats()["cached_tokens"] == 0
+        await auth_service.verify_token(token)
+        
+        assert await auth_service.deactivate_user(user.id)
+        assert await auth_service.verify_token(token) is None
+
+    @pytest.mark.asyncio
+    async def test_user_changed_during_lookup_is_not_cached(self, cache, auth_service):
+        """Test that a change committed while the user loads keeps the stale row out of the cache."""
+        user = await auth_service.register_user("keeper", "password123")
+        token = auth_service.create_access_token(user)
+        get_user_by_id = auth_service.get_user_by_id
+        
+        async def change_while_loading(user_id):
+            loaded = await get_user_by_id(user_id)
+            cache.invalidate_user(user_id)
+            return loaded
+            
+        with patch.object(auth_service, "get_user_by_id", side_effect=change_while_loading):
+            assert await auth_service.verify_token(token) is not None
+            
+        assert cache.get(token) is None
+
+
+class TestPrincipalCacheStats:
+    """Test the principal cache statistics endpoint."""
+    
+    def test_stats_require_admin(self):
+        """Test that cache statistics are not served to anonymous clients."""
+        assert TestClient(app).get("/api/v1/auth/cache/stats").status_code in (401, 403)
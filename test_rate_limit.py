@@ -0,0 +1,121 @@
+"""
+Unit tests for login rate limiting.
+"""
+
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.core.middleware import get_current_admin_user
+from app.core.rate_limit import LoginLimiter, TokenBucketLimiter
+from app.models.user import User
+from main import app
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Patch the limiter's clock."""
+    fake = FakeClock()
+    with patch("app.core.rate_limit.time.monotonic", fake):
+        yield fake
+
+
+class TestTokenBucketLimiter:
+    """Test bucket refill, rejection and eviction."""
+    
+    def test_burst_then_refill(self, clock):
+        """Test that a burst is allowed and tokens come back at the configured rate."""
+        limiter = TokenBucketLimiter(burst=3, per_minute=6)
+        
+        assert [limiter.acquire("10.0.0.1") for _ in range(3)] == [0, 0, 0]
+        assert limiter.acquire("10.0.0.1") == pytest.approx(10.0)
+        assert limiter.acquire("10.0.0.2") == 0
+        
+        clock.now += 10
+        assert limiter.acquire("10.0.0.1") == 0
+        assert limiter.acquire("10.0.0.1") > 0
+        assert limiter.get_stats()["allowed"] == 5
+        assert limiter.get_stats()["rejected"] == 2
+    
+    def test_full_buckets_are_evicted(self, clock):
+        """Test that the periodic sweep drops only refilled buckets."""
+        limiter = TokenBucketLimiter(burst=2, per_minute=60, evict_interval=5)
+        limiter.acquire("idle")
+        clock.now += 4
+        for _ in range(2):
+            limiter.acquire("busy")
+        assert len(limiter) == 2
+        
+        clock.now += 1
+        limiter.acquire("new")
+        
+        assert len(limiter) == 2
+        assert limiter.get_stats()["evicted"] == 1
+    
+    def test_key_count_is_bounded(self, clock):
+        """Test that the oldest key is dropped beyond max_keys."""
+        limiter = TokenBucketLimiter(burst=1, per_minute=1, max_keys=2)
+        for key in ("a", "b", "c"):
+            limiter.acquire(key)
+            
+        assert len(limiter) == 2
+        assert limiter.acquire("c") > 0
+        assert limiter.acquire("a") == 0
+    
+    def test_zero_burst_disables(self, clock):
+        """Test that a zero burst allows everything and tracks nothing."""
+        limiter = TokenBucketLimiter(burst=0, per_minute=0)
+        
+        assert all(limiter.acquire("10.0.0.1") == 0 for _ in range(100))
+        assert len(limiter) == 0
+
+
+class TestLoginLimiter:
+    """Test the combined IP and username limits."""
+    
+    def test_limits_ip_and_username(self, clock):
+        """Test that either limit stops an attempt."""
+        limiter = LoginLimiter(ip_burst=3, ip_per_minute=1, username_burst=2, username_per_minute=1)
+        
+        assert limiter.check("10.0.0.1", "Keeper") == 0
+        assert limiter.check("10.0.0.2", " keeper ") == 0
+        assert limiter.check("10.0.0.3", "keeper") > 0
+        assert limiter.check("10.0.0.1", "ranger") == 0
+        assert limiter.check("10.0.0.1", "warden") == 0
+        assert limiter.check("10.0.0.1", "guide") > 0
+        
+        stats = limiter.get_stats()
+        assert stats["ip"]["rejected"] == 1
+        assert stats["username"]["rejected"] == 1
+
+
+class TestLoginEndpointLimit:
+    """Test that /auth/login rejects floods before hashing."""
+    
+    def test_flood_is_rejected_before_hashing(self):
+        """Test that attempts over the limit get 429 without verifying a password."""
+        with TestClient(app) as client, \
+                patch("app.api.auth.login_limiter", LoginLimiter(100, 1, 2, 1)):
+            client.post("/api/v1/auth/register", json={"username": "flooded", "password": "testpass123"})
+            for _ in range(2):
+                response = client.post("/api/v1/auth/login", json={"username": "flooded", "password": "wrongpass123"})
+                assert response.status_code == 401
+                
+            with patch("app.services.auth_service.verify_password_async", side_effect=AssertionError("hashed")):
+                response = client.post("/api/v1/auth/login", json={"username": "flooded", "password": "wrongpass123"})
+                
+            assert response.status_code == 429
+            assert int(response.headers["Retry-After"]) > 0
+            assert client.get("/api/v1/auth/login-limiter/stats").status_code in (401, 403)
+            with patch.dict(app.dependency_overrides, {get_current_admin_user: lambda: User(id=1, username="admin", password_hash="x", is_admin=True, is_active=True)}):
+                assert client.get("/api/v1/auth/login-limiter/stats").json()["ip"]["burst"] > 0
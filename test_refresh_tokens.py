@@ -0,0 +1,86 @@
+"""
+Unit tests for refresh token rotation.
+"""
+
+from datetime import datetime, timedelta
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+from sqlalchemy import select, update
+
+from app.core.security import hash_refresh_token
+from app.models.user import RefreshToken
+
+
+@pytest_asyncio.fixture
+async def user(auth_service):
+    """Register a user."""
+    return await auth_service.register_user("keeper", "password123")
+
+
+class TestRefreshTokens:
+    """Test issuing, rotating and revoking refresh tokens."""
+    
+    @pytest.mark.asyncio
+    async def test_only_the_digest_is_stored(self, auth_service, user):
+        """Test that refresh tokens are stored as HMAC digests."""
+        token = await auth_service.issue_refresh_token(user)
+        
+        stored = (await auth_service.db.execute(select(RefreshToken))).scalar_one()
+        assert stored.token_hash == hash_refresh_token(token)
+        assert token not in stored.token_hash
+        assert stored.expires_at > datetime.utcnow() + timedelta(days=29)
+    
+    @pytest.mark.asyncio
+    async def test_rotation_never_hashes_a_password(self, auth_service, user):
+        """Test that a refresh token is exchanged once for a token of the same family."""
+        token = await auth_service.issue_refresh_token(user)
+        
+        with patch("app.services.auth_service.verify_password_async", side_effect=AssertionError("hashed")):
+            rotated_user, new_token = await auth_service.rotate_refresh_token(token)
+            
+        assert rotated_user.id == user.id
+        assert new_token != token
+        families = (await auth_service.db.execute(select(RefreshToken.family_id))).scalars().all()
+        assert len(families) == 2 and len(set(families)) == 1
+    
+    @pytest.mark.asyncio
+    async def test_reuse_revokes_the_family(self, auth_service, user):
+        """Test that replaying a used token revokes every token of its login only."""
+        token = await auth_service.issue_refresh_token(user)
+        other_session = await auth_service.issue_refresh_token(user)
+        _, new_token = await auth_service.rotate_refresh_token(token)
+        
+        assert await auth_service.rotate_refresh_token(token) is None
+        assert await auth_service.rotate_refresh_token(new_token) is None
+        assert await auth_service.rotate_refresh_token(other_session) is not None
+    
+    @pytest.mark.asyncio
+    async def test_rejected_tokens(self, auth_service, user):
+        """Test unknown, expired and inactive-user tokens."""
+        expired = await auth_service.issue_refresh_token(user)
+        await auth_service.db.execute(
+            update(RefreshToken).values(expires_at=datetime.utcnow() - timedelta(seconds=1))
+        )
+        await auth_service.db.commit()
+        inactive = await auth_service.issue_refresh_token(user)
+        await auth_service.deactivate_user(user.id)
+        
+        assert await auth_service.rotate_refresh_token("") is None
+        assert await auth_service.rotate_refresh_token("unknown") is None
+        assert await auth_service.rotate_refresh_token(expired) is None
+        assert await auth_service.rotate_refresh_token(inactive) is None
+    
+    @pytest.mark.asyncio
+    async def test_password_change_and_logout_revoke(self, auth_service, user):
+        """Test that a password change ends every session and logout ends one."""
+        before_change = await auth_service.issue_refresh_token(user)
+        assert await auth_service.change_password(user.id, "password123", "password456")
+        assert await auth_service.rotate_refresh_token(before_change) is None
+        
+        first = await auth_service.issue_refresh_token(user)
+        second = await auth_service.issue_refresh_token(user)
+        assert await auth_service.revoke_refresh_token(first)
+        assert not await auth_service.revoke_refresh_token("unknown")
+        assert await auth_service.rotate_refresh_token(first) is None
+        assert await auth_service.rotate_refresh_token(second) is not None
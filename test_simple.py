@@ -54,6 +54,7 @@ def test_endpoints():
             print(f"✓ User logged in: {data['user']['username']}")
             print(f"✓ Token received: {data['access_token'][:20]}...")
             login_token = data["access_token"]
+            login_refresh_token = data["refresh_token"]
         else:
             print(f"✗ Login failed: {response.json()}")
             return
@@ -73,7 +74,7 @@ def test_endpoints():
         
         # Test token refresh
         print("\n--- Testing Token Refresh ---")
-        response = client.post("/api/v1/auth/refresh", headers=headers)
+        response = client.post("/api/v1/auth/refresh", json={"refresh_token": login_refresh_token})
         print(f"Token refresh: {response.status_code}")
         if response.status_code == 200:
             data = response.json()
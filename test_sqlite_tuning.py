@@ -0,0 +1,147 @@
+"""
+Unit tests for the SQLite pragmas and the single writer queue.
+"""
+
+import asyncio
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import DATABASE_PROFILES, Settings
+from app.core.sqlite import WriteQueue, get_sqlite_pragmas, set_sqlite_pragmas
+
+
+@pytest_asyncio.fixture
+async def tuned_engine(tmp_path):
+    """Create a pooled file SQLite engine with the prod-sqlite pragmas and a writer queue."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=4,
+        max_overflow=0,
+    )
+    set_sqlite_pragmas(engine.sync_engine, get_sqlite_pragmas(DATABASE_PROFILES["prod-sqlite"]))
+    queue = WriteQueue()
+    queue.attach(engine.sync_engine)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE scores (id INTEGER PRIMARY KEY, points INTEGER)"))
+        await conn.execute(text("INSERT INTO scores (id, points) VALUES (1, 0)"))
+        
+    yield engine, queue
+    await engine.dispose()
+
+
+class TestSQLitePragmas:
+    """Test the pragmas of the SQLite profile."""
+    
+    def test_unset_pragmas_are_skipped(self):
+        """Test that only pragmas with a value are applied."""
+        assert get_sqlite_pragmas(DATABASE_PROFILES["dev"]) == {}
+        assert get_sqlite_pragmas(DATABASE_PROFILES["prod-sqlite"])["journal_mode"] == "WAL"
+    
+    def test_pragma_keywords_are_validated(self):
+        """Test that pragma keywords cannot carry other SQL."""
+        with pytest.raises(ValueError):
+            Settings(database_sqlite_journal_mode="WAL; DROP TABLE users")
+    
+    @pytest.mark.asyncio
+    async def test_pragmas_are_set_on_connect(self, tuned_engine):
+        """Test that every new connection gets the profile's pragmas."""
+        engine, _ = tuned_engine
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1
+            assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 5000
+
+
+class TestWriteQueue:
+    """Test that writers take turns while readers do not wait."""
+    
+    @pytest.mark.asyncio
+    async def test_second_writer_waits_for_first(self, tuned_engine):
+        """Test that a writer waits in the queue until the earlier one is returned to the pool."""
+        engine, queue = tuned_engine
+        first = await engine.connect()
+        await first.execute(text("UPDATE scores SET points = points + 1"))
+        
+        async def second_writer():
+            async with engine.begin() as conn:
+                await conn.execute(text("UPDATE scores SET points = points * 10"))
+                
+        second = asyncio.create_task(second_writer())
+        await asyncio.sleep(0.05)
+        assert not second.done()
+        assert queue.get_stats()["waiting"] == 1
+        
+        # Readers are not queued
+        async with engine.connect() as reader:
+            assert (await reader.execute(text("SELECT points FROM scores"))).scalar() == 0
+            
+        await first.commit()
+        await first.close()
+        await asyncio.wait_for(second, timeout=5)
+        
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("SELECT points FROM scores"))).scalar() == 10
+        stats = queue.get_stats()
+        assert stats["transactions"] == 3
+        assert stats["wait_ms_max"] >= 50
+    
+    @pytest.mark.asyncio
+    async def test_rolled_back_writer_leaves_queue(self, tuned_engine):
+        """Test that a failed write transaction does not block later writers."""
+        engine, queue = tuned_engine
+        with pytest.raises(Exception):
+            async with engine.begin() as conn:
+                await conn.execute(text("UPDATE scores SET points = 5"))
+                await conn.execute(text("INSERT INTO scores (id, points) VALUES (1, 0)"))
+                
+        async with engine.begin() as conn:
+            await asyncio.wait_for(conn.execute(text("UPDATE scores SET points = 7")), timeout=5)
+        assert queue.get_stats()["waiting"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_invalidated_writer_leaves_queue(self, tuned_engine):
+        """Test that a writer whose connection is invalidated does not block later writers."""
+        engine, queue = tuned_engine
+        conn = await engine.connect()
+        await conn.execute(text("UPDATE scores SET points = 5"))
+        await conn.invalidate()
+        
+        async with engine.begin() as other:
+            await asyncio.wait_for(other.execute(text("UPDATE scores SET points = 7")), timeout=5)
+        await conn.close()
+        assert queue.get_stats()["waiting"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_detached_writer_leaves_queue(self, tuned_engine):
+        """Test that a writer whose connection is detached from the pool does not block later writers."""
+        engine, queue = tuned_engine
+        conn = await engine.connect()
+        await conn.execute(text("UPDATE scores SET points = 5"))
+        await conn.rollback()
+        conn.sync_connection.detach()
+        
+        async with engine.begin() as other:
+            await asyncio.wait_for(other.execute(text("UPDATE scores SET points = 7")), timeout=5)
+        
+        # The detached connection queues again for its next write and leaves when closed
+        await asyncio.wait_for(conn.execute(text("UPDATE scores SET points = 9")), timeout=5)
+        await conn.commit()
+        await conn.close()
+        
+        async with engine.begin() as other:
+            await asyncio.wait_for(other.execute(text("UPDATE scores SET points = 11")), timeout=5)
+        assert queue.get_stats()["waiting"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_disabled_queue_does_not_wait(self, tuned_engine):
+        """Test that writers are not queued when the queue is disabled."""
+        engine, queue = tuned_engine
+        queue.enabled = False
+        async with engine.begin() as conn:
+            await conn.execute(text("UPDATE scores SET points = 1"))
+            
+        assert queue.get_stats()["transactions"] == 1
@@ -0,0 +1,150 @@
+"""
+Unit tests for access token revocation.
+"""
+
+import time
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.middleware import get_current_admin_user
+from app.core.security import create_access_token, verify_token
+from app.models.user import RevokedToken, User
+from app.services import auth_service as auth_module
+from app.services.auth_service import AuthService
+from app.services.principal_cache import PrincipalCache
+from app.services.token_denylist import TokenDenylist, to_datetime
+from main import app
+
+pytestmark = pytest.mark.async_session_targets("app.services.token_denylist.AsyncSessionLocal")
+
+
+@pytest.fixture
+def denylist():
+    """Replace the shared denylist and principal cache with fresh ones."""
+    fresh = TokenDenylist()
+    cache = PrincipalCache(ttl=60, max_entries=100)
+    with patch("app.services.auth_service.token_denylist", fresh), \
+            patch("app.services.principal_cache.principal_cache", cache), \
+            patch("app.services.auth_service.principal_cache", cache), \
+            patch("app.services.token_denylist.principal_cache", cache):
+        yield fresh
+
+
+def datetime_in(seconds: float):
+    """Naive UTC datetime the given number of seconds from now."""
+    return to_datetime(time.time() + seconds)
+
+
+class TestTokenDenylist:
+    """Test the in-memory denylist."""
+    
+    def test_tokens_carry_unique_ids(self):
+        """Test that every access token gets its own jti."""
+        first = verify_token(create_access_token({"sub": "1"}))
+        second = verify_token(create_access_token({"sub": "1"}))
+        
+        assert first["jti"] and first["jti"] != second["jti"]
+    
+    def test_entries_expire_with_the_token(self):
+        """Test that revoked IDs are dropped once the token has expired."""
+        denylist = TokenDenylist()
+        denylist.add("live", time.time() + 60)
+        denylist.add("expiring", time.time() + 0.05)
+        denylist.add("expired", time.time() - 1)
+        
+        assert denylist.is_revoked("live")
+        assert denylist.is_revoked("expiring")
+        assert not denylist.is_revoked("expired")
+        assert not denylist.is_revoked(None)
+        
+        time.sleep(0.06)
+        assert not denylist.is_revoked("expiring")
+        assert denylist.purge() == 1
+        assert denylist.get_stats()["revoked_tokens"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_sync_mirrors_other_workers(self, async_session_local):
+        """Test that unexpired rows written by another worker are picked up once."""
+        async with async_session_local() as session:
+            session.add(RevokedToken(jti="other", expires_at=datetime_in(60)))
+            session.add(RevokedToken(jti="stale", expires_at=datetime_in(-60)))
+            await session.commit()
+            
+        denylist = TokenDenylist()
+        assert await denylist.load() == 1
+        assert denylist.is_revoked("other")
+        assert await denylist.sync() == 0
+        
+        async with async_session_local() as session:
+            assert (await session.execute(select(RevokedToken.jti))).scalars().all() == ["other"]
+
+
+class TestRevokeToken:
+    """Test AuthService.revoke_token."""
+    
+    @pytest.mark.asyncio
+    async def test_revoked_tokens_stop_verifying(self, denylist, async_session_local):
+        """Test that a revoked token is persisted and rejected, even when cached."""
+        async with async_session_local() as session:
+            auth_service = AuthService(session)
+            user = await auth_service.register_user("keeper", "password123")
+            token = auth_service.create_access_token(user)
+            other = auth_service.create_access_token(user)
+            assert await auth_service.verify_token(token) is not None
+            
+            assert await auth_service.revoke_token(token)
+            assert await auth_service.revoke_token(token)
+            
+            assert await auth_service.verify_token(token) is None
+            assert await auth_service.verify_token(other) is not None
+            rows = (await session.execute(select(RevokedToken.jti, RevokedToken.user_id))).all()
+            assert rows == [(verify_token(token)["jti"], user.id)]
+    
+    @pytest.mark.asyncio
+    async def test_token_revoked_during_lookup_is_not_cached(self, denylist, async_session_local):
+        """Test that a token revoked while its user loads is rejected and not cached."""
+        async with async_session_local() as session:
+            auth_service = AuthService(session)
+            user = await auth_service.register_user("keeper", "password123")
+            token = auth_service.create_access_token(user)
+            get_user_by_id = auth_service.get_user_by_id
+            
+            async def revoke_while_loading(user_id):
+                loaded = await get_user_by_id(user_id)
+                denylist.add(verify_token(token)["jti"], time.time() + 60)
+                return loaded
+                
+            with patch.object(auth_service, "get_user_by_id", side_effect=revoke_while_loading):
+                assert await auth_service.verify_token(token) is None
+                
+            assert auth_module.principal_cache.get(token) is None
+    
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_cannot_be_revoked(self, denylist, async_session_local):
+        """Test that malformed tokens and tokens without jti are refused."""
+        async with async_session_local() as session:
+            auth_service = AuthService(session)
+            
+            assert not await auth_service.revoke_token("not-a-token")
+            assert not await auth_service.revoke_token(create_access_token({"sub": "1", "jti": ""}))
+
+
+class TestLogout:
+    """Test that logout revokes the token."""
+    
+    def test_logged_out_token_is_rejected(self):
+        """Test that a token cannot be used after logout."""
+        with TestClient(app) as client:
+            client.post("/api/v1/auth/register", json={"username": "revokeduser", "password": "testpass123"})
+            token = client.post(
+                "/api/v1/auth/login", json={"username": "revokeduser", "password": "testpass123"}
+            ).json()["access_token"]
+            headers = {"Authorization": f"Bearer {token}"}
+            
+            assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+            assert client.post("/api/v1/auth/logout", headers=headers).status_code == 200
+            assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+            with patch.dict(app.dependency_overrides, {get_current_admin_user: lambda: User(id=1, username="admin", password_hash="x", is_admin=True, is_active=True)}):
+                assert client.get("/api/v1/auth/revocations/stats").json()["revoked_tokens"] >= 1
@@ -0,0 +1,169 @@
+"""
+Unit tests for the compiled translation catalog.
+"""
+
+import gc
+import os
+import weakref
+import pytest
+from unittest.mock import patch
+
+from app.services.i18n_service import I18nService
+from app.services.translation_catalog import (
+    CatalogFormatError, TranslationCatalog, write_catalog
+)
+
+CATALOG_ROWS = [
+    ("en", "ui", "ui.welcome", "Welcome"),
+    ("en", "ui", "ui.login", "Login"),
+    ("en", "module", "module.market", "Market"),
+    ("en", "error", "error.not_found", "Not found"),
+    ("zh", "ui", "ui.welcome", "欢迎"),
+    ("zh", "module", "module.market", "市场"),
+]
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    """Write a small catalog and return its path."""
+    path = str(tmp_path / "translations.catalog")
+    write_catalog(path, CATALOG_ROWS)
+    return path
+
+
+@pytest.fixture
+def catalog(catalog_path):
+    """Open the test catalog."""
+    catalog = TranslationCatalog(catalog_path)
+    yield catalog
+    catalog.close()
+
+
+@pytest.fixture
+def i18n_service(catalog_path):
+    """Create an I18n service backed by the test catalog."""
+    service = I18nService()
+    assert service.attach_catalog(catalog_path)
+    return service
+
+
+class TestTranslationCatalog:
+    """Test reading and writing catalog files."""
+    
+    def test_round_trip(self, catalog):
+        """Test that every row can be looked up after compilation."""
+        assert sorted(catalog.languages()) == ["en", "zh"]
+        assert catalog.count("en") == 4
+        for language_code, _, key, value in CATALOG_ROWS:
+            assert catalog.get(key, language_code) == value
+    
+    def test_missing_keys_and_languages(self, catalog):
+        """Test lookups that fall between, before and after stored keys."""
+        for key in ("a", "ui.logout", "zzz", ""):
+            assert catalog.get(key, "en") is None
+        assert catalog.get("ui.welcome", "fr") is None
+    
+    def test_categories(self, catalog):
+        """Test category listing and category lookups."""
+        assert catalog.categories("en") == ["error", "module", "ui"]
+        assert catalog.get_category("ui", "en") == {"ui.login": "Login", "ui.welcome": "Welcome"}
+        assert catalog.get_category("unknown", "en") == {}
+        assert list(catalog.items("zh")) == [("module", "module.market", "市场"), ("ui", "ui.welcome", "欢迎")]
+    
+    def test_rebuild_replaces_file_atomically(self, catalog_path, catalog):
+        """Test that an open catalog keeps its view when the file is rebuilt."""
+        write_catalog(catalog_path, [("en", "ui", "ui.welcome", "Hello")])
+        
+        assert catalog.get("ui.welcome", "en") == "Welcome"
+        assert TranslationCatalog(catalog_path).get("ui.welcome", "en") == "Hello"
+        assert not [name for name in os.listdir(os.path.dirname(catalog_path)) if name.startswith(".catalog-")]
+    
+    def test_invalid_file(self, tmp_path):
+        """Test that files without the catalog header are rejected."""
+        path = tmp_path / "bogus.catalog"
+        path.write_bytes(b"not a catalog at all")
+        
+        with pytest.raises(CatalogFormatError):
+            TranslationCatalog(str(path))
+
+
+class TestCatalogBackedService:
+    """Test I18nService lookups served from a catalog."""
+    
+    def test_lookups_do_not_touch_database(self, i18n_service):
+        """Test that catalog languages never query the database."""
+        with patch('app.services.i18n_service.SessionLocal') as mock_session_local:
+            assert i18n_service.get_translation("ui.welcome", "zh") == "欢迎"
+            assert i18n_service.get_translation("ui.login", "zh") == "Login"  # English fallback
+            assert i18n_service.get_translation("ui.unknown", "en") == "ui.unknown"
+            assert i18n_service.lookup("module.market", "en") == "Market"
+            mock_session_local.assert_not_called()
+    
+    def test_catalog_lookups_are_not_copied_into_snapshot(self, i18n_service):
+        """Test that single-key lookups read the shared mapping directly."""
+        i18n_service.lookup("ui.welcome", "en")
+        
+        assert i18n_service.get_cache_stats()["total_cached_translations"] == 0
+        assert i18n_service.get_cache_stats()["catalog_translations"] == 6
+    
+    def test_category_from_catalog(self, i18n_service):
+        """Test that category requests are indexed from the catalog."""
+        with patch('app.services.i18n_service.SessionLocal') as mock_session_local:
+            assert i18n_service.get_translations_by_category("module", "zh") == {"module.market": "市场"}
+            mock_session_local.assert_not_called()
+    
+    def test_preload_skips_catalog_languages(self, i18n_service):
+        """Test that preloading does not copy catalog languages into memory."""
+        with patch.object(i18n_service, '_load_all_translations_from_db') as mock_load:
+            i18n_service.preload_translations()
+            
+        assert sorted(call.args[0] for call in mock_load.call_args_list) == ["en-GB", "es", "fr", "zh-TW"]
+    
+    @pytest.mark.asyncio
+    async def test_async_lookups(self, i18n_service):
+        """Test the async API against the catalog."""
+        assert await i18n_service.get_translation_async("error.not_found", "en") == "Not found"
+        assert await i18n_service.get_translations(["ui.welcome", "ui.nope"], ["zh"]) == {
+            "zh": {"ui.welcome": "欢迎", "ui.nope": "ui.nope"}
+        }
+        assert await i18n_service.load_category("ui", "en") == 2
+    
+    @pytest.mark.asyncio
+    async def test_rebuilt_catalog_is_reopened(self, catalog_path, i18n_service):
+        """Test that a rebuilt catalog file is picked up with its cached categories republished."""
+        assert i18n_service.get_translations_by_category("ui", "en")["ui.welcome"] == "Welcome"
+        previous = i18n_service._catalog
+        
+        write_catalog(catalog_path, [("en", "ui", "ui.welcome", "Hello")])
+        await i18n_service._refresh_catalog()
+        
+        assert i18n_service._catalog is not previous
+        assert i18n_service.get_cached_category("ui", "en") == {"ui.welcome": "Hello"}
+        assert i18n_service.get_translation("ui.welcome", "en") == "Hello"
+        
+        # Lookups still holding the old catalog keep reading it until they drop it
+        assert previous.get("ui.welcome", "en") == "Welcome"
+        mapping = weakref.ref(previous._mm)
+        del previous
+        gc.collect()
+        assert mapping() is None
+    
+    def test_detach_during_lookup(self, i18n_service):
+        """Test that a lookup racing a detach finishes on the catalog it started with."""
+        catalog = i18n_service._catalog
+        original_get = catalog.get
+        
+        def get_while_detaching(key, language_code):
+            i18n_service.detach_catalog()
+            return original_get(key, language_code)
+            
+        with patch.object(catalog, "get", get_while_detaching):
+            assert i18n_service._get_from_cache("ui.welcome", "en") == "Welcome"
+        assert i18n_service._catalog is None
+    
+    def test_attach_missing_catalog(self, tmp_path):
+        """Test that a missing catalog file is reported, not raised."""
+        service = I18nService()
+        
+        assert not service.attach_catalog(str(tmp_path / "missing.catalog"))
+        assert service.get_cache_stats()["catalog_languages"] == 0
@@ -0,0 +1,200 @@
+"""
+Unit tests for the streaming translation import.
+"""
+
+import io
+import json
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.translation import Translation, TranslationTombstone, TranslationVersion
+from app.services.translation_import import (
+    TranslationImportError, detect_format, import_translations, parse_csv, parse_jsonl, parse_po
+)
+
+PO_FILE = '''# Spanish translations
+msgid ""
+msgstr ""
+"Language: es\\n"
+"Plural-Forms: nplurals=2; plural=(n != 1);\\n"
+
+#: routes.py:33
+#, python-format
+msgid "ui.welcome"
+msgstr "¡Bienvenido, %(username)s!"
+
+msgid "ui.multiline"
+msgstr ""
+"Line one\\n"
+"Line \\"two\\""
+
+#, fuzzy
+msgid "ui.fuzzy"
+msgstr "Borrador"
+
+msgid "ui.untranslated"
+msgstr ""
+
+msgid "ui.item"
+msgid_plural "ui.items"
+msgstr[0] "objeto"
+msgstr[1] "objetos"
+'''
+
+
+@pytest.fixture
+def session_local():
+    """Create a session factory bound to an in-memory database."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    with TestingSessionLocal() as session:
+        session.add(Translation(key="module.market", language_code="en", value="Market", category="module"))
+        session.commit()
+        
+    with patch('app.services.translation_import.SessionLocal', TestingSessionLocal):
+        yield TestingSessionLocal
+
+
+def stored(session_local):
+    """Return every stored translation as (language, category, key, value)."""
+    with session_local() as session:
+        return sorted(session.execute(
+            select(Translation.language_code, Translation.category, Translation.key, Translation.value)
+        ).all())
+
+
+def invalidated(session_local):
+    """Return the scopes stamped after the seed row."""
+    with session_local() as session:
+        return sorted(session.execute(
+            select(TranslationVersion.language_code, TranslationVersion.category).where(TranslationVersion.version > 1)
+        ).all())
+
+
+class TestParsers:
+    """Test parsing of the supported file formats."""
+    
+    def test_jsonl(self):
+        """Test JSON Lines records with and without explicit fields."""
+        lines = [
+            json.dumps({"key": "ui.welcome", "language_code": "en", "value": "Welcome"}),
+            "",
+            json.dumps({"key": "farm.cow", "value": "Vache", "category": "livestock"}),
+        ]
+        
+        assert list(parse_jsonl(lines, "fr")) == [
+            ("en", "ui", "ui.welcome", "Welcome"),
+            ("fr", "livestock", "farm.cow", "Vache"),
+        ]
+    
+    def test_csv(self):
+        """Test CSV rows with quoted values."""
+        lines = io.StringIO('key,language_code,value\nui.login,en,Login\nui.hello,zh,"你好, 世界"\n', newline="")
+        
+        assert list(parse_csv(lines)) == [("en", "ui", "ui.login", "Login"), ("zh", "ui", "ui.hello", "你好, 世界")]
+    
+    def test_po(self):
+        """Test that only reviewed singular translations are imported."""
+        rows = list(parse_po(io.StringIO(PO_FILE)))
+        
+        assert rows == [
+            ("es", "ui", "ui.welcome", "¡Bienvenido, %(username)s!"),
+            ("es", "ui", "ui.multiline", 'Line one\nLine "two"'),
+        ]
+    
+    def test_errors_name_the_line(self):
+        """Test that malformed rows are reported with their line number."""
+        with pytest.raises(TranslationImportError, match="Line 2: missing language_code"):
+            list(parse_jsonl(['{"key": "a.b", "language_code": "en", "value": "x"}', '{"key": "a.c", "value": "y"}']))
+        with pytest.raises(TranslationImportError, match="Line 1: invalid JSON"):
+            list(parse_jsonl(["{not json"], "en"))
+        with pytest.raises(TranslationImportError, match="header"):
+            list(parse_csv(io.StringIO("name,text\n")))
+        with pytest.raises(TranslationImportError, match="Line 1: key is longer"):
+            list(parse_jsonl([json.dumps({"key": "k" * 256, "value": "x"})], "en"))
+    
+    def test_detect_format(self):
+        """Test format detection from file names."""
+        assert detect_format("catalog.JSONL") == "jsonl"
+        assert detect_format("messages.po") == "po"
+        assert detect_format("export.csv") == "csv"
+        assert detect_format("notes.txt") is None
+
+
+class TestImport:
+    """Test chunked upserts into the translations table."""
+    
+    def test_upserts_in_chunks(self, session_local):
+        """Test that rows are inserted or updated in chunk-sized statements."""
+        rows = [
+            ("en", "module", "module.market", "Marketplace"),
+            ("en", "ui", "ui.welcome", "Welcome"),
+            ("zh", "ui", "ui.welcome", "欢迎"),
+            ("en", "ui", "ui.welcome", "Welcome!"),  # later duplicate wins
+            ("en", "ui", "ui.login", "Login"),
+        ]
+        
+        stats = import_translations(rows, chunk_size=2)
+        
+        assert stats["rows"] == 5  # duplicates are only collapsed within a chunk
+        assert stats["chunks"] == 3
+        assert stats["languages"] == ["en", "zh"]
+        assert stored(session_local) == [
+            ("en", "module", "module.market", "Marketplace"),
+            ("en", "ui", "ui.login", "Login"),
+            ("en", "ui", "ui.welcome", "Welcome!"),
+            ("zh", "ui", "ui.welcome", "欢迎"),
+        ]
+    
+    def test_one_version_bump_per_scope(self, session_local):
+        """Test that each changed scope is invalidated once, after the import."""
+        rows = [("en", "ui", f"ui.key_{i}", str(i)) for i in range(10)] + [("zh", "ui", "ui.welcome", "欢迎")]
+        
+        stats = import_translations(rows, chunk_size=3)
+        
+        assert stats["scopes"] == 2
+        assert invalidated(session_local) == [("en", "ui"), ("zh", "ui")]
+    
+    def test_category_move_invalidates_old_category(self, session_local):
+        """Test that a key moving between categories reloads both of them."""
+        import_translations([("en", "shop", "module.market", "Market")])
+        
+        assert invalidated(session_local) == [("en", "module"), ("en", "shop")]
+    
+    def test_failed_import_still_invalidates_committed_chunks(self, session_local):
+        """Test that chunks committed before a malformed row stay and are announced."""
+        lines = [json.dumps({"key": f"ui.key_{i}", "value": str(i)}) for i in range(3)] + ["{broken"]
+        
+        with pytest.raises(TranslationImportError):
+            import_translations(parse_jsonl(lines, "en"), chunk_size=2)
+            
+        assert len(stored(session_local)) == 3
+        assert invalidated(session_local) == [("en", "ui")]
+    
+    def test_reimported_keys_drop_their_tombstone(self, session_local):
+        """Test that importing a deleted key stops it from being synced as deleted."""
+        with session_local() as session:
+            session.delete(session.execute(select(Translation)).scalar_one())
+            session.commit()
+            
+        import_translations([("en", "module", "module.market", "Market")])
+        
+        with session_local() as session:
+            assert session.execute(select(TranslationTombstone)).first() is None
+    
+    def test_import_po_file(self, session_local):
+        """Test an end-to-end .po import."""
+        stats = import_translations(parse_po(io.StringIO(PO_FILE)))
+        
+        assert stats["rows"] == 2
+        assert ("es", "ui", "ui.welcome", "¡Bienvenido, %(username)s!") in stored(session_local)
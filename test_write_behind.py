@@ -0,0 +1,135 @@
+"""
+Unit tests for the timestamp write-behind buffer.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from sqlalchemy import create_engine, select
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.security import hash_password
+from app.models.player import Player
+from app.models.user import User
+from app.services.auth_service import AuthService
+from app.services.write_behind import TimestampWriteBehind
+
+
+pytestmark = pytest.mark.async_session_targets("app.services.write_behind.AsyncSessionLocal")
+
+
+async def create_users(session_local, count: int):
+    """Create users and return their IDs."""
+    async with session_local() as session:
+        users = [
+            User(username=f"player{i}", password_hash="x")
+            for i in range(count)
+        ]
+        session.add_all(users)
+        await session.commit()
+        return [user.id for user in users]
+
+
+class TestTimestampWriteBehind:
+    """Test buffering and batched writes."""
+    
+    def test_touch_keeps_latest_timestamp_per_row(self):
+        """Test that repeated touches of a row coalesce into the newest one."""
+        writer = TimestampWriteBehind()
+        now = datetime(2024, 1, 1, 12, 0)
+        
+        writer.touch(User.last_login, 1, now)
+        writer.touch(User.last_login, 1, now + timedelta(seconds=5))
+        writer.touch(User.last_login, 1, now - timedelta(seconds=5))
+        writer.touch(User.last_login, 2, now)
+        
+        assert writer.pending_count() == 2
+        assert writer._pending[User.__table__.c.last_login][1] == now + timedelta(seconds=5)
+        assert writer.get_stats()["coalesced_updates"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_flush_writes_all_rows_in_one_batch(self, async_session_local):
+        """Test that a flush writes every buffered row with one executemany per column."""
+        user_ids = await create_users(async_session_local, 3)
+        async with async_session_local() as session:
+            player = Player(
+                user_id=user_ids[0], first_name="Ada", last_name="Park", birth_month=1,
+                family_background="farm", childhood_experience="zoo",
+                education_background="school", starting_city="Springfield"
+            )
+            session.add(player)
+            await session.commit()
+            player_id = player.id
+            
+        writer = TimestampWriteBehind()
+        now = datetime(2024, 1, 1, 12, 0)
+        for user_id in user_ids:
+            writer.touch(User.last_login, user_id, now)
+        writer.touch(Player.last_played, player_id, now)
+        
+        with patch.object(writer, "_statement", wraps=writer._statement) as statement:
+            assert await writer.flush() == 4
+        assert statement.call_count == 2
+        assert writer.pending_count() == 0
+        
+        async with async_session_local() as session:
+            logins = (await session.execute(select(User.last_login))).scalars().all()
+            played = await session.scalar(select(Player.last_played))
+        assert logins == [now, now, now]
+        assert played == now
+        assert writer.get_stats()["rows_written"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_timestamps(self, async_session_local):
+        """Test that timestamps are put back when the write fails."""
+        writer = TimestampWriteBehind()
+        now = datetime(2024, 1, 1, 12, 0)
+        writer.touch(User.last_login, 1, now)
+        
+        with patch.object(writer, "_statement", side_effect=RuntimeError("database is locked")):
+            with pytest.raises(RuntimeError):
+                await writer.flush()
+                
+        assert writer.pending_count() == 1
+        assert writer._pending[User.__table__.c.last_login][1] == now
+    
+    def test_flush_sync(self):
+        """Test that a blocking flush writes through a synchronous engine."""
+        engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(User.__table__.insert(), [{"id": 1, "username": "flask", "password_hash": "x"}])
+            
+        writer = TimestampWriteBehind()
+        now = datetime(2024, 1, 1, 12, 0)
+        writer.touch(User.last_login, 1, now)
+        
+        assert writer.flush_sync(engine) == 1
+        assert writer.pending_count() == 0
+        with engine.connect() as connection:
+            assert connection.scalar(select(User.last_login)) == now
+        engine.dispose()
+    
+    @pytest.mark.asyncio
+    async def test_login_buffers_last_login(self, async_session_local):
+        """Test that logging in buffers last_login instead of writing it."""
+        async with async_session_local() as session:
+            user = User(username="buffered", password_hash=hash_password("password123"))
+            session.add(user)
+            await session.commit()
+            user_id = user.id
+            
+        writer = TimestampWriteBehind()
+        with patch("app.services.auth_service.timestamp_writer", writer):
+            async with async_session_local() as session:
+                authenticated = await AuthService(session).authenticate_user("buffered", "password123")
+                assert authenticated.last_login is not None
+                await session.commit()
+                
+        async with async_session_local() as session:
+            assert await session.scalar(select(User.last_login).where(User.id == user_id)) is None
+            
+        await writer.flush()
+        async with async_session_local() as session:
+            assert await session.scalar(select(User.last_login).where(User.id == user_id)) == authenticated.last_login
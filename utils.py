@@ -1,7 +1,14 @@
+import atexit
+import logging
+import threading
 from flask import session, redirect, url_for, flash
 from flask_babel import gettext as _
 from functools import wraps
 from models import User
+from app.services.write_behind import TimestampWriteBehind
+
+# Buffered last_login timestamps of the Flask app, written by start_timestamp_flusher
+timestamp_writer = TimestampWriteBehind()
 
 def login_required(f):
     @wraps(f)
@@ -28,6 +35,26 @@ def get_current_user():
         return User.query.get(session['user_id'])
     return None
 
+def start_timestamp_flusher(app, db, interval=5.0):
+    """Flush buffered timestamps from a daemon thread every interval seconds and at exit"""
+    logger = logging.getLogger(__name__)
+    
+    def flush():
+        with app.app_context():
+            try:
+                timestamp_writer.flush_sync(db.engine)
+            except Exception as e:
+                logger.error(f"Error writing buffered timestamps: {e}")
+                
+    def run():
+        while not stopped.wait(interval):
+            flush()
+            
+    stopped = threading.Event()
+    threading.Thread(target=run, name="timestamp-flusher", daemon=True).start()
+    atexit.register(flush)
+    return stopped
+
 def init_database(app, db):
     """Initialize database and create default data"""
     with app.app_context():